@@ -12,6 +12,7 @@ from janus_core.helpers.janus_types import (
     PathLike,
 )
 from janus_core.helpers.log import config_logger, config_tracker
+from janus_core.helpers.parallel import CalculatorPool
 from janus_core.helpers.utils import FileNameMixin, input_structs, none_to_dict
 
 
@@ -148,6 +149,10 @@ class BaseCalculation(FileNameMixin):
         if not self.model_path and "model_path" in self.calc_kwargs:
             raise ValueError("`model_path` must be passed explicitly")
 
+        # Calculators already attached cannot be recreated by worker processes
+        images = [struct] if isinstance(struct, Atoms) else list(struct or ())
+        attached_calcs = [image.calc for image in images]
+
         # Read structures and/or attach calculators
         # Note: logger not set up so yet so not passed here
         self.struct = input_structs(
@@ -161,6 +166,10 @@ class BaseCalculation(FileNameMixin):
             calc_kwargs=self.calc_kwargs,
             set_calc=set_calc,
         )
+        self.calc_from_args = not any(
+            image.calc is not None and image.calc is calc
+            for image, calc in zip(images, attached_calcs)
+        )
 
         FileNameMixin.__init__(
             self,
@@ -188,3 +197,38 @@ class BaseCalculation(FileNameMixin):
         self.tracker = config_tracker(
             self.logger, self.track_carbon, **self.tracker_kwargs
         )
+
+    def _check_workers(self) -> None:
+        """
+        Check calculators can be set up by worker processes, if `n_workers` > 1.
+
+        Raises
+        ------
+        ValueError
+            If multiple workers are requested for calculators attached to `struct`.
+        """
+        if self.n_workers > 1 and not self.calc_from_args:
+            raise ValueError(
+                "Calculators attached to `struct` cannot be used with `n_workers` > 1, "
+                "as workers set up calculators from `arch`, `model_path` and "
+                "`calc_kwargs`. Use `set_calc=True` to set calculators from these."
+            )
+
+    def _calculator_pool(self) -> CalculatorPool:
+        """
+        Start `n_workers` worker processes with calculators set up as for `struct`.
+
+        Returns
+        -------
+        CalculatorPool
+            Pool of worker processes.
+        """
+        self._check_workers()
+        return CalculatorPool(
+            arch=self.arch,
+            device=self.device,
+            model_path=self.model_path,
+            calc_kwargs=self.calc_kwargs,
+            n_workers=self.n_workers,
+            threads_per_worker=self.threads_per_worker,
+        )
@@ -1,12 +1,15 @@
 """Equation of State."""
 
+from collections.abc import Sequence
+from contextlib import nullcontext
 from copy import copy
+from pathlib import Path
 from typing import Any, Optional
 
 from ase import Atoms
 from ase.eos import EquationOfState
 from ase.units import kJ
-from numpy import cbrt, empty, linspace
+from numpy import argsort, cbrt, empty, linspace
 
 from janus_core.calculations.base import BaseCalculation
 from janus_core.calculations.geom_opt import GeomOpt
@@ -19,6 +22,9 @@ from janus_core.helpers.janus_types import (
     OutputKwargs,
     PathLike,
 )
+from janus_core.helpers.mlip_calculators import batch_calculate, supports_batching
+from janus_core.helpers.parallel import CalculatorPool
+from janus_core.helpers.result_cache import ResultCache
 from janus_core.helpers.utils import none_to_dict, output_structs
 
 
@@ -83,6 +89,26 @@ class EoS(BaseCalculation):
     file_prefix : Optional[PathLike]
         Prefix for output filenames. Default is inferred from structure name, or
         chemical formula of the structure.
+    result_cache : Optional[ResultCache]
+        Cache to reuse previously calculated energies from, and store new energies in,
+        if structures are not minimized. Default is None.
+    batch_size : Optional[int]
+        Maximum number of generated structures to evaluate in each forward pass of the
+        model, if supported by the calculator and structures are not minimized.
+        Default is None, which evaluates structures individually.
+    n_workers : int
+        Number of worker processes to evaluate or minimize generated structures with.
+        Each worker loads a calculator configured by `arch`, `device`, `model_path`
+        and `calc_kwargs`. Default is 1, which evaluates structures in the current
+        process.
+    threads_per_worker : Optional[int]
+        Number of PyTorch intra-op threads for each worker process. Default is the
+        number of CPUs divided by `n_workers`.
+    warm_start : bool
+        Whether to start the minimization of each generated structure from the
+        minimized neighbouring structure closer to the initial volume, rather than
+        the scaled initial structure. Only used if `minimize_all` is True, and cannot
+        be combined with `n_workers` > 1. Default is False.
 
     Attributes
     ----------
@@ -129,6 +155,11 @@ class EoS(BaseCalculation):
         plot_to_file: bool = False,
         plot_kwargs: Optional[dict[str, Any]] = None,
         file_prefix: Optional[PathLike] = None,
+        result_cache: Optional[ResultCache] = None,
+        batch_size: Optional[int] = None,
+        n_workers: int = 1,
+        threads_per_worker: Optional[int] = None,
+        warm_start: bool = False,
     ) -> None:
         """
         Initialise class.
@@ -192,6 +223,26 @@ class EoS(BaseCalculation):
         file_prefix : Optional[PathLike]
             Prefix for output filenames. Default is inferred from structure name, or
             chemical formula of the structure.
+        result_cache : Optional[ResultCache]
+            Cache to reuse previously calculated energies from, and store new energies
+            in, if structures are not minimized. Default is None.
+        batch_size : Optional[int]
+            Maximum number of generated structures to evaluate in each forward pass of
+            the model, if supported by the calculator and structures are not
+            minimized. Default is None, which evaluates structures individually.
+        n_workers : int
+            Number of worker processes to evaluate or minimize generated structures
+            with. Each worker loads a calculator configured by `arch`, `device`,
+            `model_path` and `calc_kwargs`. Default is 1, which evaluates structures
+            in the current process.
+        threads_per_worker : Optional[int]
+            Number of PyTorch intra-op threads for each worker process. Default is the
+            number of CPUs divided by `n_workers`.
+        warm_start : bool
+            Whether to start the minimization of each generated structure from the
+            minimized neighbouring structure closer to the initial volume, rather than
+            the scaled initial structure. Only used if `minimize_all` is True, and
+            cannot be combined with `n_workers` > 1. Default is False.
         """
         (read_kwargs, minimize_kwargs, write_kwargs, plot_kwargs) = none_to_dict(
             (read_kwargs, minimize_kwargs, write_kwargs, plot_kwargs)
@@ -209,6 +260,11 @@ class EoS(BaseCalculation):
         self.write_kwargs = write_kwargs
         self.plot_to_file = plot_to_file
         self.plot_kwargs = plot_kwargs
+        self.result_cache = result_cache
+        self.batch_size = batch_size
+        self.n_workers = n_workers
+        self.threads_per_worker = threads_per_worker
+        self.warm_start = warm_start
 
         if (
             (self.minimize or self.minimize_all)
@@ -221,6 +277,16 @@ class EoS(BaseCalculation):
                 "`minimize_kwargs`"
             )
 
+        if self.batch_size is not None and self.batch_size < 1:
+            raise ValueError("`batch_size` must be at least 1")
+        if self.n_workers < 1:
+            raise ValueError("`n_workers` must be at least 1")
+        if self.warm_start and self.n_workers > 1:
+            raise ValueError(
+                "`warm_start` minimizes structures in sequence, so cannot be used "
+                "with `n_workers` > 1"
+            )
+
         # Ensure lattice constants span correct range
         if self.n_volumes <= 1:
             raise ValueError("`n_volumes` must be greater than 1.")
@@ -253,6 +319,7 @@ class EoS(BaseCalculation):
 
         if not self.struct.calc:
             raise ValueError("Please attach a calculator to `struct`.")
+        self._check_workers()
 
         if self.minimize and self.logger:
             self.minimize_kwargs["log_kwargs"] = {
@@ -362,18 +429,26 @@ class EoS(BaseCalculation):
         self.lattice_scalars = cbrt(
             linspace(self.min_volume, self.max_volume, self.n_volumes)
         )
+        structs = []
         for lattice_scalar in self.lattice_scalars:
             c_struct = self.struct.copy()
             c_struct.calc = copy(self.struct.calc)
             c_struct.set_cell(cell * lattice_scalar, scale_atoms=True)
+            structs.append(c_struct)
+
+        if self.n_workers > 1:
+            pool_context = self._calculator_pool()
+        else:
+            pool_context = nullcontext()
 
-            # Minimize new structure
+        with pool_context as pool:
+            # Minimize new structures
             if self.minimize_all:
-                if self.logger:
-                    self.logger.info("Minimising lattice scalar = %s", lattice_scalar)
-                optimizer = GeomOpt(c_struct, **self.minimize_kwargs)
-                optimizer.run()
+                self._minimize_structs(structs, pool)
+            else:
+                self._calc_energies(structs, pool)
 
+        for c_struct in structs:
             self.volumes.append(c_struct.get_volume())
             self.energies.append(c_struct.get_potential_energy())
 
@@ -393,3 +468,118 @@ class EoS(BaseCalculation):
         if self.tracker:
             emissions = self.tracker.stop_task().emissions
             self.struct.info["emissions"] = emissions
+
+    def _calc_energies(
+        self, structs: Sequence[Atoms], pool: Optional[CalculatorPool] = None
+    ) -> None:
+        """
+        Calculate energies of generated structures, storing results on calculators.
+
+        Parameters
+        ----------
+        structs : Sequence[Atoms]
+            Generated structures, each with a separate calculator.
+        pool : Optional[CalculatorPool]
+            Pool of worker processes to evaluate structures. Default is None.
+        """
+        if self.result_cache:
+            missing = [
+                struct
+                for struct in structs
+                if not self.result_cache.restore(struct, ("energy",))
+            ]
+        else:
+            missing = structs
+
+        results = None
+        if pool and missing:
+            results = pool.calculate(missing, ("energy",), batch_size=self.batch_size)
+        elif self.batch_size and missing and supports_batching(self.struct.calc):
+            results = batch_calculate(
+                self.struct.calc, missing, batch_size=self.batch_size
+            )
+        if results:
+            for struct, result in zip(missing, results):
+                struct.calc.results = result
+                struct.calc.atoms = struct.copy()
+
+        for struct in missing:
+            struct.get_potential_energy()
+            if self.result_cache:
+                self.result_cache.add(struct, struct.calc.results)
+
+    def _worker_minimize_kwargs(self, structs: Sequence[Atoms]) -> list[dict[str, Any]]:
+        """
+        Get keyword arguments to minimize each generated structure in a worker.
+
+        Workers cannot share a log file, so each structure is logged to a separate
+        file, suffixed with the index of its volume.
+
+        Parameters
+        ----------
+        structs : Sequence[Atoms]
+            Generated structures.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Keyword arguments to pass to GeomOpt for each structure.
+        """
+        if "log_kwargs" not in self.minimize_kwargs:
+            return [self.minimize_kwargs] * len(structs)
+
+        log_kwargs = self.minimize_kwargs["log_kwargs"]
+        filename = Path(log_kwargs["filename"])
+        return [
+            self.minimize_kwargs
+            | {
+                "log_kwargs": log_kwargs
+                | {"filename": filename.with_stem(f"{filename.stem}-{i}")}
+            }
+            for i in range(len(structs))
+        ]
+
+    def _minimize_structs(
+        self, structs: Sequence[Atoms], pool: Optional[CalculatorPool] = None
+    ) -> None:
+        """
+        Optimize geometry of generated structures at constant volume.
+
+        Parameters
+        ----------
+        structs : Sequence[Atoms]
+            Generated structures, each with a separate calculator.
+        pool : Optional[CalculatorPool]
+            Pool of worker processes to minimize structures. Default is None.
+        """
+        if pool:
+            if self.logger:
+                self.logger.info("Minimising %s lattice scalars", len(structs))
+            optimized = pool.optimize(structs, self._worker_minimize_kwargs(structs))
+            for struct, (opt_struct, results) in zip(structs, optimized):
+                struct.set_cell(opt_struct.cell)
+                struct.positions = opt_struct.positions
+                struct.calc.results = results
+                struct.calc.atoms = struct.copy()
+            return
+
+        # Minimize structures closest to the initial volume first when warm starting
+        scalars = self.lattice_scalars
+        order = argsort(abs(scalars - 1)) if self.warm_start else range(len(structs))
+        minimized = set()
+
+        for i in order:
+            neighbours = [j for j in (i - 1, i + 1) if j in minimized]
+            if neighbours:
+                # Scale the minimized neighbouring structure to the new volume
+                j = neighbours[0]
+                structs[i].set_cell(structs[j].cell * scalars[i] / scalars[j])
+                structs[i].set_scaled_positions(structs[j].get_scaled_positions())
+
+            if self.logger:
+                self.logger.info("Minimising lattice scalar = %s", scalars[i])
+            optimizer = GeomOpt(structs[i], **self.minimize_kwargs)
+            optimizer.run()
+
+            if self.warm_start:
+                minimized.add(i)
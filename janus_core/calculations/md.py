@@ -1,9 +1,10 @@
 """Run molecular dynamics simulations."""
 
+from collections.abc import Iterable, Sequence
+from contextlib import ExitStack
 import datetime
-from functools import partial
 from itertools import combinations_with_replacement
-from math import isclose
+from math import gcd, isclose
 from os.path import getmtime
 from pathlib import Path
 import random
@@ -11,8 +12,8 @@ from typing import Any, Optional, Union
 from warnings import warn
 
 from ase import Atoms, units
-from ase.geometry.analysis import Analysis
-from ase.io import read
+from ase.calculators.singlepoint import SinglePointCalculator
+from ase.io import iread, read
 from ase.md.langevin import Langevin
 from ase.md.npt import NPT as ASE_NPT
 from ase.md.velocitydistribution import (
@@ -26,6 +27,7 @@ import yaml
 
 from janus_core.calculations.base import BaseCalculation
 from janus_core.calculations.geom_opt import GeomOpt
+from janus_core.helpers.async_writer import BackgroundWriter
 from janus_core.helpers.correlator import Correlation
 from janus_core.helpers.janus_types import (
     CorrelationKwargs,
@@ -33,16 +35,29 @@ from janus_core.helpers.janus_types import (
     OutputKwargs,
     PathLike,
     PostProcessKwargs,
+    TrajFormats,
+)
+from janus_core.helpers.observables import ThermoSnapshot
+from janus_core.helpers.post_process import (
+    RDFAccumulator,
+    compute_msd,
+    compute_rdf,
+    compute_vaf,
+    stream_vaf,
+)
+from janus_core.helpers.trajectory import (
+    HDF5Trajectory,
+    HDF5TrajectoryWriter,
+    is_hdf5,
 )
-from janus_core.helpers.post_process import compute_rdf, compute_vaf
 from janus_core.helpers.utils import (
     Architectures,
     ASEReadArgs,
+    BufferedTableWriter,
     Devices,
     input_structs,
     none_to_dict,
     output_structs,
-    write_table,
 )
 
 DENS_FACT = (units.m / 1.0e2) ** 3 / units.mol
@@ -128,6 +143,17 @@ class MolecularDynamics(BaseCalculation):
         File to save thermodynamical statistics. Default inferred from `file_prefix`.
     stats_every : int
         Frequency to output statistics. Default is 100.
+    stats_buffer_rows : int
+        Maximum number of rows of statistics to buffer before writing them to
+        `stats_file`. Buffered statistics are always written before restart files.
+        Default is 100.
+    stats_buffer_time : float
+        Maximum time, in seconds, to buffer statistics before writing them to
+        `stats_file`. Default is 10.0.
+    write_queue_size : int
+        Maximum number of structures waiting to be written to trajectory, restart and
+        final files by a background thread. Dynamics pause while the queue is full.
+        Default is 8.
     traj_file : Optional[PathLike]
         Trajectory file to save. Default inferred from `file_prefix`.
     traj_append : bool
@@ -136,6 +162,12 @@ class MolecularDynamics(BaseCalculation):
         Step to start saving trajectory. Default is 0.
     traj_every : int
         Frequency of steps to save trajectory. Default is 100.
+    traj_format : Optional[TrajFormats]
+        Format to save trajectory in. Default is "hdf5" if `traj_file` ends with
+        ".h5" or ".hdf5", otherwise "extxyz".
+    traj_kwargs : Optional[dict[str, Any]]
+        Keyword arguments to pass to `HDF5TrajectoryWriter`, such as `float32` and
+        `compression`, if `traj_format` is "hdf5". Default is {}.
     temp_start : Optional[float]
         Temperature to start heating, in K. Default is None, which disables heating.
     temp_end : Optional[float]
@@ -212,10 +244,15 @@ class MolecularDynamics(BaseCalculation):
         final_file: Optional[PathLike] = None,
         stats_file: Optional[PathLike] = None,
         stats_every: int = 100,
+        stats_buffer_rows: int = 100,
+        stats_buffer_time: float = 10.0,
+        write_queue_size: int = 8,
         traj_file: Optional[PathLike] = None,
         traj_append: bool = False,
         traj_start: int = 0,
         traj_every: int = 100,
+        traj_format: Optional[TrajFormats] = None,
+        traj_kwargs: Optional[dict[str, Any]] = None,
         temp_start: Optional[float] = None,
         temp_end: Optional[float] = None,
         temp_step: Optional[float] = None,
@@ -304,6 +341,17 @@ class MolecularDynamics(BaseCalculation):
             `file_prefix`.
         stats_every : int
             Frequency to output statistics. Default is 100.
+        stats_buffer_rows : int
+            Maximum number of rows of statistics to buffer before writing them to
+            `stats_file`. Buffered statistics are always written before restart
+            files. Default is 100.
+        stats_buffer_time : float
+            Maximum time, in seconds, to buffer statistics before writing them to
+            `stats_file`. Default is 10.0.
+        write_queue_size : int
+            Maximum number of structures waiting to be written to trajectory, restart
+            and final files by a background thread. Dynamics pause while the queue is
+            full. Default is 8.
         traj_file : Optional[PathLike]
             Trajectory file to save. Default inferred from `file_prefix`.
         traj_append : bool
@@ -312,6 +360,12 @@ class MolecularDynamics(BaseCalculation):
             Step to start saving trajectory. Default is 0.
         traj_every : int
             Frequency of steps to save trajectory. Default is 100.
+        traj_format : Optional[TrajFormats]
+            Format to save trajectory in. Default is "hdf5" if `traj_file` ends with
+            ".h5" or ".hdf5", otherwise "extxyz".
+        traj_kwargs : Optional[dict[str, Any]]
+            Keyword arguments to pass to `HDF5TrajectoryWriter`, such as `float32` and
+            `compression`, if `traj_format` is "hdf5". Default is {}.
         temp_start : Optional[float]
             Temperature to start heating, in K. Default is None, which disables
             heating.
@@ -340,6 +394,7 @@ class MolecularDynamics(BaseCalculation):
             write_kwargs,
             post_process_kwargs,
             correlation_kwargs,
+            traj_kwargs,
         ) = none_to_dict(
             (
                 read_kwargs,
@@ -347,6 +402,7 @@ class MolecularDynamics(BaseCalculation):
                 write_kwargs,
                 post_process_kwargs,
                 correlation_kwargs,
+                traj_kwargs,
             )
         )
 
@@ -370,10 +426,15 @@ class MolecularDynamics(BaseCalculation):
         self.final_file = final_file
         self.stats_file = stats_file
         self.stats_every = stats_every
+        self.stats_buffer_rows = stats_buffer_rows
+        self.stats_buffer_time = stats_buffer_time
+        self.write_queue_size = write_queue_size
         self.traj_file = traj_file
         self.traj_append = traj_append
         self.traj_start = traj_start
         self.traj_every = traj_every
+        self.traj_format = traj_format
+        self.traj_kwargs = traj_kwargs
         self.temp_start = temp_start
         self.temp_end = temp_end
         self.temp_step = temp_step
@@ -386,6 +447,27 @@ class MolecularDynamics(BaseCalculation):
         if "append" in self.write_kwargs:
             raise ValueError("`append` cannot be specified when writing files")
 
+        # RDF accumulated during dynamics is selected by step, not trajectory frame
+        if rdf_every := self.post_process_kwargs.get("rdf_every", None):
+            if any(
+                key in self.post_process_kwargs
+                for key in ("rdf_start", "rdf_stop", "rdf_step")
+            ):
+                raise ValueError(
+                    "`rdf_start_step` and `rdf_stop_step` must be used instead of "
+                    "`rdf_start`, `rdf_stop` and `rdf_step` with `rdf_every`"
+                )
+            if self.restart and rdf_every % self.traj_every:
+                raise ValueError(
+                    "`rdf_every` must be a multiple of `traj_every` to compute the "
+                    "RDF from the trajectory when restarting"
+                )
+        elif any(
+            key in self.post_process_kwargs
+            for key in ("rdf_start_step", "rdf_stop_step")
+        ):
+            raise ValueError("`rdf_start_step` and `rdf_stop_step` require `rdf_every`")
+
         # Check temperatures for heating differ
         if self.temp_start is not None and self.temp_start == self.temp_end:
             raise ValueError("Start and end temperatures must be different")
@@ -470,8 +552,14 @@ class MolecularDynamics(BaseCalculation):
         self.stats_file = self._build_filename(
             "stats.dat", self.param_prefix, filename=self.stats_file
         )
+        if self.traj_format is None:
+            self.traj_format = (
+                "hdf5" if self.traj_file and is_hdf5(self.traj_file) else "extxyz"
+            )
         self.traj_file = self._build_filename(
-            "traj.extxyz", self.param_prefix, filename=self.traj_file
+            "traj.h5" if self.traj_format == "hdf5" else "traj.extxyz",
+            self.param_prefix,
+            filename=self.traj_file,
         )
 
         # If not specified otherwise, save optimized structure consistently with others
@@ -508,12 +596,29 @@ class MolecularDynamics(BaseCalculation):
 
         if "masses" not in self.struct.arrays:
             self.struct.set_masses()
+        self._total_mass = np.sum(self.struct.get_masses())
+        self._thermo: Optional[ThermoSnapshot] = None
 
         if self.seed:
             np.random.seed(seed)
             random.seed(seed)
 
         self._parse_correlations()
+        self._rdf_accumulator = None
+
+    def _thermo_snapshot(self) -> ThermoSnapshot:
+        """
+        Get thermodynamic quantities for the current step, calculated once per step.
+
+        Returns
+        -------
+        ThermoSnapshot
+            Snapshot of the current structure, shared by outputs and correlations.
+        """
+        if self._thermo is None or self._thermo_step != self.dyn.nsteps:
+            self._thermo = ThermoSnapshot(self.dyn.atoms)
+            self._thermo_step = self.dyn.nsteps
+        return self._thermo
 
     def _set_info(self) -> None:
         """Set time in fs, current dynamics step, and density to info."""
@@ -522,11 +627,7 @@ class MolecularDynamics(BaseCalculation):
         self.dyn.atoms.info["time_fs"] = time
         self.dyn.atoms.info["step"] = step
         try:
-            density = (
-                np.sum(self.dyn.atoms.get_masses())
-                / self.dyn.atoms.get_volume()
-                * DENS_FACT
-            )
+            density = self._total_mass / self._thermo_snapshot().volume * DENS_FACT
             self.dyn.atoms.info["density"] = density
         except ValueError:
             self.dyn.atoms.info["density"] = 0.0
@@ -602,7 +703,8 @@ class MolecularDynamics(BaseCalculation):
         """Rotate restart files."""
         if len(self.restart_files) > self.restarts_to_keep:
             path = Path(self.restart_files.pop(0))
-            path.unlink(missing_ok=True)
+            # Remove file once any pending writes to it have completed
+            self._writer.submit(path.unlink, missing_ok=True)
 
     def _set_velocity_distribution(self) -> None:
         """
@@ -617,6 +719,8 @@ class MolecularDynamics(BaseCalculation):
 
         MaxwellBoltzmannDistribution(atoms, temperature_K=self.temp)
         Stationary(atoms)
+        # Velocities may change after quantities for the current step are stored
+        self._thermo = None
         if self.logger:
             self.logger.info("Velocities reset at step %s", self.dyn.nsteps)
         if self.remove_rot:
@@ -636,6 +740,7 @@ class MolecularDynamics(BaseCalculation):
                 self.logger.info("Minimizing at step %s", self.dyn.nsteps)
             optimizer = GeomOpt(self.struct, **self.minimize_kwargs)
             optimizer.run()
+            self._thermo = None
 
     def _set_param_prefix(self, file_prefix: Optional[PathLike] = None) -> str:
         """
@@ -707,12 +812,18 @@ class MolecularDynamics(BaseCalculation):
             self._correlations = ()
 
     def _attach_correlations(self) -> None:
-        """Attach all correlations to self.dyn."""
-        for i, _ in enumerate(self._correlations):
-            self.dyn.attach(
-                partial(lambda i: self._correlations[i].update(self.dyn.atoms), i),
-                self._correlations[i].update_frequency,
-            )
+        """Attach all correlations to self.dyn, sharing observed quantities."""
+        if self._correlations:
+            interval = gcd(*(cor.update_frequency for cor in self._correlations))
+            self.dyn.attach(self._update_correlations, interval)
+
+    def _update_correlations(self) -> None:
+        """Update correlations due at the current step."""
+        # Quantities such as stress are calculated once for all correlations
+        cache = self._thermo_snapshot()
+        for cor in self._correlations:
+            if self.dyn.nsteps % cor.update_frequency == 0:
+                cor.update(self.dyn.atoms, cache)
 
     def _write_correlations(self) -> None:
         """Write out the correlations."""
@@ -737,8 +848,9 @@ class MolecularDynamics(BaseCalculation):
         dict[str, float]
             Thermodynamical statistics to be written out.
         """
-        e_pot = self.dyn.atoms.get_potential_energy() / self.n_atoms
-        e_kin = self.dyn.atoms.get_kinetic_energy() / self.n_atoms
+        thermo = self._thermo_snapshot()
+        e_pot = thermo.potential_energy / self.n_atoms
+        e_kin = thermo.kinetic_energy / self.n_atoms
         current_temp = e_kin / (1.5 * units.kB)
 
         self._set_info()
@@ -748,18 +860,9 @@ class MolecularDynamics(BaseCalculation):
         self.dyn.atoms.info["real_time"] = time_now
 
         try:
-            volume = self.dyn.atoms.get_volume()
-            pressure = (
-                -np.trace(
-                    self.dyn.atoms.get_stress(include_ideal_gas=True, voigt=False)
-                )
-                / 3
-                / units.GPa
-            )
-            pressure_tensor = (
-                -self.dyn.atoms.get_stress(include_ideal_gas=True, voigt=True)
-                / units.GPa
-            )
+            volume = thermo.volume
+            pressure_tensor = -thermo.stress / units.GPa
+            pressure = np.sum(pressure_tensor[:3]) / 3
         except ValueError:
             volume = 0.0
             pressure = 0.0
@@ -844,13 +947,7 @@ class MolecularDynamics(BaseCalculation):
 
     def _write_header(self) -> None:
         """Write header for stats file."""
-        with open(self.stats_file, "a", encoding="utf-8") as stats_file:
-            write_table(
-                "ascii",
-                file=stats_file,
-                units=self.unit_info,
-                **{key: () for key in self.unit_info},
-            )
+        self._stats_writer.write_header()
 
     def _write_stats_file(self) -> None:
         """Write molecular dynamics statistics."""
@@ -860,15 +957,52 @@ class MolecularDynamics(BaseCalculation):
         if self.restart and self.dyn.nsteps == 0:
             return
 
-        with open(self.stats_file, "a", encoding="utf8") as stats_file:
-            write_table(
-                "ascii",
-                file=stats_file,
-                units=self.unit_info,
-                formats=self.default_formats,
-                print_header=False,
-                **stats,
-            )
+        self._stats_writer.write_row(**stats)
+
+    def _snapshot(self) -> Atoms:
+        """
+        Copy the current structure and calculated results.
+
+        Returns
+        -------
+        Atoms
+            Copy of structure, with results attached using a SinglePointCalculator.
+        """
+        # Copy structure and results, as dynamics continue while writing
+        snapshot = self.struct.copy()
+        snapshot.calc = SinglePointCalculator(snapshot)
+        snapshot.calc.results = {
+            key: value.copy() if isinstance(value, np.ndarray) else value
+            for key, value in self.struct.calc.results.items()
+        }
+        return snapshot
+
+    def _write_struct(self, write_kwargs: OutputKwargs) -> None:
+        """
+        Snapshot the current structure and write it in the background.
+
+        Parameters
+        ----------
+        write_kwargs : OutputKwargs
+            Keyword arguments to pass to `output_structs` to write the structure.
+        """
+        write_kwargs = dict(write_kwargs)
+
+        # Set info on the current structure, as when writing synchronously
+        # Each call is passed a copy, as output_structs removes its own kwargs
+        output_structs(
+            images=self.struct,
+            struct_path=self.struct_path,
+            write_kwargs=dict(write_kwargs),
+        )
+
+        self._writer.submit(
+            output_structs,
+            images=self._snapshot(),
+            set_info=False,
+            write_results=True,
+            write_kwargs=write_kwargs,
+        )
 
     def _write_traj(self) -> None:
         """Write current structure to trajectory file."""
@@ -883,16 +1017,19 @@ class MolecularDynamics(BaseCalculation):
             )
 
             self._set_info()
+            if self.traj_format == "hdf5":
+                # Label structure without copying results to info
+                output_structs(
+                    images=self.struct, struct_path=self.struct_path, set_info=False
+                )
+                self._writer.submit(self._traj_writer.write, self._snapshot())
+                return
+
             write_kwargs = self.write_kwargs
             write_kwargs["filename"] = self.traj_file
             write_kwargs["append"] = append
 
-            output_structs(
-                images=self.struct,
-                struct_path=self.struct_path,
-                write_results=True,
-                write_kwargs=write_kwargs,
-            )
+            self._write_struct(write_kwargs)
 
     def _write_final_state(self) -> None:
         """Write the final system state."""
@@ -908,48 +1045,167 @@ class MolecularDynamics(BaseCalculation):
         write_kwargs["filename"] = self.final_file
         write_kwargs["append"] = append
 
-        output_structs(
-            images=self.struct,
-            struct_path=self.struct_path,
-            write_results=True,
-            write_kwargs=write_kwargs,
-        )
+        self._write_struct(write_kwargs)
+
+    def _rdf_args(self) -> dict[str, Any]:
+        """
+        Get arguments to compute RDF from post-processing kwargs.
+
+        Returns
+        -------
+        dict[str, Any]
+            Maximum distance, number of bins, elements, and whether to split RDF by
+            elements.
+        """
+        return {
+            name: self.post_process_kwargs.get(key, default)
+            for name, (key, default) in (
+                ("rmax", ("rdf_rmax", 2.5)),
+                ("nbins", ("rdf_nbins", 50)),
+                ("elements", ("rdf_elements", None)),
+                ("by_elements", ("rdf_by_elements", False)),
+            )
+        }
+
+    def _rdf_filenames(
+        self, pairs: Optional[Iterable[tuple[str, str]]] = None
+    ) -> list[Path]:
+        """
+        Build filenames to save RDFs to.
+
+        Parameters
+        ----------
+        pairs : Optional[Iterable[tuple[str, str]]]
+            Pairs of elements for each RDF, if split by elements. Default is None.
+
+        Returns
+        -------
+        list[Path]
+            Filename for each RDF.
+        """
+        base_name = self.post_process_kwargs.get("rdf_output_file", None)
+        if pairs is None:
+            return [
+                self._build_filename(
+                    "rdf.dat", self.param_prefix, prefix_override=base_name
+                )
+            ]
+        return [
+            self._build_filename(
+                "rdf.dat",
+                self.param_prefix,
+                "_".join(pair),
+                prefix_override=base_name,
+            )
+            for pair in pairs
+        ]
+
+    def _attach_rdf(self) -> None:
+        """Attach RDF accumulator to self.dyn, if computing RDF during dynamics."""
+        rdf_every = self.post_process_kwargs.get("rdf_every", None)
+        if not self.post_process_kwargs.get("rdf_compute", False) or not rdf_every:
+            return
+
+        # Structures before the restart were not saved, so the whole trajectory is
+        # processed after dynamics instead
+        if self.restart:
+            if self.logger:
+                self.logger.info("Computing RDF from trajectory for restart")
+            return
+
+        self._rdf_accumulator = RDFAccumulator(**self._rdf_args())
+        self.dyn.attach(self._update_rdf, interval=rdf_every)
+
+    def _update_rdf(self) -> None:
+        """Add current structure to accumulated RDF, if within requested steps."""
+        # Do not include step 0 for restarts
+        if self.restart and self.dyn.nsteps == 0:
+            return
+
+        step = self.offset + self.dyn.nsteps
+        start = self.post_process_kwargs.get("rdf_start_step", 0)
+        stop = self.post_process_kwargs.get("rdf_stop_step", None)
+        if step >= start and (stop is None or step < stop):
+            self._rdf_accumulator.update(self.dyn.atoms)
+
+    def _rdf_frames(
+        self, data: Union[Sequence[Atoms], HDF5Trajectory], rdf_every: int
+    ) -> list[int]:
+        """
+        Get trajectory frames saved at the MD steps requested for RDF accumulation.
+
+        Parameters
+        ----------
+        data : Union[Sequence[Atoms], HDF5Trajectory]
+            Saved trajectory.
+        rdf_every : int
+            Interval between structures to include, in MD steps.
+
+        Returns
+        -------
+        list[int]
+            Indices of trajectory frames to include.
+        """
+        if isinstance(data, HDF5Trajectory):
+            steps = data.get_array("info/step")
+        else:
+            steps = np.array([struct.info["step"] for struct in data])
+
+        start = self.post_process_kwargs.get("rdf_start_step", 0)
+        stop = self.post_process_kwargs.get("rdf_stop_step", None)
+        included = (steps >= start) & (steps % rdf_every == 0)
+        if stop is not None:
+            included &= steps < stop
+        return np.flatnonzero(included).tolist()
 
     def _post_process(self) -> None:
         """Compute properties after MD run."""
         # Nothing to do
         if not any(
             self.post_process_kwargs.get(kwarg, None)
-            for kwarg in ("rdf_compute", "vaf_compute")
+            for kwarg in ("rdf_compute", "vaf_compute", "msd_compute")
         ):
             warn(
                 "Post-processing arguments present, but no computation requested. "
-                "Please set either 'rdf_compute' or 'vaf_compute' "
+                "Please set either 'rdf_compute', 'vaf_compute' or 'msd_compute' "
                 "to do post-processing.",
                 stacklevel=2,
             )
 
-        data = read(self.traj_file, index=":")
-
-        ana = Analysis(data)
+        rdf_compute = self.post_process_kwargs.get("rdf_compute", False)
+        vaf_compute = self.post_process_kwargs.get("vaf_compute", False)
+        vaf_max_lag = self.post_process_kwargs.get("vaf_max_lag", None)
+        msd_compute = self.post_process_kwargs.get("msd_compute", False)
 
-        if self.post_process_kwargs.get("rdf_compute", False):
-            base_name = self.post_process_kwargs.get("rdf_output_file", None)
-            rdf_args = {
-                name: self.post_process_kwargs.get(key, default)
-                for name, (key, default) in (
-                    ("rmax", ("rdf_rmax", 2.5)),
-                    ("nbins", ("rdf_nbins", 50)),
-                    ("elements", ("rdf_elements", None)),
-                    ("by_elements", ("rdf_by_elements", False)),
+        # Only read whole trajectory if RDF was not accumulated during dynamics, or
+        # VAF is not streamed
+        if (vaf_compute and vaf_max_lag is None) or (
+            rdf_compute and self._rdf_accumulator is None
+        ):
+            if self.traj_format == "hdf5":
+                # Frames are read from the trajectory file as required
+                data = HDF5Trajectory(self.traj_file)
+            else:
+                data = read(self.traj_file, index=":")
+
+        if rdf_compute and self._rdf_accumulator is not None:
+            rdf = self._rdf_accumulator.get_rdf()
+            pairs = rdf.keys() if self._rdf_accumulator.by_elements else None
+            self._rdf_accumulator.write(self._rdf_filenames(pairs))
+
+        elif rdf_compute:
+            rdf_args = self._rdf_args()
+            if rdf_every := self.post_process_kwargs.get("rdf_every", None):
+                # Steps requested for accumulation when restarting
+                rdf_data = (data[i] for i in self._rdf_frames(data, rdf_every))
+                rdf_args["index"] = (0, None, 1)
+            else:
+                rdf_data = data
+                rdf_args["index"] = (
+                    self.post_process_kwargs.get("rdf_start", len(data) - 1),
+                    self.post_process_kwargs.get("rdf_stop", len(data)),
+                    self.post_process_kwargs.get("rdf_step", 1),
                 )
-            }
-            slice_ = (
-                self.post_process_kwargs.get("rdf_start", len(data) - 1),
-                self.post_process_kwargs.get("rdf_stop", len(data)),
-                self.post_process_kwargs.get("rdf_step", 1),
-            )
-            rdf_args["index"] = slice_
 
             if rdf_args["by_elements"]:
                 elements = (
@@ -957,27 +1213,20 @@ class MolecularDynamics(BaseCalculation):
                     if rdf_args["elements"] is None
                     else rdf_args["elements"]
                 )
-
-                out_paths = [
-                    self._build_filename(
-                        "rdf.dat",
-                        self.param_prefix,
-                        "_".join(element),
-                        prefix_override=base_name,
-                    )
-                    for element in combinations_with_replacement(elements, 2)
-                ]
-
+                out_paths = self._rdf_filenames(
+                    combinations_with_replacement(elements, 2)
+                )
             else:
-                out_paths = [
-                    self._build_filename(
-                        "rdf.dat", self.param_prefix, prefix_override=base_name
-                    )
-                ]
+                out_paths = self._rdf_filenames()
 
-            compute_rdf(data, ana, filenames=out_paths, **rdf_args)
+            compute_rdf(
+                rdf_data,
+                filenames=out_paths,
+                n_workers=self.post_process_kwargs.get("rdf_n_workers", 1),
+                **rdf_args,
+            )
 
-        if self.post_process_kwargs.get("vaf_compute", False):
+        if vaf_compute:
             file_name = self.post_process_kwargs.get("vaf_output_file", None)
             use_vel = self.post_process_kwargs.get("vaf_velocities", False)
             fft = self.post_process_kwargs.get("vaf_fft", False)
@@ -991,29 +1240,68 @@ class MolecularDynamics(BaseCalculation):
                 self.post_process_kwargs.get("vaf_step", 1),
             )
 
-            compute_vaf(
-                data,
+            vaf_args = {
+                "use_velocities": use_vel,
+                "fft": fft,
+                "index": slice_,
+                "filter_atoms": self.post_process_kwargs.get("vaf_atoms", None),
+            }
+            if vaf_max_lag is None:
+                compute_vaf(data, out_path, **vaf_args)
+            else:
+                stream_vaf(self._iter_traj(), out_path, max_lag=vaf_max_lag, **vaf_args)
+
+        if msd_compute:
+            file_name = self.post_process_kwargs.get("msd_output_file", None)
+            out_path = self._build_filename(
+                "msd.dat", self.param_prefix, filename=file_name
+            )
+            slice_ = (
+                self.post_process_kwargs.get("msd_start", 0),
+                self.post_process_kwargs.get("msd_stop", None),
+                self.post_process_kwargs.get("msd_step", 1),
+            )
+            # Time between analysed frames
+            timestep = (self.timestep / units.fs) * self.traj_every * slice_[2]
+
+            compute_msd(
+                self._iter_traj(),
                 out_path,
-                use_velocities=use_vel,
-                fft=fft,
+                max_lag=self.post_process_kwargs.get("msd_max_lag", 1000),
+                timestep=timestep,
+                unwrap=self.post_process_kwargs.get("msd_unwrap", True),
                 index=slice_,
-                filter_atoms=self.post_process_kwargs.get("vaf_atoms", None),
+                filter_atoms=self.post_process_kwargs.get("msd_atoms", None),
             )
 
+    def _iter_traj(self) -> Iterable[Atoms]:
+        """
+        Iterate over the trajectory file, without reading all frames at once.
+
+        Returns
+        -------
+        Iterable[Atoms]
+            Structures saved in the trajectory.
+        """
+        if self.traj_format == "hdf5":
+            return HDF5Trajectory(self.traj_file)
+        return iread(self.traj_file)
+
     def _write_restart(self) -> None:
         """Write restart file and (optionally) rotate files saved."""
         step = self.offset + self.dyn.nsteps
         if step > 0:
+            # Ensure statistics and trajectory are saved up to the restart step
+            self._stats_writer.flush()
+            if self.traj_format == "hdf5":
+                # Queued behind pending frames, so all are written before flushing
+                self._writer.submit(self._traj_writer.flush)
+
             write_kwargs = self.write_kwargs
             write_kwargs["filename"] = self._restart_file
             self._set_info()
 
-            output_structs(
-                images=self.struct,
-                struct_path=self.struct_path,
-                write_results=True,
-                write_kwargs=write_kwargs,
-            )
+            self._write_struct(write_kwargs)
             if self.rotate_restart:
                 self.restart_files.append(self._restart_file)
                 self._rotate_restart_files()
@@ -1026,24 +1314,45 @@ class MolecularDynamics(BaseCalculation):
             if self.rescale_velocities:
                 self._reset_velocities()
 
-        if self.offset == 0:
-            self._write_header()
+        # Keep stats file open, writing buffered statistics and structures on exit
+        with ExitStack() as stack:
+            self._stats_writer = stack.enter_context(
+                BufferedTableWriter(
+                    self.stats_file,
+                    units=self.unit_info,
+                    formats=self.default_formats,
+                    buffer_rows=self.stats_buffer_rows,
+                    buffer_time=self.stats_buffer_time,
+                )
+            )
+            if self.traj_format == "hdf5":
+                self._traj_writer = stack.enter_context(
+                    HDF5TrajectoryWriter(
+                        self.traj_file, append=self.restart, **self.traj_kwargs
+                    )
+                )
+            # Entered last, so queued structures are written before files are closed
+            self._writer = stack.enter_context(BackgroundWriter(self.write_queue_size))
+
+            if self.offset == 0:
+                self._write_header()
 
-        self.dyn.attach(self._write_stats_file, interval=self.stats_every)
-        self.dyn.attach(self._write_traj, interval=self.traj_every)
-        self.dyn.attach(self._write_restart, interval=self.restart_every)
+            self.dyn.attach(self._write_stats_file, interval=self.stats_every)
+            self.dyn.attach(self._write_traj, interval=self.traj_every)
+            self.dyn.attach(self._write_restart, interval=self.restart_every)
 
-        self._attach_correlations()
+            self._attach_correlations()
+            self._attach_rdf()
 
-        if self.rescale_velocities:
-            self.dyn.attach(self._reset_velocities, interval=self.rescale_every)
+            if self.rescale_velocities:
+                self.dyn.attach(self._reset_velocities, interval=self.rescale_every)
 
-        if self.minimize and self.minimize_every > 0:
-            self.dyn.attach(self._optimize_structure, interval=self.minimize_every)
+            if self.minimize and self.minimize_every > 0:
+                self.dyn.attach(self._optimize_structure, interval=self.minimize_every)
 
-        # Note current time
-        self.struct.info["real_time"] = datetime.datetime.now()
-        self._run_dynamics()
+            # Note current time
+            self.struct.info["real_time"] = datetime.datetime.now()
+            self._run_dynamics()
 
         if self.post_process_kwargs:
             self._post_process()
@@ -1,10 +1,12 @@
 """Phonon calculations."""
 
 from collections.abc import Sequence
+from contextlib import nullcontext
 from typing import Any, Optional, get_args
 
 from ase import Atoms
-from numpy import ndarray
+import h5py
+from numpy import allclose, array, array_equal, ndarray
 import phonopy
 from phonopy.file_IO import write_force_constants_to_hdf5
 from phonopy.structure.atoms import PhonopyAtoms
@@ -20,7 +22,19 @@ from janus_core.helpers.janus_types import (
     PathLike,
     PhononCalcs,
 )
-from janus_core.helpers.utils import none_to_dict, track_progress, write_table
+from janus_core.helpers.mlip_calculators import (
+    batch_calculate,
+    model_checksum,
+    supports_batching,
+)
+from janus_core.helpers.parallel import CalculatorPool
+from janus_core.helpers.result_cache import ResultCache
+from janus_core.helpers.utils import (
+    SharedCalculator,
+    none_to_dict,
+    track_progress,
+    write_table,
+)
 
 
 class Phonons(BaseCalculation):
@@ -94,11 +108,32 @@ class Phonons(BaseCalculation):
         structure.
     enable_progress_bar : bool
         Whether to show a progress bar during phonon calculations. Default is False.
+    result_cache : Optional[ResultCache]
+        Cache to reuse previously calculated forces from, and store new forces in.
+        Default is None.
+    batch_size : Optional[int]
+        Maximum number of displaced supercells to evaluate in each forward pass of the
+        model, if supported by the calculator. Default is None, which evaluates
+        supercells individually.
+    n_workers : int
+        Number of worker processes to evaluate displaced supercells with. Each worker
+        loads a calculator configured by `arch`, `device`, `model_path` and
+        `calc_kwargs`. Default is 1, which evaluates supercells in the current
+        process.
+    threads_per_worker : Optional[int]
+        Number of PyTorch intra-op threads for each worker process. Default is the
+        number of CPUs divided by `n_workers`.
+    checkpoint : bool
+        Whether to save forces on each displaced supercell to an hdf5 file as they are
+        calculated, and reuse saved forces for the same displacements. Default is
+        False.
 
     Attributes
     ----------
     calc : ase.calculators.calculator.Calculator
         ASE Calculator attached to structure.
+    checkpoint_file : Optional[Path]
+        File to save forces on each displaced supercell to, if `checkpoint` is True.
     results : dict
         Results of phonon calculations.
 
@@ -158,6 +193,11 @@ class Phonons(BaseCalculation):
         write_full: bool = True,
         file_prefix: Optional[PathLike] = None,
         enable_progress_bar: bool = False,
+        result_cache: Optional[ResultCache] = None,
+        batch_size: Optional[int] = None,
+        n_workers: int = 1,
+        threads_per_worker: Optional[int] = None,
+        checkpoint: bool = False,
     ) -> None:
         """
         Initialise Phonons class.
@@ -229,7 +269,31 @@ class Phonons(BaseCalculation):
             chemical formula of the structure.
         enable_progress_bar : bool
             Whether to show a progress bar during phonon calculations. Default is False.
+        result_cache : Optional[ResultCache]
+            Cache to reuse previously calculated forces from, and store new forces in.
+            Default is None.
+        batch_size : Optional[int]
+            Maximum number of displaced supercells to evaluate in each forward pass of
+            the model, if supported by the calculator. Default is None, which
+            evaluates supercells individually.
+        n_workers : int
+            Number of worker processes to evaluate displaced supercells with. Each
+            worker loads a calculator configured by `arch`, `device`, `model_path` and
+            `calc_kwargs`. Default is 1, which evaluates supercells in the current
+            process.
+        threads_per_worker : Optional[int]
+            Number of PyTorch intra-op threads for each worker process. Default is the
+            number of CPUs divided by `n_workers`.
+        checkpoint : bool
+            Whether to save forces on each displaced supercell to an hdf5 file as they
+            are calculated, and reuse saved forces for the same displacements. Default
+            is False.
         """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("`batch_size` must be at least 1")
+        if n_workers < 1:
+            raise ValueError("`n_workers` must be at least 1")
+
         (read_kwargs, minimize_kwargs) = none_to_dict((read_kwargs, minimize_kwargs))
 
         self.calcs = calcs
@@ -246,6 +310,11 @@ class Phonons(BaseCalculation):
         self.write_results = write_results
         self.write_full = write_full
         self.enable_progress_bar = enable_progress_bar
+        self.result_cache = result_cache
+        self.batch_size = batch_size
+        self.n_workers = n_workers
+        self.threads_per_worker = threads_per_worker
+        self.checkpoint = checkpoint
 
         # Ensure supercell is a valid list
         self.supercell = [supercell] * 3 if isinstance(supercell, int) else supercell
@@ -276,6 +345,7 @@ class Phonons(BaseCalculation):
 
         if not self.struct.calc:
             raise ValueError("Please attach a calculator to `struct`.")
+        self._check_workers()
 
         if self.minimize:
             if self.logger:
@@ -303,6 +373,12 @@ class Phonons(BaseCalculation):
             if self.symmetrize:
                 self.minimize_kwargs.setdefault("symmetrize", True)
 
+        self.checkpoint_file = (
+            self._build_filename("displacement-forces.hdf5")
+            if self.checkpoint
+            else None
+        )
+
         self.calc = self.struct.calc
         self.results = {}
 
@@ -377,18 +453,14 @@ class Phonons(BaseCalculation):
         )
         phonon = phonopy.Phonopy(cell, supercell_matrix)
         phonon.generate_displacements(distance=self.displacement)
-        disp_supercells = phonon.supercells_with_displacements
-
-        if self.enable_progress_bar:
-            disp_supercells = track_progress(
-                disp_supercells, "Computing displacements..."
-            )
-
-        phonon.forces = [
-            self._calc_forces(supercell)
-            for supercell in disp_supercells
+        disp_supercells = [
+            supercell
+            for supercell in phonon.supercells_with_displacements
             if supercell is not None
         ]
+        phonon.forces = self._calc_displacement_forces(
+            phonon.supercell, disp_supercells
+        )
 
         phonon.produce_force_constants()
         self.results["phonon"] = phonon
@@ -840,22 +912,173 @@ class Phonons(BaseCalculation):
             masses=struct.get_masses(),
         )
 
-    def _calc_forces(self, struct: PhonopyAtoms) -> ndarray:
+    def _calc_displacement_forces(
+        self, supercell: PhonopyAtoms, disp_supercells: Sequence[PhonopyAtoms]
+    ) -> list[ndarray]:
         """
-        Calculate forces on PhonopyAtoms structure.
+        Calculate forces on all displaced supercells.
+
+        A single ASE Atoms supercell is created, which is copied with updated positions
+        for each displacement. Supercells are evaluated in chunks, either in batches
+        or by a pool of worker processes, if requested.
 
         Parameters
         ----------
-        struct : PhonopyAtoms
-            Structure to calculate forces on.
+        supercell : PhonopyAtoms
+            Undisplaced supercell.
+        disp_supercells : Sequence[PhonopyAtoms]
+            Displaced supercells to calculate forces on.
+
+        Returns
+        -------
+        list[ndarray]
+            Forces on each displaced supercell.
+        """
+        template = self._Phonopy_to_ASEAtoms(supercell)
+        forces = [None] * len(disp_supercells)
+
+        if self.checkpoint:
+            checkpoint_context = h5py.File(self.checkpoint_file, "a")
+        else:
+            checkpoint_context = nullcontext()
+
+        with checkpoint_context as checkpoint:
+            if checkpoint is not None:
+                self._read_checkpoint(checkpoint, disp_supercells, forces)
+            todo = [i for i, force in enumerate(forces) if force is None]
+
+            if self.n_workers > 1 and todo:
+                pool_context = self._calculator_pool()
+                # Provide several supercells per worker to balance load
+                chunk_size = 4 * self.n_workers * (self.batch_size or 1)
+            else:
+                pool_context = nullcontext()
+                chunk_size = self.batch_size or 1
+
+            chunks = [todo[i : i + chunk_size] for i in range(0, len(todo), chunk_size)]
+            # Progress is advanced once each chunk has been evaluated
+            if self.enable_progress_bar:
+                chunks = track_progress(chunks, "Computing displacements...")
+
+            with pool_context as pool:
+                for chunk in chunks:
+                    structs = []
+                    for i in chunk:
+                        struct = template.copy()
+                        struct.positions = disp_supercells[i].positions
+                        struct.calc = SharedCalculator(self.calc)
+                        structs.append(struct)
+
+                    for i, force in zip(chunk, self._calc_forces(structs, pool)):
+                        forces[i] = force
+                        if checkpoint is not None:
+                            checkpoint["forces"][i] = force
+                            checkpoint["completed"][i] = True
+                    if checkpoint is not None:
+                        checkpoint.flush()
+        return forces
+
+    def _read_checkpoint(
+        self,
+        checkpoint: h5py.File,
+        disp_supercells: Sequence[PhonopyAtoms],
+        forces: list[Optional[ndarray]],
+    ) -> None:
+        """
+        Read forces for completed displacements from a checkpoint file.
+
+        If the checkpoint was written for different displaced supercells, species,
+        cell or model, it is cleared and set up for the current calculation.
+
+        Parameters
+        ----------
+        checkpoint : h5py.File
+            Open checkpoint file.
+        disp_supercells : Sequence[PhonopyAtoms]
+            Displaced supercells to calculate forces on.
+        forces : list[Optional[ndarray]]
+            Forces on each displaced supercell, updated in place for completed
+            displacements.
+        """
+        positions = array([supercell.positions for supercell in disp_supercells])
+        identity = {
+            "model": model_checksum(self.calc),
+            "numbers": disp_supercells[0].numbers,
+            "cell": disp_supercells[0].cell,
+        }
+
+        if "positions" in checkpoint and (
+            checkpoint["positions"].shape != positions.shape
+            or not allclose(checkpoint["positions"][()], positions)
+            or checkpoint.attrs.get("model") != identity["model"]
+            or not array_equal(checkpoint.attrs.get("numbers"), identity["numbers"])
+            or not array_equal(checkpoint.attrs.get("cell"), identity["cell"])
+        ):
+            if self.logger:
+                self.logger.info(
+                    "Displacements, structure or model changed, discarding checkpoint"
+                )
+            for key in list(checkpoint):
+                del checkpoint[key]
+
+        if "positions" not in checkpoint:
+            checkpoint.attrs.update(identity)
+            checkpoint.create_dataset("positions", data=positions)
+            checkpoint.create_dataset("forces", shape=positions.shape, dtype=float)
+            checkpoint.create_dataset("completed", shape=len(positions), dtype=bool)
+            return
+
+        completed = checkpoint["completed"][()]
+        for i in completed.nonzero()[0]:
+            forces[i] = checkpoint["forces"][i]
+        if self.logger:
+            self.logger.info(
+                "Read forces for %s displacements from checkpoint", completed.sum()
+            )
+
+    def _calc_forces(
+        self, structs: Sequence[Atoms], pool: Optional[CalculatorPool] = None
+    ) -> list[ndarray]:
+        """
+        Calculate forces on a chunk of supercells.
+
+        Parameters
+        ----------
+        structs : Sequence[Atoms]
+            Supercells to calculate forces on, each with a `SharedCalculator`.
+        pool : Optional[CalculatorPool]
+            Pool of worker processes to evaluate supercells. Default is None.
 
         Returns
         -------
-        ndarray
-            Forces on the structure.
+        list[ndarray]
+            Forces on each supercell.
         """
-        atoms = self._Phonopy_to_ASEAtoms(struct)
-        return atoms.get_forces()
+        if self.result_cache:
+            missing = [
+                struct
+                for struct in structs
+                if not self.result_cache.restore(struct, ("forces",))
+            ]
+        else:
+            missing = structs
+
+        results = None
+        if pool and missing:
+            results = pool.calculate(missing, ("forces",), batch_size=self.batch_size)
+        elif self.batch_size and missing and supports_batching(self.calc):
+            results = batch_calculate(self.calc, missing, batch_size=self.batch_size)
+        if results:
+            for struct, result in zip(missing, results):
+                struct.calc.results = result
+                struct.calc.atoms = struct.copy()
+
+        forces = [struct.get_forces() for struct in structs]
+
+        if self.result_cache:
+            for struct in missing:
+                self.result_cache.add(struct, struct.calc.results)
+        return forces
 
     def run(self) -> None:
         """Run phonon calculations."""
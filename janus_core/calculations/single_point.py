@@ -1,10 +1,16 @@
 """Prepare and perform single point calculations."""
 
 from collections.abc import Sequence
+from contextlib import nullcontext
+from itertools import islice
+from pathlib import Path
+from time import perf_counter
 from typing import Any, Optional, get_args
 
 from ase import Atoms
+from ase.io import iread
 from numpy import ndarray
+import yaml
 
 from janus_core.calculations.base import BaseCalculation
 from janus_core.helpers.janus_types import (
@@ -12,13 +18,20 @@ from janus_core.helpers.janus_types import (
     ASEReadArgs,
     CalcResults,
     Devices,
-    MaybeList,
     MaybeSequence,
     OutputKwargs,
     PathLike,
     Properties,
 )
-from janus_core.helpers.utils import check_calculator, none_to_dict, output_structs
+from janus_core.helpers.mlip_calculators import batch_calculate, supports_batching
+from janus_core.helpers.parallel import CalculatorPool
+from janus_core.helpers.result_cache import ResultCache
+from janus_core.helpers.utils import (
+    SharedCalculator,
+    check_calculator,
+    none_to_dict,
+    output_structs,
+)
 
 
 class SinglePoint(BaseCalculation):
@@ -63,11 +76,38 @@ class SinglePoint(BaseCalculation):
     write_kwargs : Optional[OutputKwargs]
         Keyword arguments to pass to ase.io.write if saving structure with results of
         calculations. Default is {}.
+    batch_size : Optional[int]
+        Maximum number of structures to evaluate in each forward pass of the model, if
+        supported by the calculator. Default is None, which evaluates structures
+        individually.
+    stream : bool
+        Whether to read, evaluate and write structures from `struct_path` in chunks,
+        rather than reading all structures into memory. Default is False.
+    chunk_size : int
+        Number of structures to read and evaluate at a time if streaming. Default is
+        100.
+    resume : bool
+        Whether to resume streaming from the last completed chunk of a previous
+        calculation. A complete calculation is not repeated. Default is False.
+    n_workers : int
+        Number of worker processes to evaluate structures with. Each worker loads a
+        calculator configured by `arch`, `device`, `model_path` and `calc_kwargs`.
+        Default is 1, which evaluates structures in the current process.
+    threads_per_worker : Optional[int]
+        Number of PyTorch intra-op threads for each worker process. Default is the
+        number of CPUs divided by `n_workers`.
+    result_cache : Optional[ResultCache]
+        Cache to reuse previously calculated results from, and store new results in.
+        Default is None.
 
     Attributes
     ----------
     results : CalcResults
-        Dictionary of calculated results, with keys from `properties`.
+        Dictionary of calculated results, with keys from `properties`. Results are
+        only written to file if streaming structures.
+    timings : dict[str, float]
+        Time, in seconds, spent calculating the Hessian ("hessian"), and all other
+        properties, which are calculated together ("calculate").
 
     Methods
     -------
@@ -93,6 +133,13 @@ class SinglePoint(BaseCalculation):
         properties: MaybeSequence[Properties] = (),
         write_results: bool = False,
         write_kwargs: Optional[OutputKwargs] = None,
+        batch_size: Optional[int] = None,
+        stream: bool = False,
+        chunk_size: int = 100,
+        resume: bool = False,
+        n_workers: int = 1,
+        threads_per_worker: Optional[int] = None,
+        result_cache: Optional[ResultCache] = None,
     ) -> None:
         """
         Read the structure being simulated and attach an MLIP calculator.
@@ -135,16 +182,63 @@ class SinglePoint(BaseCalculation):
         write_kwargs : Optional[OutputKwargs],
             Keyword arguments to pass to ase.io.write if saving structure with results
             of calculations. Default is {}.
+        batch_size : Optional[int]
+            Maximum number of structures to evaluate in each forward pass of the model,
+            if supported by the calculator. Default is None, which evaluates structures
+            individually.
+        stream : bool
+            Whether to read, evaluate and write structures from `struct_path` in
+            chunks, rather than reading all structures into memory. Default is False.
+        chunk_size : int
+            Number of structures to read and evaluate at a time if streaming. Default
+            is 100.
+        resume : bool
+            Whether to resume streaming from the last completed chunk of a previous
+            calculation. A complete calculation is not repeated. Default is False.
+        n_workers : int
+            Number of worker processes to evaluate structures with. Each worker loads a
+            calculator configured by `arch`, `device`, `model_path` and `calc_kwargs`.
+            Default is 1, which evaluates structures in the current process.
+        threads_per_worker : Optional[int]
+            Number of PyTorch intra-op threads for each worker process. Default is the
+            number of CPUs divided by `n_workers`.
+        result_cache : Optional[ResultCache]
+            Cache to reuse previously calculated results from, and store new results
+            in. Default is None.
         """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("`batch_size` must be at least 1")
+        if stream:
+            if not struct_path:
+                raise ValueError("`struct_path` must be specified to stream structures")
+            if not write_results:
+                raise ValueError("`write_results` must be True to stream structures")
+            if chunk_size < 1:
+                raise ValueError("`chunk_size` must be at least 1")
+        if n_workers < 1:
+            raise ValueError("`n_workers` must be at least 1")
+
         (read_kwargs, write_kwargs) = none_to_dict((read_kwargs, write_kwargs))
 
         self.write_results = write_results
         self.write_kwargs = write_kwargs
         self.log_kwargs = log_kwargs
+        self.batch_size = batch_size
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.resume = resume
+        self.n_workers = n_workers
+        self.threads_per_worker = threads_per_worker
+        self.result_cache = result_cache
 
         # Read full trajectory by default
         read_kwargs.setdefault("index", ":")
 
+        # Only read the first structure to set up the calculation if streaming
+        if self.stream:
+            self.stream_index = read_kwargs["index"]
+            read_kwargs = read_kwargs | {"index": "0:1"}
+
         # Initialise structures and logging
         super().__init__(
             calc_name=__name__,
@@ -162,6 +256,8 @@ class SinglePoint(BaseCalculation):
             track_carbon=track_carbon,
             tracker_kwargs=tracker_kwargs,
         )
+        if self.stream or isinstance(self.struct, Sequence):
+            self._check_workers()
 
         # Properties validated using calculator
         self.properties = properties
@@ -173,6 +269,7 @@ class SinglePoint(BaseCalculation):
         ).absolute()
 
         self.results = {}
+        self.timings = {}
 
     @property
     def properties(self) -> Sequence[Properties]:
@@ -220,47 +317,53 @@ class SinglePoint(BaseCalculation):
 
         self._properties = value
 
-    def _get_potential_energy(self) -> MaybeList[float]:
+    def _calc_properties(self, struct: Atoms) -> dict[str, Any]:
         """
-        Calculate potential energy using MLIP.
+        Calculate all selected properties of a structure in a single pass.
 
-        Returns
-        -------
-        MaybeList[float]
-            Potential energy of structure(s).
-        """
-        if isinstance(self.struct, Sequence):
-            return [struct.get_potential_energy() for struct in self.struct]
+        Properties other than the Hessian are requested from the calculator in a
+        single call, before being read back from the calculator's results.
 
-        return self.struct.get_potential_energy()
-
-    def _get_forces(self) -> MaybeList[ndarray]:
-        """
-        Calculate forces using MLIP.
+        Parameters
+        ----------
+        struct : Atoms
+            Structure to calculate properties for.
 
         Returns
         -------
-        MaybeList[ndarray]
-            Forces of structure(s).
+        dict[str, Any]
+            Calculated properties of the structure.
         """
-        if isinstance(self.struct, Sequence):
-            return [struct.get_forces() for struct in self.struct]
+        calc = struct.calc
+        props = [prop for prop in self.properties if prop != "hessian"]
+        results = {}
+
+        if props:
+            start = perf_counter()
+            system_changes = calc.check_state(struct)
+            if system_changes:
+                calc.atoms = None
+                calc.results = {}
+            missing = [prop for prop in props if prop not in calc.results]
+            if missing:
+                calc.atoms = struct.copy()
+                calc.calculate(struct, missing, system_changes)
+
+            # Atoms getters apply constraints to cached results
+            if "energy" in props:
+                results["energy"] = struct.get_potential_energy()
+            if "forces" in props:
+                results["forces"] = struct.get_forces()
+            if "stress" in props:
+                results["stress"] = struct.get_stress()
+            self.timings["calculate"] += perf_counter() - start
 
-        return self.struct.get_forces()
-
-    def _get_stress(self) -> MaybeList[ndarray]:
-        """
-        Calculate stress using MLIP.
-
-        Returns
-        -------
-        MaybeList[ndarray]
-            Stress of structure(s).
-        """
-        if isinstance(self.struct, Sequence):
-            return [struct.get_stress() for struct in self.struct]
+        if "hessian" in self.properties:
+            start = perf_counter()
+            results["hessian"] = self._calc_hessian(struct)
+            self.timings["hessian"] += perf_counter() - start
 
-        return self.struct.get_stress()
+        return results
 
     def _calc_hessian(self, struct: Atoms) -> ndarray:
         """
@@ -287,19 +390,199 @@ class SinglePoint(BaseCalculation):
         struct.info[f"{label}hessian"] = hessian
         return hessian
 
-    def _get_hessian(self) -> MaybeList[ndarray]:
+    def _batch_calculate(self, structs: Sequence[Atoms]) -> None:
+        """
+        Calculate energy, forces and stress for structures in batches.
+
+        Results are stored on each structure's calculator, so that they are returned
+        by subsequent property getters without further evaluation. Structures are
+        evaluated individually if their calculator does not support batching.
+
+        Parameters
+        ----------
+        structs : Sequence[Atoms]
+            Structures to evaluate.
+        """
+        calcs = [
+            image.calc.calc if isinstance(image.calc, SharedCalculator) else image.calc
+            for image in structs
+        ]
+        # Results are stored per structure, so each requires its own calculator
+        shared = all(calc is calcs[0] for calc in calcs) and len(
+            {id(image.calc) for image in structs}
+        ) == len(structs)
+        if not shared or not supports_batching(calcs[0]):
+            if self.logger:
+                self.logger.info(
+                    "Batched evaluation is not supported by the calculator. "
+                    "Evaluating structures individually"
+                )
+            return
+
+        if self.logger:
+            self.logger.info("Evaluating structures in batches of %s", self.batch_size)
+        results = batch_calculate(calcs[0], structs, batch_size=self.batch_size)
+
+        self._store_results(structs, results)
+
+    def _parallel_calculate(
+        self, structs: Sequence[Atoms], pool: CalculatorPool
+    ) -> None:
         """
-        Calculate hessian using MLIP.
+        Calculate properties for structures using a pool of worker processes.
+
+        Results are stored on each structure's calculator, so that they are returned
+        by subsequent property getters without further evaluation.
+
+        Parameters
+        ----------
+        structs : Sequence[Atoms]
+            Structures to evaluate.
+        pool : CalculatorPool
+            Pool of worker processes to evaluate structures.
+        """
+        if self.logger:
+            self.logger.info(
+                "Evaluating structures using %s worker processes", pool.n_workers
+            )
+        props = [prop for prop in self.properties if prop != "hessian"]
+        results = pool.calculate(structs, props, batch_size=self.batch_size)
+        self._store_results(structs, results)
+
+    @staticmethod
+    def _store_results(structs: Sequence[Atoms], results: Sequence[dict]) -> None:
+        """
+        Store calculated results on each structure's calculator.
+
+        Parameters
+        ----------
+        structs : Sequence[Atoms]
+            Structures that have been evaluated.
+        results : Sequence[dict]
+            Calculated results for each structure.
+        """
+        for image, result in zip(structs, results):
+            image.calc.results = result
+            image.calc.atoms = image.copy()
+
+    def _calc_structs(
+        self, structs: Sequence[Atoms], pool: Optional[CalculatorPool] = None
+    ) -> list[dict[str, Any]]:
+        """
+        Calculate all selected properties for a sequence of structures.
+
+        Parameters
+        ----------
+        structs : Sequence[Atoms]
+            Structures to calculate properties for.
+        pool : Optional[CalculatorPool]
+            Pool of worker processes to evaluate structures. Default is None.
 
         Returns
         -------
-        MaybeList[ndarray]
-            Hessian of structure(s).
+        list[dict[str, Any]]
+            Calculated properties of each structure.
         """
-        if isinstance(self.struct, Sequence):
-            return [self._calc_hessian(struct) for struct in self.struct]
+        props = [prop for prop in self.properties if prop != "hessian"]
+        if self.result_cache and props:
+            missing = [
+                image
+                for image in structs
+                if not self.result_cache.restore(image, props)
+            ]
+            if self.logger:
+                self.logger.info(
+                    "Using cached results for %s structures",
+                    len(structs) - len(missing),
+                )
+        else:
+            missing = structs
+
+        start = perf_counter()
+        if pool and missing:
+            self._parallel_calculate(missing, pool)
+        elif self.batch_size and missing:
+            self._batch_calculate(missing)
+        self.timings["calculate"] += perf_counter() - start
 
-        return self._calc_hessian(self.struct)
+        results = [self._calc_properties(image) for image in structs]
+
+        if self.result_cache and props:
+            for image in missing:
+                self.result_cache.add(image, image.calc.results)
+        return results
+
+    def _run_stream(self, pool: Optional[CalculatorPool] = None) -> None:
+        """
+        Read, evaluate and write structures from `struct_path` in chunks.
+
+        After each chunk is written, the number of completed structures and the size
+        of the output file are saved to a checkpoint file, which is used to discard
+        any partially written chunk when resuming. The checkpoint is kept once all
+        structures are complete, so resuming a complete calculation does nothing.
+
+        Parameters
+        ----------
+        pool : Optional[CalculatorPool]
+            Pool of worker processes to evaluate structures. Default is None.
+
+        Raises
+        ------
+        FileNotFoundError
+            If resuming with an output file, but no checkpoint file.
+        """
+        filename = Path(self.write_kwargs["filename"])
+        checkpoint = filename.with_name(f"{filename.stem}-checkpoint.yml")
+
+        n_frames = 0
+        if self.resume and checkpoint.exists() and filename.exists():
+            with open(checkpoint, encoding="utf8") as file:
+                state = yaml.safe_load(file)
+            n_frames = state["frames"]
+            if state.get("completed", False):
+                if self.logger:
+                    self.logger.info("All %s structures already completed", n_frames)
+                return
+            with open(filename, "r+b") as file:
+                file.truncate(state["offset"])
+            if self.logger:
+                self.logger.info("Resuming after %s structures", n_frames)
+        elif self.resume and filename.exists():
+            # The output may be complete, or may include a partially written chunk
+            raise FileNotFoundError(
+                f"Cannot resume writing {filename} without checkpoint {checkpoint}"
+            )
+        else:
+            filename.unlink(missing_ok=True)
+            checkpoint.unlink(missing_ok=True)
+
+        # Reuse the calculator attached to the first structure
+        calc = self.struct.calc
+        read_kwargs = self.read_kwargs | {"index": self.stream_index}
+        images = islice(iread(self.struct_path, **read_kwargs), n_frames, None)
+
+        while chunk := list(islice(images, self.chunk_size)):
+            for image in chunk:
+                image.calc = SharedCalculator(calc)
+            self._calc_structs(chunk, pool)
+
+            output_structs(
+                chunk,
+                struct_path=self.struct_path,
+                write_results=True,
+                properties=self.properties,
+                write_kwargs=self.write_kwargs | {"append": True},
+            )
+
+            n_frames += len(chunk)
+            _write_checkpoint(checkpoint, n_frames, filename.stat().st_size)
+            if self.logger:
+                self.logger.info("Completed %s structures", n_frames)
+
+        if filename.exists():
+            _write_checkpoint(
+                checkpoint, n_frames, filename.stat().st_size, completed=True
+            )
 
     def run(self) -> CalcResults:
         """
@@ -311,23 +594,37 @@ class SinglePoint(BaseCalculation):
             Dictionary of calculated results, with keys from `properties`.
         """
         self.results = {}
+        self.timings = {"calculate": 0.0}
+        if "hessian" in self.properties:
+            self.timings["hessian"] = 0.0
 
         if self.logger:
             self.logger.info("Starting single point calculation")
         if self.tracker:
             self.tracker.start_task("Single point")
 
-        if "energy" in self.properties:
-            self.results["energy"] = self._get_potential_energy()
-        if "forces" in self.properties:
-            self.results["forces"] = self._get_forces()
-        if "stress" in self.properties:
-            self.results["stress"] = self._get_stress()
-        if "hessian" in self.properties:
-            self.results["hessian"] = self._get_hessian()
+        if self.n_workers > 1 and (self.stream or isinstance(self.struct, Sequence)):
+            pool_context = self._calculator_pool()
+        else:
+            pool_context = nullcontext()
+
+        with pool_context as pool:
+            if self.stream:
+                self._run_stream(pool)
+            elif isinstance(self.struct, Sequence):
+                struct_results = self._calc_structs(self.struct, pool)
+                self.results = {
+                    prop: [results[prop] for results in struct_results]
+                    for prop in ("energy", "forces", "stress", "hessian")
+                    if prop in self.properties
+                }
+            else:
+                self.results = self._calc_structs([self.struct])[0]
 
         if self.logger:
             self.logger.info("Single point calculation complete")
+            for name, duration in self.timings.items():
+                self.logger.info("Time spent on %s: %.3f s", name, duration)
         if self.tracker:
             emissions = self.tracker.stop_task().emissions
             if isinstance(self.struct, Sequence):
@@ -337,12 +634,38 @@ class SinglePoint(BaseCalculation):
                 self.struct.info["emissions"] = emissions
             self.tracker.stop()
 
-        output_structs(
-            self.struct,
-            struct_path=self.struct_path,
-            write_results=self.write_results,
-            properties=self.properties,
-            write_kwargs=self.write_kwargs,
-        )
+        if not self.stream:
+            output_structs(
+                self.struct,
+                struct_path=self.struct_path,
+                write_results=self.write_results,
+                properties=self.properties,
+                write_kwargs=self.write_kwargs,
+            )
 
         return self.results
+
+
+def _write_checkpoint(
+    checkpoint: Path, frames: int, offset: int, completed: bool = False
+) -> None:
+    """
+    Replace a streaming checkpoint in one step, so it is never partially written.
+
+    Parameters
+    ----------
+    checkpoint : Path
+        Path of checkpoint file.
+    frames : int
+        Number of structures written.
+    offset : int
+        Size of the output file after the structures were written, in bytes.
+    completed : bool
+        Whether all structures have been written. Default is False.
+    """
+    tmp_checkpoint = checkpoint.with_suffix(".tmp")
+    with open(tmp_checkpoint, "w", encoding="utf8") as file:
+        yaml.safe_dump(
+            {"frames": frames, "offset": offset, "completed": completed}, file
+        )
+    tmp_checkpoint.replace(checkpoint)
@@ -0,0 +1,63 @@
+"""Set up result cache commandline interface."""
+
+from pathlib import Path
+from typing import Annotated, Optional
+
+from typer import Option, Typer
+
+app = Typer()
+
+CacheDir = Annotated[
+    Optional[Path],
+    Option(
+        help="Directory of result cache. Default is ~/.cache/janus_core/results.",
+    ),
+]
+
+
+@app.command()
+def info(directory: CacheDir = None) -> None:
+    """
+    Print the location, number of entries and size of the result cache.
+
+    Parameters
+    ----------
+    directory : Optional[Path]
+        Directory of result cache. Default is `DEFAULT_CACHE_DIR`.
+    """
+    from janus_core.helpers.result_cache import DEFAULT_CACHE_DIR, ResultCache
+
+    summary = ResultCache(directory if directory else DEFAULT_CACHE_DIR).info()
+    print(f"Directory: {summary['directory']}")
+    print(f"Entries: {summary['entries']}")
+    print(f"Size: {summary['size']} bytes")
+
+
+@app.command()
+def prune(
+    directory: CacheDir = None,
+    max_size: Annotated[
+        int,
+        Option(
+            help=(
+                "Maximum total size of results to keep, in bytes. Least recently used "
+                "results are removed first. Default removes all results."
+            ),
+        ),
+    ] = 0,
+) -> None:
+    """
+    Remove least recently used results from the result cache.
+
+    Parameters
+    ----------
+    directory : Optional[Path]
+        Directory of result cache. Default is `DEFAULT_CACHE_DIR`.
+    max_size : int
+        Maximum total size of results to keep, in bytes. Default is 0, which removes
+        all results.
+    """
+    from janus_core.helpers.result_cache import DEFAULT_CACHE_DIR, ResultCache
+
+    removed = ResultCache(directory if directory else DEFAULT_CACHE_DIR).prune(max_size)
+    print(f"Removed {removed} entries")
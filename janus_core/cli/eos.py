@@ -14,6 +14,7 @@ from janus_core.cli.types import (
     MinimizeKwargs,
     ModelPath,
     ReadKwargsLast,
+    ResultCachePath,
     StructPath,
     Summary,
     WriteKwargs,
@@ -71,6 +72,41 @@ def eos(
             ),
         ),
     ] = None,
+    batch_size: Annotated[
+        Optional[int],
+        Option(
+            help=(
+                "Maximum number of generated structures to evaluate in each forward "
+                "pass, if supported by the MLIP. Default evaluates structures "
+                "individually."
+            ),
+        ),
+    ] = None,
+    n_workers: Annotated[
+        int,
+        Option(
+            help="Number of worker processes to evaluate generated structures with."
+        ),
+    ] = 1,
+    threads_per_worker: Annotated[
+        Optional[int],
+        Option(
+            help=(
+                "Number of PyTorch threads for each worker process. Default is the "
+                "number of CPUs divided by the number of workers."
+            ),
+        ),
+    ] = None,
+    warm_start: Annotated[
+        bool,
+        Option(
+            help=(
+                "Whether to start minimizing each generated structure from the "
+                "neighbouring minimized structure."
+            ),
+        ),
+    ] = False,
+    result_cache: ResultCachePath = None,
     log: LogPath = None,
     tracker: Annotated[
         bool, Option(help="Whether to save carbon emissions of calculation")
@@ -125,6 +161,21 @@ def eos(
     file_prefix : Optional[PathLike]
         Prefix for output filenames. Default is inferred from structure name, or
         chemical formula.
+    batch_size : Optional[int]
+        Maximum number of generated structures to evaluate in each forward pass, if
+        supported by the MLIP. Default is None, which evaluates structures
+        individually.
+    n_workers : int
+        Number of worker processes to evaluate generated structures with. Default is 1.
+    threads_per_worker : Optional[int]
+        Number of PyTorch threads for each worker process. Default is the number of
+        CPUs divided by `n_workers`.
+    warm_start : bool
+        Whether to start minimizing each generated structure from the neighbouring
+        minimized structure, if minimizing all structures. Default is False.
+    result_cache : Optional[Path]
+        Directory of cache to reuse calculated results from and store new results in.
+        Default is None, which does not cache results.
     log : Optional[Path]
         Path to write logs to. Default is inferred from the name of the structure file.
     tracker : bool
@@ -147,6 +198,7 @@ def eos(
         start_summary,
     )
     from janus_core.helpers.janus_types import EoSNames
+    from janus_core.helpers.result_cache import ResultCache
 
     # Check options from configuration file are all valid
     check_config(ctx)
@@ -192,6 +244,11 @@ def eos(
         "write_kwargs": write_kwargs,
         "plot_to_file": plot_to_file,
         "file_prefix": file_prefix,
+        "batch_size": batch_size,
+        "n_workers": n_workers,
+        "threads_per_worker": threads_per_worker,
+        "warm_start": warm_start,
+        "result_cache": ResultCache(result_cache) if result_cache else None,
     }
 
     # Initialise EoS
@@ -205,6 +262,7 @@ def eos(
 
     # Store inputs for yaml summary
     inputs = eos_kwargs.copy()
+    inputs["result_cache"] = result_cache
 
     # Add structure, MLIP information, and log to inputs
     save_struct_calc(
@@ -5,6 +5,7 @@ from typing import Annotated
 from typer import Exit, Option, Typer
 
 from janus_core import __version__
+from janus_core.cli.cache import app as cache_app
 from janus_core.cli.descriptors import descriptors
 from janus_core.cli.eos import eos
 from janus_core.cli.geomopt import geomopt
@@ -25,6 +26,7 @@ app.command(help="Calculate phonons and save results.")(phonons)
 app.command(help="Calculate equation of state.")(eos)
 app.command(help="Calculate MLIP descriptors.")(descriptors)
 app.command(help="Running training for an MLIP.")(train)
+app.add_typer(cache_app, name="cache", help="Inspect and prune cached results.")
 
 
 @app.callback(invoke_without_command=True, help="")
@@ -18,6 +18,7 @@ from janus_core.cli.types import (
     ReadKwargsLast,
     StructPath,
     Summary,
+    TrajKwargs,
     WriteKwargs,
 )
 from janus_core.cli.utils import yaml_converter_callback
@@ -140,6 +141,15 @@ def md(
         ),
     ] = None,
     stats_every: Annotated[int, Option(help="Frequency to output statistics.")] = 100,
+    stats_buffer_rows: Annotated[
+        int, Option(help="Maximum rows of statistics to buffer before writing.")
+    ] = 100,
+    stats_buffer_time: Annotated[
+        float, Option(help="Maximum time to buffer statistics before writing, in s.")
+    ] = 10.0,
+    write_queue_size: Annotated[
+        int, Option(help="Maximum structures waiting to be written in background.")
+    ] = 8,
     traj_file: Annotated[
         Optional[Path],
         Option(help="File to save trajectory. Default inferred from `file_prefix`."),
@@ -149,6 +159,16 @@ def md(
     traj_every: Annotated[
         int, Option(help="Frequency of steps to save trajectory.")
     ] = 100,
+    traj_format: Annotated[
+        Optional[str],
+        Option(
+            help=(
+                "Format to save trajectory in, 'extxyz' or 'hdf5'. Default is inferred "
+                "from `traj_file`."
+            ),
+        ),
+    ] = None,
+    traj_kwargs: TrajKwargs = None,
     temp_start: Annotated[
         Optional[float],
         Option(help="Temperature to start heating, in K."),
@@ -254,6 +274,15 @@ def md(
         File to save thermodynamical statistics. Default inferred from `file_prefix`.
     stats_every : int
         Frequency to output statistics. Default is 100.
+    stats_buffer_rows : int
+        Maximum number of rows of statistics to buffer before writing them to
+        `stats_file`. Default is 100.
+    stats_buffer_time : float
+        Maximum time, in seconds, to buffer statistics before writing them to
+        `stats_file`. Default is 10.0.
+    write_queue_size : int
+        Maximum number of structures waiting to be written by a background thread.
+        Default is 8.
     traj_file : Optional[PathLike]
         Trajectory file to save. Default inferred from `file_prefix`.
     traj_append : bool
@@ -262,6 +291,11 @@ def md(
         Step to start saving trajectory. Default is 0.
     traj_every : int
         Frequency of steps to save trajectory. Default is 100.
+    traj_format : Optional[str]
+        Format to save trajectory in, "extxyz" or "hdf5". Default is "hdf5" if
+        `traj_file` ends with ".h5" or ".hdf5", otherwise "extxyz".
+    traj_kwargs : Optional[dict[str, Any]]
+        Keyword arguments to pass to the HDF5 trajectory writer. Default is {}.
     temp_start : Optional[float]
         Temperature to start heating, in K. Default is None, which disables
         heating.
@@ -303,7 +337,7 @@ def md(
         set_read_kwargs_index,
         start_summary,
     )
-    from janus_core.helpers.janus_types import Ensembles
+    from janus_core.helpers.janus_types import Ensembles, TrajFormats
 
     # Check options from configuration file are all valid
     check_config(ctx)
@@ -315,6 +349,7 @@ def md(
         ensemble_kwargs,
         write_kwargs,
         post_process_kwargs,
+        traj_kwargs,
     ] = parse_typer_dicts(
         [
             read_kwargs,
@@ -323,12 +358,16 @@ def md(
             ensemble_kwargs,
             write_kwargs,
             post_process_kwargs,
+            traj_kwargs,
         ]
     )
 
     if ensemble not in get_args(Ensembles):
         raise ValueError(f"ensemble must be in {get_args(Ensembles)}")
 
+    if traj_format is not None and traj_format not in get_args(TrajFormats):
+        raise ValueError(f"traj_format must be in {get_args(TrajFormats)}")
+
     # Read only first structure by default and ensure only one image is read
     set_read_kwargs_index(read_kwargs)
 
@@ -372,10 +411,15 @@ def md(
         "final_file": final_file,
         "stats_file": stats_file,
         "stats_every": stats_every,
+        "stats_buffer_rows": stats_buffer_rows,
+        "stats_buffer_time": stats_buffer_time,
+        "write_queue_size": write_queue_size,
         "traj_file": traj_file,
         "traj_append": traj_append,
         "traj_start": traj_start,
         "traj_every": traj_every,
+        "traj_format": traj_format,
+        "traj_kwargs": traj_kwargs,
         "temp_start": temp_start,
         "temp_end": temp_end,
         "temp_step": temp_step,
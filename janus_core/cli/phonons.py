@@ -14,6 +14,7 @@ from janus_core.cli.types import (
     MinimizeKwargs,
     ModelPath,
     ReadKwargsLast,
+    ResultCachePath,
     StructPath,
     Summary,
 )
@@ -99,6 +100,41 @@ def phonons(
             ),
         ),
     ] = None,
+    batch_size: Annotated[
+        Optional[int],
+        Option(
+            help=(
+                "Maximum number of displaced supercells to evaluate in each forward "
+                "pass, if supported by the MLIP. Default evaluates supercells "
+                "individually."
+            ),
+        ),
+    ] = None,
+    n_workers: Annotated[
+        int,
+        Option(
+            help="Number of worker processes to evaluate displaced supercells with."
+        ),
+    ] = 1,
+    threads_per_worker: Annotated[
+        Optional[int],
+        Option(
+            help=(
+                "Number of PyTorch threads for each worker process. Default is the "
+                "number of CPUs divided by the number of workers."
+            ),
+        ),
+    ] = None,
+    checkpoint: Annotated[
+        bool,
+        Option(
+            help=(
+                "Whether to save forces on each displaced supercell as they are "
+                "calculated, and reuse saved forces when restarting."
+            ),
+        ),
+    ] = False,
+    result_cache: ResultCachePath = None,
     log: LogPath = None,
     tracker: Annotated[
         bool, Option(help="Whether to save carbon emissions of calculation")
@@ -168,6 +204,21 @@ def phonons(
     file_prefix : Optional[PathLike]
         Prefix for output filenames. Default is inferred from structure name, or
         chemical formula.
+    batch_size : Optional[int]
+        Maximum number of displaced supercells to evaluate in each forward pass, if
+        supported by the MLIP. Default is None, which evaluates supercells
+        individually.
+    n_workers : int
+        Number of worker processes to evaluate displaced supercells with. Default is 1.
+    threads_per_worker : Optional[int]
+        Number of PyTorch threads for each worker process. Default is the number of
+        CPUs divided by `n_workers`.
+    checkpoint : bool
+        Whether to save forces on each displaced supercell as they are calculated, and
+        reuse saved forces when restarting. Default is False.
+    result_cache : Optional[Path]
+        Directory of cache to reuse calculated results from and store new results in.
+        Default is None, which does not cache results.
     log : Optional[Path]
         Path to write logs to. Default is inferred from the name of the structure file.
     tracker : bool
@@ -190,6 +241,7 @@ def phonons(
         set_read_kwargs_index,
         start_summary,
     )
+    from janus_core.helpers.result_cache import ResultCache
 
     # Check options from configuration file are all valid
     check_config(ctx)
@@ -247,6 +299,11 @@ def phonons(
         "write_full": write_full,
         "file_prefix": file_prefix,
         "enable_progress_bar": True,
+        "batch_size": batch_size,
+        "n_workers": n_workers,
+        "threads_per_worker": threads_per_worker,
+        "checkpoint": checkpoint,
+        "result_cache": ResultCache(result_cache) if result_cache else None,
     }
 
     # Initialise phonons
@@ -258,6 +315,7 @@ def phonons(
 
     # Store inputs for yaml summary
     inputs = phonons_kwargs.copy()
+    inputs["result_cache"] = result_cache
 
     # Add structure, MLIP information, and log to inputs
     save_struct_calc(
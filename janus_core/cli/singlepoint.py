@@ -13,6 +13,7 @@ from janus_core.cli.types import (
     LogPath,
     ModelPath,
     ReadKwargsAll,
+    ResultCachePath,
     StructPath,
     Summary,
     WriteKwargs,
@@ -49,9 +50,47 @@ def singlepoint(
             ),
         ),
     ] = None,
+    batch_size: Annotated[
+        Optional[int],
+        Option(
+            help=(
+                "Maximum number of structures to evaluate in each forward pass, if "
+                "supported by the MLIP. Default evaluates structures individually."
+            ),
+        ),
+    ] = None,
+    stream: Annotated[
+        bool,
+        Option(
+            help=(
+                "Whether to read, evaluate and write structures in chunks, rather than "
+                "reading all structures into memory."
+            ),
+        ),
+    ] = False,
+    chunk_size: Annotated[
+        int, Option(help="Number of structures to evaluate at a time if streaming.")
+    ] = 100,
+    resume: Annotated[
+        bool,
+        Option(help="Whether to resume streaming from the last completed chunk."),
+    ] = False,
+    n_workers: Annotated[
+        int, Option(help="Number of worker processes to evaluate structures with.")
+    ] = 1,
+    threads_per_worker: Annotated[
+        Optional[int],
+        Option(
+            help=(
+                "Number of PyTorch threads for each worker process. Default is the "
+                "number of CPUs divided by the number of workers."
+            ),
+        ),
+    ] = None,
     read_kwargs: ReadKwargsAll = None,
     calc_kwargs: CalcKwargs = None,
     write_kwargs: WriteKwargs = None,
+    result_cache: ResultCachePath = None,
     log: LogPath = None,
     tracker: Annotated[
         bool, Option(help="Whether to save carbon emissions of calculation")
@@ -79,6 +118,21 @@ def singlepoint(
     out : Optional[Path]
         Path to save structure with calculated results. Default is inferred from name
         of the structure file.
+    batch_size : Optional[int]
+        Maximum number of structures to evaluate in each forward pass, if supported by
+        the MLIP. Default is None, which evaluates structures individually.
+    stream : bool
+        Whether to read, evaluate and write structures in chunks, rather than reading
+        all structures into memory. Default is False.
+    chunk_size : int
+        Number of structures to evaluate at a time if streaming. Default is 100.
+    resume : bool
+        Whether to resume streaming from the last completed chunk. Default is False.
+    n_workers : int
+        Number of worker processes to evaluate structures with. Default is 1.
+    threads_per_worker : Optional[int]
+        Number of PyTorch threads for each worker process. Default is the number of
+        CPUs divided by `n_workers`.
     read_kwargs : Optional[dict[str, Any]]
         Keyword arguments to pass to ase.io.read. By default,
             read_kwargs["index"] is ":".
@@ -86,6 +140,9 @@ def singlepoint(
         Keyword arguments to pass to the selected calculator. Default is {}.
     write_kwargs : Optional[dict[str, Any]]
         Keyword arguments to pass to ase.io.write when saving results. Default is {}.
+    result_cache : Optional[Path]
+        Directory of cache to reuse calculated results from and store new results in.
+        Default is None, which does not cache results.
     log : Optional[Path]
         Path to write logs to. Default is inferred from the name of the structure file.
     tracker : bool
@@ -106,6 +163,7 @@ def singlepoint(
         save_struct_calc,
         start_summary,
     )
+    from janus_core.helpers.result_cache import ResultCache
 
     # Check options from configuration file are all valid
     check_config(ctx)
@@ -129,6 +187,12 @@ def singlepoint(
         "properties": properties,
         "write_kwargs": write_kwargs,
         "write_results": True,
+        "batch_size": batch_size,
+        "stream": stream,
+        "chunk_size": chunk_size,
+        "resume": resume,
+        "n_workers": n_workers,
+        "threads_per_worker": threads_per_worker,
         "arch": arch,
         "device": device,
         "model_path": model_path,
@@ -137,6 +201,7 @@ def singlepoint(
         "attach_logger": True,
         "log_kwargs": log_kwargs,
         "track_carbon": tracker,
+        "result_cache": ResultCache(result_cache) if result_cache else None,
     }
 
     # Initialise singlepoint structure and calculator
@@ -150,6 +215,7 @@ def singlepoint(
 
     # Store inputs for yaml summary
     inputs = singlepoint_kwargs.copy()
+    inputs["result_cache"] = result_cache
 
     # Add structure, MLIP information, and log to inputs
     save_struct_calc(
@@ -173,6 +173,21 @@ EnsembleKwargs = Annotated[
     ),
 ]
 
+TrajKwargs = Annotated[
+    Optional[TyperDict],
+    Option(
+        parser=parse_dict_class,
+        help=(
+            """
+            Keyword arguments to pass to the HDF5 trajectory writer, such as float32
+            and compression. Must be passed as a dictionary wrapped in quotes, e.g.
+            "{'key' : value}".
+            """
+        ),
+        metavar="DICT",
+    ),
+]
+
 PostProcessKwargs = Annotated[
     Optional[TyperDict],
     Option(
@@ -187,6 +202,16 @@ PostProcessKwargs = Annotated[
     ),
 ]
 
+ResultCachePath = Annotated[
+    Optional[Path],
+    Option(
+        help=(
+            "Directory of cache to reuse calculated results from and store new results "
+            "in. Default is not to cache results."
+        )
+    ),
+]
+
 LogPath = Annotated[
     Optional[Path],
     Option(
@@ -0,0 +1,113 @@
+"""Run output tasks in a background thread."""
+
+from collections.abc import Callable
+from queue import Queue
+from threading import Thread
+from typing import Optional
+
+
+class BackgroundWriter:
+    """
+    Run output tasks in order in a background thread, using a bounded queue.
+
+    Submitting a task blocks while `max_pending` tasks are waiting to be run, so
+    output cannot fall arbitrarily far behind. If a task raises an exception, later
+    tasks are not run, and the exception is raised by the next call to `submit`,
+    `flush` or `close`.
+
+    Parameters
+    ----------
+    max_pending : int
+        Maximum number of tasks waiting to be run. Default is 8.
+    """
+
+    def __init__(self, max_pending: int = 8) -> None:
+        """
+        Initialise writer, starting the background thread.
+
+        Parameters
+        ----------
+        max_pending : int
+            Maximum number of tasks waiting to be run. Default is 8.
+        """
+        if max_pending < 1:
+            raise ValueError("`max_pending` must be at least 1")
+
+        self._queue: Queue[Optional[tuple]] = Queue(maxsize=max_pending)
+        self._error: Optional[Exception] = None
+        # Daemon thread so an unclosed writer cannot prevent the interpreter exiting
+        self._thread = Thread(target=self._run, name="janus-writer", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "BackgroundWriter":
+        """
+        Enter the context of the writer.
+
+        Returns
+        -------
+        BackgroundWriter
+            The writer.
+        """
+        return self
+
+    def __exit__(self, *args) -> None:
+        """
+        Run all submitted tasks and stop the thread when leaving the context.
+
+        Parameters
+        ----------
+        *args
+            Exception information, if raised.
+        """
+        self.close()
+
+    def _run(self) -> None:
+        """Run submitted tasks until the writer is closed."""
+        while True:
+            task = self._queue.get()
+            try:
+                if task is None:
+                    return
+                if self._error is None:
+                    func, args, kwargs = task
+                    func(*args, **kwargs)
+            except Exception as err:
+                self._error = err
+            finally:
+                self._queue.task_done()
+
+    def _raise_error(self) -> None:
+        """Raise the exception from a failed task, if any."""
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def submit(self, func: Callable, *args, **kwargs) -> None:
+        """
+        Submit a task to run in the background thread.
+
+        Parameters
+        ----------
+        func : Callable
+            Function to run.
+        *args
+            Arguments to pass to `func`.
+        **kwargs
+            Keyword arguments to pass to `func`.
+        """
+        self._raise_error()
+        if not self._thread.is_alive():
+            raise RuntimeError("Unable to submit task to closed writer")
+        self._queue.put((func, args, kwargs))
+
+    def flush(self) -> None:
+        """Wait for all submitted tasks to be run."""
+        self._queue.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        """Run all submitted tasks and stop the background thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._raise_error()
@@ -1,17 +1,24 @@
-"""Module to correlate scalar data on-the-fly."""
+"""Module to correlate scalar and array data on-the-fly."""
 
 from collections.abc import Iterable
-from typing import Union
+from typing import Optional, Union
 
 from ase import Atoms
 import numpy as np
+from numpy import float64
+from numpy.typing import ArrayLike, NDArray
 
 from janus_core.helpers.janus_types import Observable
+from janus_core.helpers.observables import ObservableCache, SharedObservable
 
 
 class Correlator:
     """
-    Correlate scalar real values, <ab>.
+    Correlate real scalar or array values, <ab>.
+
+    For array values, such as a component of the velocity of each atom, the
+    products of corresponding elements are averaged at each lag, so only the shift
+    registers scale with the size of the arrays.
 
     Parameters
     ----------
@@ -40,104 +47,105 @@ class Correlator:
         self._points = points
         self._averaging = averaging
         self._max_block_used = 0
-        self._min_dist = self._points / self._averaging
+        self._min_dist = self._points // self._averaging
 
-        self._accumulator = np.zeros((self._blocks, 2))
         self._count_accumulated = np.zeros(self._blocks, dtype=int)
+        self._count_inserted = np.zeros(self._blocks, dtype=int)
         self._shift_index = np.zeros(self._blocks, dtype=int)
-        self._shift = np.zeros((self._blocks, self._points, 2))
-        self._shift_not_null = np.zeros((self._blocks, self._points), dtype=bool)
         self._correlation = np.zeros((self._blocks, self._points))
         self._count_correlated = np.zeros((self._blocks, self._points), dtype=int)
 
-    def update(self, a: float, b: float) -> None:
+        # Allocated on first update, when the shape of values is known
+        self._shape: Optional[tuple[int, ...]] = None
+        self._accumulator: Optional[NDArray[float64]] = None
+        self._shift: Optional[NDArray[float64]] = None
+
+    def update(self, a: ArrayLike, b: ArrayLike) -> None:
         """
         Update the correlation, <ab>, with new values a and b.
 
         Parameters
         ----------
-        a : float
+        a : ArrayLike
             Newly observed value of left correland.
-        b : float
-            Newly observed value of right correland.
+        b : ArrayLike
+            Newly observed value of right correland, with the same shape as `a`.
         """
-        self._propagate(a, b, 0)
+        a, b = np.asarray(a, dtype=float64), np.asarray(b, dtype=float64)
+        shape = a.shape
+        if b.shape != shape:
+            raise ValueError(
+                f"Shapes of correlands must match, but got {shape} and {b.shape}"
+            )
+
+        if self._shape is None:
+            self._shape = shape
+            self._accumulator = np.zeros((self._blocks, 2, *shape))
+            # Shift registers are stored twice, so past values are contiguous slices
+            self._shift = np.zeros((self._blocks, 2 * self._points, 2, *shape))
+        elif shape != self._shape:
+            raise ValueError(
+                f"Shape of correlands changed from {self._shape} to {shape}"
+            )
+
+        block = 0
+        while block < self._blocks:
+            averages = self._propagate(a, b, block)
+            if averages is None:
+                return
+            a, b = averages
+            block += 1
 
-    def _propagate(self, a: float, b: float, block: int) -> None:
+    def _propagate(self, a: ArrayLike, b: ArrayLike, block: int) -> Optional[tuple]:
         """
-        Propagate update down block hierarchy.
+        Add values to a block in the hierarchy, correlating with its shift register.
 
         Parameters
         ----------
-        a : float
+        a : ArrayLike
             Newly observed value of left correland/average.
-        b : float
+        b : ArrayLike
             Newly observed value of right correland/average.
         block : int
             Block in the hierachy being updated.
-        """
-        if block == self._blocks:
-            return
 
-        shift = self._shift_index[block]
+        Returns
+        -------
+        Optional[tuple]
+            Averages of a and b to add to the next block, if the averaging window
+            is complete.
+        """
         self._max_block_used = max(self._max_block_used, block)
-        self._shift[block, shift, :] = a, b
-        self._accumulator[block, :] += a, b
-        self._shift_not_null[block, shift] = True
-        self._count_accumulated[block] += 1
-
-        if self._count_accumulated[block] == self._averaging:
-            self._propagate(
-                self._accumulator[block, 0] / self._averaging,
-                self._accumulator[block, 1] / self._averaging,
-                block + 1,
-            )
-            self._accumulator[block, :] = 0.0
-            self._count_accumulated[block] = 0
 
         i = self._shift_index[block]
-        if block == 0:
-            j = i
-            for point in range(self._points):
-                if self._shifts_valid(block, i, j):
-                    self._correlation[block, point] += (
-                        self._shift[block, i, 0] * self._shift[block, j, 1]
-                    )
-                    self._count_correlated[block, point] += 1
-                j -= 1
-                if j < 0:
-                    j += self._points
-        else:
-            for point in range(self._min_dist, self._points):
-                if j < 0:
-                    j = j + self._points
-                if self._shifts_valid(block, i, j):
-                    self._correlation[block, point] += (
-                        self._shift[block, i, 0] * self._shift[block, j, 1]
-                    )
-                    self._count_correlated[block, point] += 1
-                j = j - 1
-        self._shift_index[block] = (self._shift_index[block] + 1) % self._points
-
-    def _shifts_valid(self, block: int, p_i: int, p_j: int) -> bool:
-        """
-        Return True if the shift registers have data.
-
-        Parameters
-        ----------
-        block : int
-            Block to check the shift register of.
-        p_i : int
-            Index i in the shift (left correland).
-        p_j : int
-            Index j in the shift (right correland).
+        for index in (i, i + self._points):
+            self._shift[block, index, 0] = a
+            self._shift[block, index, 1] = b
+        self._count_inserted[block] += 1
+
+        # Values of b for lags 0, 1, ..., up to the number of values inserted
+        n_lags = min(self._count_inserted[block], self._points)
+        past = self._shift[block, i + self._points - n_lags + 1 : i + self._points + 1]
+        start = 0 if block == 0 else self._min_dist
+        if n_lags > start:
+            products = a * past[::-1, 1][start:]
+            self._correlation[block, start:n_lags] += products.reshape(
+                n_lags - start, -1
+            ).mean(axis=1)
+            self._count_correlated[block, start:n_lags] += 1
+
+        self._shift_index[block] = (i + 1) % self._points
+
+        self._accumulator[block, 0] += a
+        self._accumulator[block, 1] += b
+        self._count_accumulated[block] += 1
+        if self._count_accumulated[block] < self._averaging:
+            return None
 
-        Returns
-        -------
-        bool
-            Whether the shift indices have data.
-        """
-        return self._shift_not_null[block, p_i] and self._shift_not_null[block, p_j]
+        averages = tuple(self._accumulator[block] / self._averaging)
+        self._accumulator[block] = 0.0
+        self._count_accumulated[block] = 0
+        return averages
 
     def get(self) -> tuple[Iterable[float], Iterable[float]]:
         """
@@ -150,26 +158,19 @@ class Correlator:
         lags : Iterable[float]]
             The correlation lag times t'.
         """
-        correlation = np.zeros(self._points * self._blocks)
-        lags = np.zeros(self._points * self._blocks)
-
-        lag = 0
-        for i in range(self._points):
-            if self._count_correlated[0, i] > 0:
-                correlation[lag] = (
-                    self._correlation[0, i] / self._count_correlated[0, i]
-                )
-                lags[lag] = i
-                lag += 1
-        for k in range(1, self._max_block_used):
-            for i in range(self._min_dist, self._points):
-                if self._count_correlated[k, i] > 0:
-                    correlation[lag] = (
-                        self._correlation[k, i] / self._count_correlated[k, i]
-                    )
-                    lags[lag] = float(i) * float(self._averaging) ** k
-                    lag += 1
-        return (correlation[0:lag], lags[0:lag])
+        correlations = []
+        lags = []
+
+        points = np.arange(self._points)
+        for block in range(max(self._max_block_used, 1)):
+            start = 0 if block == 0 else self._min_dist
+            counts = self._count_correlated[block, start:]
+            used = counts > 0
+            correlations.append(self._correlation[block, start:][used] / counts[used])
+            lags.append(
+                points[start:][used].astype(float) * float(self._averaging) ** block
+            )
+        return (np.concatenate(correlations), np.concatenate(lags))
 
 
 class Correlation:
@@ -252,7 +253,7 @@ class Correlation:
         """
         return self._update_frequency
 
-    def update(self, atoms: Atoms) -> None:
+    def update(self, atoms: Atoms, cache: Optional[ObservableCache] = None) -> None:
         """
         Update a correlation.
 
@@ -260,10 +261,13 @@ class Correlation:
         ----------
         atoms : Atoms
             Atoms object to observe values from.
+        cache : Optional[ObservableCache]
+            Cache of quantities calculated from `atoms`, shared by built-in
+            observables. Default is None.
         """
         self._correlator.update(
-            self._get_a(atoms, *self._a_args, **self._a_kwargs),
-            self._get_b(atoms, *self._b_args, **self._b_kwargs),
+            _observe(atoms, cache, self._get_a, self._a_args, self._a_kwargs),
+            _observe(atoms, cache, self._get_b, self._b_args, self._b_kwargs),
         )
 
     def get(self) -> tuple[Iterable[float], Iterable[float]]:
@@ -289,3 +293,36 @@ class Correlation:
             String representation.
         """
         return self.name
+
+
+def _observe(
+    atoms: Atoms,
+    cache: Optional[ObservableCache],
+    getter: Observable,
+    args: tuple,
+    kwargs: dict,
+) -> ArrayLike:
+    """
+    Get the value of an observable, sharing quantities through a cache if supported.
+
+    Parameters
+    ----------
+    atoms : Atoms
+        Atoms object to observe values from.
+    cache : Optional[ObservableCache]
+        Cache of quantities calculated from `atoms`.
+    getter : Observable
+        Observable to get value of.
+    args : tuple
+        Positional arguments to pass to the getter.
+    kwargs : dict
+        Keyword arguments to pass to the getter.
+
+    Returns
+    -------
+    ArrayLike
+        Observed value.
+    """
+    if cache is not None and isinstance(getter, SharedObservable):
+        return getter(atoms, *args, cache=cache, **kwargs)
+    return getter(atoms, *args, **kwargs)
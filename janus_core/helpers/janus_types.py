@@ -18,7 +18,7 @@ from typing import (
 from ase import Atoms
 from ase.eos import EquationOfState
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import ArrayLike, NDArray
 
 # General
 
@@ -69,9 +69,18 @@ class PostProcessKwargs(TypedDict, total=False):
     rdf_nbins: int
     rdf_elements: MaybeSequence[Union[str, int]]
     rdf_by_elements: bool
+    # Trajectory frames to compute RDF from after dynamics
     rdf_start: int
     rdf_stop: Optional[int]
     rdf_step: int
+    # Accumulate RDF every `rdf_every` MD steps during dynamics, from
+    # `rdf_start_step` until before `rdf_stop_step`, instead of using trajectory
+    # frames. When restarting, the RDF is instead computed from the trajectory frames
+    # saved at the same steps
+    rdf_every: Optional[int]
+    rdf_start_step: int
+    rdf_stop_step: Optional[int]
+    rdf_n_workers: int
     rdf_output_file: Optional[str]
     # VAF
     vaf_compute: bool
@@ -81,16 +90,26 @@ class PostProcessKwargs(TypedDict, total=False):
     vaf_start: int
     vaf_stop: Optional[int]
     vaf_step: int
+    vaf_max_lag: Optional[int]
     vaf_output_file: Optional[PathLike]
+    # MSD
+    msd_compute: bool
+    msd_max_lag: int
+    msd_unwrap: bool
+    msd_atoms: Sequence[Sequence[int]]
+    msd_start: int
+    msd_stop: Optional[int]
+    msd_step: int
+    msd_output_file: Optional[PathLike]
 
 
 @runtime_checkable
 class Observable(Protocol):
     """Signature for correlation observable getter."""
 
-    def __call__(self, atoms: Atoms, *args, **kwargs) -> float:
+    def __call__(self, atoms: Atoms, *args, **kwargs) -> Union[float, ArrayLike]:
         """
-        Call the getter.
+        Call the getter, returning a scalar or array.
 
         Parameters
         ----------
@@ -142,6 +161,7 @@ Architectures = Literal[
 ]
 Devices = Literal["cpu", "cuda", "mps", "xpu"]
 Ensembles = Literal["nph", "npt", "nve", "nvt", "nvt-nh"]
+TrajFormats = Literal["extxyz", "hdf5"]
 Properties = Literal["energy", "stress", "forces", "hessian"]
 PhononCalcs = Literal["bands", "dos", "pdos", "thermal"]
 
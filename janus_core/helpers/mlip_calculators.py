@@ -8,15 +8,319 @@ Similar in spirit to matcalc and quacc approaches
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Hashable, Sequence
+from copy import copy
+from hashlib import sha256
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, get_args
 
 from janus_core.helpers.janus_types import Architectures, Devices, PathLike
 
 if TYPE_CHECKING:
+    from ase import Atoms
     from ase.calculators.calculator import Calculator
     import torch
 
+# Default precision set for each architecture when loading models
+DEFAULT_DTYPES = {
+    "mace": "float64",
+    "mace_mp": "float64",
+    "mace_off": "float64",
+    "m3gnet": "float32",
+    "chgnet": "float32",
+}
+
+
+class ModelCache:
+    """
+    Least recently used cache of configured MLIP calculators.
+
+    Calculators are stored by a key built from the architecture, model, device,
+    precision and remaining calculator keyword arguments, so that repeated requests for
+    the same model within a process only load the model from disk once.
+
+    Parameters
+    ----------
+    max_models : int
+        Maximum number of calculators to keep. Default is 4.
+    max_memory : Optional[int]
+        Maximum total size of cached model parameters and buffers, in bytes. Default is
+        None, which does not limit memory.
+    """
+
+    def __init__(self, *, max_models: int = 4, max_memory: int | None = None) -> None:
+        """
+        Initialise an empty cache.
+
+        Parameters
+        ----------
+        max_models : int
+            Maximum number of calculators to keep. Default is 4.
+        max_memory : Optional[int]
+            Maximum total size of cached model parameters and buffers, in bytes.
+            Default is None, which does not limit memory.
+        """
+        self.max_models = max_models
+        self.max_memory = max_memory
+        self._calculators: OrderedDict[Hashable, tuple[Calculator, int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """
+        Get number of cached calculators.
+
+        Returns
+        -------
+        int
+            Number of cached calculators.
+        """
+        return len(self._calculators)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """
+        Check whether a calculator is cached.
+
+        Parameters
+        ----------
+        key : Hashable
+            Key of calculator.
+
+        Returns
+        -------
+        bool
+            Whether a calculator with `key` is cached.
+        """
+        return key in self._calculators
+
+    @property
+    def memory(self) -> int:
+        """
+        Total estimated size of cached models, in bytes.
+
+        Returns
+        -------
+        int
+            Estimated memory used by cached models.
+        """
+        return sum(size for _, size in self._calculators.values())
+
+    def get(self, key: Hashable) -> Calculator | None:
+        """
+        Get cached calculator and mark it as most recently used.
+
+        Parameters
+        ----------
+        key : Hashable
+            Key of calculator.
+
+        Returns
+        -------
+        Optional[Calculator]
+            Cached calculator, or None if not cached.
+        """
+        if key not in self._calculators:
+            return None
+        self._calculators.move_to_end(key)
+        return self._calculators[key][0]
+
+    def add(self, key: Hashable, calculator: Calculator) -> None:
+        """
+        Add calculator to the cache, evicting least recently used calculators.
+
+        Calculators larger than `max_memory` are not cached.
+
+        Parameters
+        ----------
+        key : Hashable
+            Key of calculator.
+        calculator : Calculator
+            Calculator to cache.
+        """
+        size = _model_memory(calculator)
+        if self.max_models < 1 or (
+            self.max_memory is not None and size > self.max_memory
+        ):
+            return
+
+        self._calculators[key] = (calculator, size)
+        self._calculators.move_to_end(key)
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove least recently used calculators until within cache limits."""
+        while len(self._calculators) > self.max_models or (
+            self.max_memory is not None and self.memory > self.max_memory
+        ):
+            self._calculators.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached calculators."""
+        self._calculators.clear()
+
+
+MODEL_CACHE = ModelCache()
+
+
+def _find_modules(calculator: Calculator) -> list[torch.nn.Module]:
+    """
+    Find PyTorch models attached to a calculator.
+
+    Parameters
+    ----------
+    calculator : Calculator
+        Calculator to inspect.
+
+    Returns
+    -------
+    list[torch.nn.Module]
+        Models attached to the calculator, or any calculators it combines.
+    """
+    modules = {}
+    calcs = [calculator]
+    while calcs:
+        calc = calcs.pop()
+        # Include calculators combined with e.g. dispersion corrections
+        if hasattr(calc, "mixer"):
+            calcs.extend(calc.mixer.calcs)
+        for value in vars(calc).values():
+            values = value if isinstance(value, (list, tuple)) else (value,)
+            for item in values:
+                if callable(getattr(item, "parameters", None)) and callable(
+                    getattr(item, "buffers", None)
+                ):
+                    modules[id(item)] = item
+    return list(modules.values())
+
+
+def _model_memory(calculator: Calculator) -> int:
+    """
+    Estimate memory used by PyTorch models attached to a calculator.
+
+    Parameters
+    ----------
+    calculator : Calculator
+        Calculator to inspect.
+
+    Returns
+    -------
+    int
+        Total size of model parameters and buffers, in bytes.
+    """
+    return sum(
+        tensor.numel() * tensor.element_size()
+        for module in _find_modules(calculator)
+        for tensors in (module.parameters(), module.buffers())
+        for tensor in tensors
+    )
+
+
+def model_checksum(calculator: Calculator) -> str:
+    """
+    Calculate a checksum identifying the model used by a calculator.
+
+    The checksum includes the calculator name and parameters, and the names, precision
+    and values of the parameters and buffers of any attached PyTorch models.
+
+    Parameters
+    ----------
+    calculator : Calculator
+        Calculator to identify.
+
+    Returns
+    -------
+    str
+        Hexadecimal SHA-256 checksum.
+    """
+    checksum = sha256()
+    checksum.update(calculator.name.encode())
+    checksum.update(repr(sorted(calculator.parameters.items())).encode())
+
+    modules = _find_modules(calculator)
+    if modules:
+        import torch
+
+    for module in modules:
+        for name, tensor in module.state_dict().items():
+            checksum.update(f"{name}:{tensor.dtype}".encode())
+            # View as bytes to support all precisions
+            tensor = tensor.detach().cpu().contiguous().flatten()
+            checksum.update(tensor.view(torch.uint8).numpy().tobytes())
+    return checksum.hexdigest()
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Convert nested containers of keyword arguments into a hashable form.
+
+    Parameters
+    ----------
+    value : Any
+        Value to convert.
+
+    Returns
+    -------
+    Hashable
+        Hashable representation of `value`.
+
+    Raises
+    ------
+    TypeError
+        If `value` cannot be converted.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(val)) for key, val in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(val) for val in value)
+    if isinstance(value, Path):
+        return str(value.expanduser().resolve())
+    if isinstance(value, (str, int, float, bool, type(None))):
+        return value
+    raise TypeError(f"Unable to cache calculator with argument {value!r}")
+
+
+def _cache_key(
+    arch: Architectures,
+    device: Devices,
+    model_path: PathLike | torch.nn.Module | None,
+    kwargs: dict[str, Any],
+) -> Hashable | None:
+    """
+    Build the model cache key for a calculator.
+
+    Parameters
+    ----------
+    arch : Architectures
+        MLIP architecture.
+    device : Devices
+        Device to run calculator on.
+    model_path : Optional[PathLike | torch.nn.Module]
+        Path to MLIP file, model name, or loaded model.
+    kwargs : dict[str, Any]
+        Additional keyword arguments passed to the selected calculator.
+
+    Returns
+    -------
+    Optional[Hashable]
+        Key for the calculator, or None if the calculator cannot be cached.
+    """
+    # Models that are already loaded are not cached
+    if model_path is not None and not isinstance(model_path, (Path, str)):
+        return None
+
+    dtype = kwargs.get("default_dtype", DEFAULT_DTYPES.get(arch))
+    try:
+        return (
+            arch,
+            _freeze(model_path),
+            device,
+            dtype,
+            _freeze(
+                {key: val for key, val in kwargs.items() if key != "default_dtype"}
+            ),
+        )
+    except TypeError:
+        return None
+
 
 def _set_model_path(
     model_path: PathLike | None = None,
@@ -70,11 +374,18 @@ def choose_calculator(
     arch: Architectures = "mace",
     device: Devices = "cpu",
     model_path: PathLike | None = None,
+    *,
+    cache: bool = True,
     **kwargs,
 ) -> Calculator:
     """
     Choose MLIP calculator to configure.
 
+    Calculators are stored in `MODEL_CACHE`, so that models with the same
+    architecture, model path, device, precision and keyword arguments are only loaded
+    once per process. Each call returns a separate (shallow) copy of the cached
+    calculator, sharing the loaded model.
+
     Parameters
     ----------
     arch : Architectures
@@ -83,6 +394,8 @@ def choose_calculator(
         Device to run calculator on. Default is "cpu".
     model_path : Optional[PathLike]
         Path to MLIP file.
+    cache : bool
+        Whether to reuse previously loaded models from `MODEL_CACHE`. Default is True.
     **kwargs
         Additional keyword arguments passed to the selected calculator.
 
@@ -103,6 +416,15 @@ def choose_calculator(
     if device not in get_args(Devices):
         raise ValueError(f"`device` must be one of: {get_args(Devices)}")
 
+    key = _cache_key(arch, device, model_path, kwargs) if cache else None
+    if key is not None and (calculator := MODEL_CACHE.get(key)) is not None:
+        # Loading models may change the default precision, so ensure this is restored
+        if (dtype := key[3]) is not None:
+            import torch
+
+            torch.set_default_dtype(getattr(torch, dtype))
+        return copy(calculator)
+
     if arch == "mace":
         from mace import __version__
         from mace.calculators import MACECalculator
@@ -230,4 +552,177 @@ def choose_calculator(
     calculator.parameters["version"] = __version__
     calculator.parameters["arch"] = arch
 
+    if key is not None:
+        MODEL_CACHE.add(key, calculator)
+        return copy(calculator)
     return calculator
+
+
+def supports_batching(calculator: Calculator) -> bool:
+    """
+    Check whether a calculator can evaluate multiple structures in one forward pass.
+
+    Currently only (single or committee) MACE models predicting energies, without
+    compilation, are supported.
+
+    Parameters
+    ----------
+    calculator : Calculator
+        Calculator to check.
+
+    Returns
+    -------
+    bool
+        Whether `batch_calculate` can be used with `calculator`.
+    """
+    return (
+        getattr(calculator, "model_type", None) == "MACE"
+        and not getattr(calculator, "use_compile", False)
+        and all(
+            hasattr(calculator, attr)
+            for attr in ("models", "z_table", "r_max", "charges_key")
+        )
+    )
+
+
+def _evaluate_batch(
+    calculator: Calculator, structs: Sequence[Atoms]
+) -> list[dict[str, Any]]:
+    """
+    Evaluate a single batch of structures with a MACE calculator.
+
+    Parameters
+    ----------
+    calculator : Calculator
+        MACE calculator to evaluate structures with.
+    structs : Sequence[Atoms]
+        Structures to pack into a single batch.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        Calculated results for each structure, in the same form as
+        `calculator.results`.
+    """
+    from ase.stress import full_3x3_to_voigt_6_stress
+    from mace import data
+    from mace.tools import torch_geometric
+    import torch
+
+    dataset = [
+        data.AtomicData.from_config(
+            data.config_from_atoms(struct, charges_key=calculator.charges_key),
+            z_table=calculator.z_table,
+            cutoff=calculator.r_max,
+        )
+        for struct in structs
+    ]
+    data_loader = torch_geometric.dataloader.DataLoader(
+        dataset=dataset, batch_size=len(dataset), shuffle=False, drop_last=False
+    )
+    batch_base = next(iter(data_loader)).to(calculator.device)
+
+    energies, node_energies, forces, stresses = [], [], [], []
+    for model in calculator.models:
+        batch = batch_base.clone()
+        node_e0 = model.atomic_energies_fn(batch["node_attrs"])
+        out = model(batch.to_dict(), compute_stress=True, training=False)
+        energies.append(out["energy"].detach())
+        node_energies.append((out["node_energy"] - node_e0).detach())
+        forces.append(out["forces"].detach())
+        if out["stress"] is not None:
+            stresses.append(out["stress"].detach())
+
+    energy_units = calculator.energy_units_to_eV
+    length_units = calculator.length_units_to_A
+    energies = torch.stack(energies)
+    node_energies = torch.stack(node_energies).mean(dim=0).cpu().numpy()
+    forces = torch.stack(forces)
+    mean_forces = forces.mean(dim=0).cpu().numpy() * energy_units / length_units
+    if stresses:
+        stresses = torch.stack(stresses)
+        mean_stresses = (
+            stresses.mean(dim=0).cpu().numpy() * energy_units / length_units**3
+        )
+
+    ptr = batch_base["ptr"].cpu().numpy()
+    results = []
+    for i in range(len(structs)):
+        nodes = slice(ptr[i], ptr[i + 1])
+        result = {
+            "energy": energies[:, i].mean().cpu().item() * energy_units,
+            "node_energy": node_energies[nodes],
+            "forces": mean_forces[nodes],
+        }
+        result["free_energy"] = result["energy"]
+        if len(calculator.models) > 1:
+            result["energies"] = energies[:, i].cpu().numpy() * energy_units
+            result["energy_var"] = (
+                torch.var(energies[:, i], unbiased=False).cpu().item() * energy_units
+            )
+            result["forces_comm"] = (
+                forces[:, nodes].cpu().numpy() * energy_units / length_units
+            )
+        if stresses:
+            result["stress"] = full_3x3_to_voigt_6_stress(mean_stresses[i])
+            if len(calculator.models) > 1:
+                result["stress_var"] = full_3x3_to_voigt_6_stress(
+                    torch.var(stresses[:, i], dim=0, unbiased=False).cpu().numpy()
+                    * energy_units
+                    / length_units**3
+                )
+        results.append(result)
+    return results
+
+
+def batch_calculate(
+    calculator: Calculator,
+    structs: Sequence[Atoms],
+    batch_size: int = 8,
+) -> list[dict[str, Any]]:
+    """
+    Calculate energies, forces and stresses for structures in batches.
+
+    Structures are packed into graph batches of up to `batch_size` structures, with
+    energy, forces and stress obtained from a single forward pass of each model. If a
+    batch runs out of memory, the batch size is halved and the batch retried.
+
+    Parameters
+    ----------
+    calculator : Calculator
+        Calculator to evaluate structures with. Must satisfy `supports_batching`.
+    structs : Sequence[Atoms]
+        Structures to evaluate.
+    batch_size : int
+        Maximum number of structures in each forward pass. Default is 8.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        Calculated results for each structure, in the same order as `structs`.
+
+    Raises
+    ------
+    ValueError
+        If `calculator` does not support batched evaluation, or `batch_size` is
+        less than 1.
+    """
+    if not supports_batching(calculator):
+        raise ValueError("Calculator does not support batched evaluation")
+    if batch_size < 1:
+        raise ValueError("`batch_size` must be at least 1")
+
+    results = []
+    start = 0
+    while start < len(structs):
+        chunk = structs[start : start + batch_size]
+        try:
+            results.extend(_evaluate_batch(calculator, chunk))
+        except RuntimeError as err:
+            # Retry smaller batches if memory is exhausted
+            if "out of memory" not in str(err).lower() or batch_size == 1:
+                raise
+            batch_size = max(batch_size // 2, 1)
+            continue
+        start += len(chunk)
+    return results
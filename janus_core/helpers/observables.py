@@ -1,9 +1,215 @@
 """Module for built-in correlation observables."""
 
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Hashable, Sequence
+from typing import Any, Optional, Union
+
 from ase import Atoms, units
+from ase.data import atomic_numbers
+import numpy as np
+from numpy import float64
+from numpy.typing import NDArray
+
+
+class ObservableCache:
+    """
+    Store quantities calculated from a structure, shared between observables.
+
+    A new cache should be used for each step, so that, for example, the stress
+    tensor is calculated once for all correlations of its components.
+    """
+
+    def __init__(self) -> None:
+        """Initialise an empty cache."""
+        self._values: dict[Hashable, Any] = {}
+
+    def get(self, key: Hashable, getter: Callable[[], Any]) -> Any:
+        """
+        Get a quantity, calculating it only if it has not been stored.
+
+        Parameters
+        ----------
+        key : Hashable
+            Key identifying the quantity, including any options used to calculate
+            it.
+        getter : Callable[[], Any]
+            Function to calculate the quantity.
+
+        Returns
+        -------
+        Any
+            Stored or calculated quantity.
+        """
+        if key not in self._values:
+            self._values[key] = getter()
+        return self._values[key]
 
 
-class Stress:
+class ThermoSnapshot(ObservableCache):
+    """
+    Thermodynamic quantities of a structure at one step, each calculated once.
+
+    Quantities are stored with the same keys as observables, so the stress tensor,
+    for example, is shared with `Stress` observables using the same cache.
+
+    Parameters
+    ----------
+    atoms : Atoms
+        Structure to calculate quantities from.
+    """
+
+    def __init__(self, atoms: Atoms) -> None:
+        """
+        Initialise an empty snapshot of a structure.
+
+        Parameters
+        ----------
+        atoms : Atoms
+            Structure to calculate quantities from.
+        """
+        super().__init__()
+        self.atoms = atoms
+
+    @property
+    def potential_energy(self) -> float:
+        """
+        Get the potential energy.
+
+        Returns
+        -------
+        float
+            Potential energy, in eV.
+        """
+        return self.get(("potential_energy",), self.atoms.get_potential_energy)
+
+    @property
+    def kinetic_energy(self) -> float:
+        """
+        Get the kinetic energy.
+
+        Returns
+        -------
+        float
+            Kinetic energy, in eV.
+        """
+        return self.get(("kinetic_energy",), self.atoms.get_kinetic_energy)
+
+    @property
+    def volume(self) -> float:
+        """
+        Get the volume of the cell.
+
+        Returns
+        -------
+        float
+            Volume, in Å^3.
+        """
+        return self.get(("volume",), self.atoms.get_volume)
+
+    @property
+    def stress(self) -> NDArray[float64]:
+        """
+        Get the stress, including the ideal gas contribution, in Voigt form.
+
+        Returns
+        -------
+        NDArray[float64]
+            Stress tensor, in eV/Å^3.
+        """
+        return self.get(
+            ("stress", True),
+            lambda: self.atoms.get_stress(include_ideal_gas=True, voigt=True),
+        )
+
+
+class SharedObservable(ABC):
+    """
+    Observable extracted from a quantity that may be shared with other observables.
+
+    Subclasses define `key`, identifying the underlying quantity, `_calculate`, to
+    calculate it, and `_extract`, to obtain the observed value from it.
+    """
+
+    @property
+    @abstractmethod
+    def key(self) -> Hashable:
+        """
+        Get the key identifying the underlying quantity.
+
+        Returns
+        -------
+        Hashable
+            Key of the underlying quantity, shared by observables of it.
+        """
+
+    @abstractmethod
+    def _calculate(self, atoms: Atoms) -> Any:
+        """
+        Calculate the underlying quantity.
+
+        Parameters
+        ----------
+        atoms : Atoms
+            Atoms object to calculate quantity from.
+
+        Returns
+        -------
+        Any
+            Underlying quantity.
+        """
+
+    @abstractmethod
+    def _extract(self, quantity: Any, atoms: Atoms) -> Union[float, NDArray[float64]]:
+        """
+        Extract the observed value from the underlying quantity.
+
+        Parameters
+        ----------
+        quantity : Any
+            Underlying quantity.
+        atoms : Atoms
+            Atoms object the quantity was calculated from.
+
+        Returns
+        -------
+        Union[float, NDArray[float64]]
+            Observed value.
+        """
+
+    def __call__(
+        self,
+        atoms: Atoms,
+        *args,
+        cache: Optional[ObservableCache] = None,
+        **kwargs,
+    ) -> Union[float, NDArray[float64]]:
+        """
+        Get the observed value, using a shared quantity from `cache` if present.
+
+        Parameters
+        ----------
+        atoms : Atoms
+            Atoms object to extract values from.
+        *args : tuple
+            Additional positional arguments passed to getter.
+        cache : Optional[ObservableCache]
+            Cache of quantities calculated from `atoms`. Default is None.
+        **kwargs : dict
+            Additional kwargs passed getter.
+
+        Returns
+        -------
+        Union[float, NDArray[float64]]
+            Observed value.
+        """
+        if cache is None:
+            quantity = self._calculate(atoms)
+        else:
+            quantity = cache.get(self.key, lambda: self._calculate(atoms))
+        return self._extract(quantity, atoms)
+
+
+class Stress(SharedObservable):
     """
     Observable for stress components.
 
@@ -46,27 +252,211 @@ class Stress:
         self._index = components[self.component]
         self.include_ideal_gas = include_ideal_gas
 
-    def __call__(self, atoms: Atoms, *args, **kwargs) -> float:
+    @property
+    def key(self) -> tuple[str, bool]:
+        """
+        Get the key identifying the stress tensor.
+
+        Returns
+        -------
+        tuple[str, bool]
+            Name of quantity, and whether the ideal gas contribution is included.
+        """
+        return ("stress", self.include_ideal_gas)
+
+    def _calculate(self, atoms: Atoms) -> NDArray[float64]:
+        """
+        Calculate the stress tensor.
+
+        Parameters
+        ----------
+        atoms : Atoms
+            Atoms object to calculate stress of.
+
+        Returns
+        -------
+        NDArray[float64]
+            Stress tensor in Voigt form.
+        """
+        return atoms.get_stress(include_ideal_gas=self.include_ideal_gas, voigt=True)
+
+    def _extract(self, quantity: NDArray[float64], atoms: Atoms) -> float:
         """
         Get the stress component.
 
         Parameters
         ----------
+        quantity : NDArray[float64]
+            Stress tensor in Voigt form.
         atoms : Atoms
-            Atoms object to extract values from.
-        *args : tuple
-            Additional positional arguments passed to getter.
-        **kwargs : dict
-            Additional kwargs passed getter.
+            Atoms object the stress was calculated from.
 
         Returns
         -------
         float
             The stress component in GPa units.
         """
-        return (
-            atoms.get_stress(include_ideal_gas=self.include_ideal_gas, voigt=True)[
-                self._index
-            ]
-            / units.GPa
+        return quantity[self._index] / units.GPa
+
+
+class Velocity(SharedObservable):
+    """
+    Observable for per-atom velocity components.
+
+    Correlations of array observables are averaged over all elements, so the
+    autocorrelation of all three components is the velocity autocorrelation
+    function divided by three.
+
+    Parameters
+    ----------
+    components : Sequence[str]
+        Symbols for velocity components, x, y or z. Default is ("x", "y", "z").
+    atoms_filter : Optional[Sequence[int]]
+        Indices of atoms to observe. Default is all atoms.
+    """
+
+    key = ("velocities",)
+
+    def __init__(
+        self,
+        components: Sequence[str] = ("x", "y", "z"),
+        atoms_filter: Optional[Sequence[int]] = None,
+    ) -> None:
+        """
+        Initialise the observable from symbolic str components and atom indices.
+
+        Parameters
+        ----------
+        components : Sequence[str]
+            Symbols for velocity components, x, y or z. Default is ("x", "y", "z").
+        atoms_filter : Optional[Sequence[int]]
+            Indices of atoms to observe. Default is all atoms.
+        """
+        self._indices = _velocity_components(components)
+        self.components = tuple(components)
+        self.atoms_filter = atoms_filter
+
+    def _select(self, atoms: Atoms) -> Union[Sequence[int], slice]:
+        """
+        Get the atoms to observe.
+
+        Parameters
+        ----------
+        atoms : Atoms
+            Atoms object to extract values from.
+
+        Returns
+        -------
+        Union[Sequence[int], slice]
+            Indices of atoms to observe.
+        """
+        if self.atoms_filter is None:
+            return slice(None)
+        return list(self.atoms_filter)
+
+    def _calculate(self, atoms: Atoms) -> NDArray[float64]:
+        """
+        Calculate the velocities of all atoms.
+
+        Parameters
+        ----------
+        atoms : Atoms
+            Atoms object to get velocities of.
+
+        Returns
+        -------
+        NDArray[float64]
+            Velocities of all atoms, in Å/fs units.
+        """
+        return atoms.get_velocities() * units.fs
+
+    def _extract(self, quantity: NDArray[float64], atoms: Atoms) -> NDArray[float64]:
+        """
+        Get the velocity components of the observed atoms.
+
+        Parameters
+        ----------
+        quantity : NDArray[float64]
+            Velocities of all atoms, in Å/fs units.
+        atoms : Atoms
+            Atoms object the velocities were calculated from.
+
+        Returns
+        -------
+        NDArray[float64]
+            The velocity components of each atom, with shape (atoms, components),
+            in Å/fs units.
+        """
+        return quantity[self._select(atoms)][:, self._indices]
+
+
+class SpeciesVelocity(Velocity):
+    """
+    Observable for velocity components of atoms of a single species.
+
+    Parameters
+    ----------
+    species : str
+        Chemical symbol of the atoms to observe.
+    components : Sequence[str]
+        Symbols for velocity components, x, y or z. Default is ("x", "y", "z").
+    """
+
+    def __init__(
+        self, species: str, components: Sequence[str] = ("x", "y", "z")
+    ) -> None:
+        """
+        Initialise the observable from a chemical symbol and symbolic components.
+
+        Parameters
+        ----------
+        species : str
+            Chemical symbol of the atoms to observe.
+        components : Sequence[str]
+            Symbols for velocity components, x, y or z. Default is ("x", "y", "z").
+        """
+        if species not in atomic_numbers:
+            raise ValueError(f"'{species}' is not a valid chemical symbol")
+
+        super().__init__(components)
+        self.species = species
+        self._number = atomic_numbers[species]
+
+    def _select(self, atoms: Atoms) -> NDArray[np.bool_]:
+        """
+        Get the atoms of the observed species.
+
+        Parameters
+        ----------
+        atoms : Atoms
+            Atoms object to extract values from.
+
+        Returns
+        -------
+        NDArray[np.bool_]
+            Mask of atoms of the observed species.
+        """
+        return atoms.numbers == self._number
+
+
+def _velocity_components(components: Sequence[str]) -> list[int]:
+    """
+    Convert symbolic velocity components into indices.
+
+    Parameters
+    ----------
+    components : Sequence[str]
+        Symbols for velocity components, x, y or z.
+
+    Returns
+    -------
+    list[int]
+        Index of each component.
+    """
+    indices = {"x": 0, "y": 1, "z": 2}
+    invalid = [component for component in components if component not in indices]
+    if invalid or not components:
+        raise ValueError(
+            f"'{', '.join(invalid)}' invalid, components must be 'x', 'y' or 'z'"
         )
+    return [indices[component] for component in components]
@@ -0,0 +1,304 @@
+"""Evaluate structures in parallel using pools of worker processes."""
+
+from collections.abc import Collection, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from math import ceil
+from multiprocessing import get_context
+import os
+from typing import Any, Optional, Union
+
+from ase import Atoms
+from ase.calculators.calculator import Calculator
+from numpy import ndarray
+
+from janus_core.helpers.janus_types import Architectures, Devices, PathLike
+from janus_core.helpers.mlip_calculators import (
+    batch_calculate,
+    choose_calculator,
+    supports_batching,
+)
+
+# Calculator configured in each worker process
+_CALCULATOR: Optional[Calculator] = None
+
+
+def _init_worker(
+    arch: Architectures,
+    device: Devices,
+    model_path: Optional[PathLike],
+    calc_kwargs: dict[str, Any],
+    threads: int,
+) -> None:
+    """
+    Set the number of threads and load the calculator for a worker process.
+
+    Parameters
+    ----------
+    arch : Architectures
+        MLIP architecture to use for calculations.
+    device : Devices
+        Device to run model on.
+    model_path : Optional[PathLike]
+        Path to MLIP model.
+    calc_kwargs : dict[str, Any]
+        Keyword arguments to pass to the selected calculator.
+    threads : int
+        Number of threads for the worker to use.
+    """
+    global _CALCULATOR
+
+    try:
+        import torch
+
+        torch.set_num_threads(threads)
+    except ImportError:
+        pass
+
+    _CALCULATOR = choose_calculator(
+        arch=arch, device=device, model_path=model_path, **calc_kwargs
+    )
+
+
+def _evaluate(
+    structs: Sequence[Atoms],
+    properties: Collection[str],
+    batch_size: Optional[int],
+) -> list[dict[str, Any]]:
+    """
+    Calculate properties of structures using the worker's calculator.
+
+    Parameters
+    ----------
+    structs : Sequence[Atoms]
+        Structures to evaluate.
+    properties : Collection[str]
+        Properties to calculate.
+    batch_size : Optional[int]
+        Maximum number of structures to evaluate in each forward pass, if supported by
+        the calculator.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        Calculated results for each structure.
+    """
+    if batch_size and supports_batching(_CALCULATOR):
+        return batch_calculate(_CALCULATOR, structs, batch_size=batch_size)
+
+    results = []
+    for struct in structs:
+        for prop in properties:
+            _CALCULATOR.get_property(prop, struct)
+        # Copy arrays, as some calculators update their results in place
+        results.append(
+            {
+                key: value.copy() if isinstance(value, ndarray) else value
+                for key, value in _CALCULATOR.results.items()
+            }
+        )
+    return results
+
+
+def _optimize(
+    struct: Atoms, optimize_kwargs: dict[str, Any]
+) -> tuple[Atoms, dict[str, Any]]:
+    """
+    Optimize the geometry of a structure using the worker's calculator.
+
+    Parameters
+    ----------
+    struct : Atoms
+        Structure to optimize.
+    optimize_kwargs : dict[str, Any]
+        Keyword arguments to pass to GeomOpt.
+
+    Returns
+    -------
+    tuple[Atoms, dict[str, Any]]
+        Optimized structure, without a calculator, and its calculated results.
+    """
+    from janus_core.calculations.geom_opt import GeomOpt
+
+    struct.calc = _CALCULATOR
+    optimizer = GeomOpt(struct, **optimize_kwargs)
+    optimizer.run()
+
+    results = {
+        key: value.copy() if isinstance(value, ndarray) else value
+        for key, value in _CALCULATOR.results.items()
+    }
+    struct.calc = None
+    return struct, results
+
+
+class CalculatorPool:
+    """
+    Pool of worker processes, each loading an MLIP calculator once.
+
+    Parameters
+    ----------
+    arch : Architectures
+        MLIP architecture to use for calculations. Default is "mace_mp".
+    device : Devices
+        Device to run model on. Default is "cpu".
+    model_path : Optional[PathLike]
+        Path to MLIP model. Default is `None`.
+    calc_kwargs : Optional[dict[str, Any]]
+        Keyword arguments to pass to the selected calculator. Default is {}.
+    n_workers : Optional[int]
+        Number of worker processes. Default is the number of CPUs.
+    threads_per_worker : Optional[int]
+        Number of PyTorch intra-op threads for each worker. Default is the number of
+        CPUs divided by `n_workers`, and at least 1.
+    """
+
+    def __init__(
+        self,
+        *,
+        arch: Architectures = "mace_mp",
+        device: Devices = "cpu",
+        model_path: Optional[PathLike] = None,
+        calc_kwargs: Optional[dict[str, Any]] = None,
+        n_workers: Optional[int] = None,
+        threads_per_worker: Optional[int] = None,
+    ) -> None:
+        """
+        Start worker processes and load a calculator in each.
+
+        Parameters
+        ----------
+        arch : Architectures
+            MLIP architecture to use for calculations. Default is "mace_mp".
+        device : Devices
+            Device to run model on. Default is "cpu".
+        model_path : Optional[PathLike]
+            Path to MLIP model. Default is `None`.
+        calc_kwargs : Optional[dict[str, Any]]
+            Keyword arguments to pass to the selected calculator. Default is {}.
+        n_workers : Optional[int]
+            Number of worker processes. Default is the number of CPUs.
+        threads_per_worker : Optional[int]
+            Number of PyTorch intra-op threads for each worker. Default is the number
+            of CPUs divided by `n_workers`, and at least 1.
+        """
+        calc_kwargs = calc_kwargs if calc_kwargs else {}
+        n_cpus = os.cpu_count() or 1
+
+        self.n_workers = n_workers if n_workers else n_cpus
+        if self.n_workers < 1:
+            raise ValueError("`n_workers` must be at least 1")
+        self.threads_per_worker = (
+            threads_per_worker
+            if threads_per_worker
+            else max(n_cpus // self.n_workers, 1)
+        )
+
+        # Spawn workers, as forked processes cannot safely reuse PyTorch state
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.n_workers,
+            mp_context=get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(arch, device, model_path, calc_kwargs, self.threads_per_worker),
+        )
+
+    def __enter__(self) -> "CalculatorPool":
+        """
+        Enter the context of the pool.
+
+        Returns
+        -------
+        CalculatorPool
+            The pool.
+        """
+        return self
+
+    def __exit__(self, *args) -> None:
+        """
+        Shut down worker processes when leaving the context of the pool.
+
+        Parameters
+        ----------
+        *args
+            Exception information, if raised.
+        """
+        self.close()
+
+    def close(self) -> None:
+        """Shut down worker processes."""
+        self.executor.shutdown()
+
+    def calculate(
+        self,
+        structs: Sequence[Atoms],
+        properties: Collection[str] = ("energy", "forces", "stress"),
+        *,
+        batch_size: Optional[int] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Calculate properties of structures, sharded across workers.
+
+        Parameters
+        ----------
+        structs : Sequence[Atoms]
+            Structures to evaluate.
+        properties : Collection[str]
+            Properties to calculate. Default is ("energy", "forces", "stress").
+        batch_size : Optional[int]
+            Maximum number of structures to evaluate in each forward pass, if supported
+            by the calculator. Default is None.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Calculated results for each structure, in the same order as `structs`.
+        """
+        # Several shards per worker balance load between structures of varying size
+        shard_size = max(ceil(len(structs) / (4 * self.n_workers)), 1)
+        shards = [
+            [struct.copy() for struct in structs[i : i + shard_size]]
+            for i in range(0, len(structs), shard_size)
+        ]
+
+        results = []
+        for shard_results in self.executor.map(
+            _evaluate,
+            shards,
+            [properties] * len(shards),
+            [batch_size] * len(shards),
+        ):
+            results.extend(shard_results)
+        return results
+
+    def optimize(
+        self,
+        structs: Sequence[Atoms],
+        optimize_kwargs: Optional[
+            Union[dict[str, Any], Sequence[dict[str, Any]]]
+        ] = None,
+    ) -> list[tuple[Atoms, dict[str, Any]]]:
+        """
+        Optimize the geometry of structures, distributed across workers.
+
+        Parameters
+        ----------
+        structs : Sequence[Atoms]
+            Structures to optimize.
+        optimize_kwargs : Optional[Union[dict[str, Any], Sequence[dict[str, Any]]]]
+            Keyword arguments to pass to GeomOpt, for all structures, or for each
+            structure, such as to write separate log files. Default is {}.
+
+        Returns
+        -------
+        list[tuple[Atoms, dict[str, Any]]]
+            Optimized structures, without calculators, and their calculated results,
+            in the same order as `structs`.
+        """
+        optimize_kwargs = optimize_kwargs if optimize_kwargs else {}
+        if isinstance(optimize_kwargs, dict):
+            optimize_kwargs = [optimize_kwargs] * len(structs)
+        if len(optimize_kwargs) != len(structs):
+            raise ValueError("`optimize_kwargs` must be given for each structure")
+
+        # Copies do not include calculators, which are loaded by each worker
+        copies = [struct.copy() for struct in structs]
+        return list(self.executor.map(_optimize, copies, optimize_kwargs))
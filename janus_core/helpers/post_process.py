@@ -1,11 +1,17 @@
 """Module for post-processing trajectories."""
 
-from collections.abc import Sequence
-from itertools import combinations_with_replacement
-from typing import Optional, Union
+from collections.abc import Iterable, Sequence
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import combinations_with_replacement, islice
+from math import pi
+from multiprocessing import get_context
+from typing import Any, Optional, Union
+from warnings import warn
 
 from ase import Atoms
 from ase.geometry.analysis import Analysis
+from ase.geometry.rdf import check_cell_and_r_max
+from ase.neighborlist import neighbor_list
 import numpy as np
 from numpy import float64
 from numpy.typing import NDArray
@@ -16,6 +22,7 @@ from janus_core.helpers.janus_types import (
     SliceLike,
     StartStopStep,
 )
+from janus_core.helpers.trajectory import HDF5Trajectory
 
 
 def _process_index(index: SliceLike) -> StartStopStep:
@@ -43,8 +50,32 @@ def _process_index(index: SliceLike) -> StartStopStep:
     return index
 
 
+def _accumulate_rdf(
+    structs: Sequence[Atoms], rdf_kwargs: dict[str, Any]
+) -> "RDFAccumulator":
+    """
+    Accumulate the RDF of structures in a worker process.
+
+    Parameters
+    ----------
+    structs : Sequence[Atoms]
+        Structures to add.
+    rdf_kwargs : dict[str, Any]
+        Keyword arguments to pass to RDFAccumulator.
+
+    Returns
+    -------
+    RDFAccumulator
+        Accumulated RDF of the structures.
+    """
+    accumulator = RDFAccumulator(**rdf_kwargs)
+    for struct in structs:
+        accumulator.update(struct)
+    return accumulator
+
+
 def compute_rdf(
-    data: MaybeSequence[Atoms],
+    data: Union[MaybeSequence[Atoms], Iterable[Atoms], HDF5Trajectory],
     ana: Optional[Analysis] = None,
     /,
     *,
@@ -55,16 +86,23 @@ def compute_rdf(
     elements: Optional[MaybeSequence[Union[int, str]]] = None,
     index: SliceLike = (0, None, 1),
     volume: Optional[float] = None,
+    n_workers: int = 1,
+    chunk_size: int = 16,
 ) -> Union[NDArray[float64], dict[tuple[str, str], NDArray[float64]]]:
     """
     Compute the rdf of data.
 
+    Distances are binned for all pairs of elements in a single pass over each
+    structure, using a neighbour list with periodic boundary conditions.
+
     Parameters
     ----------
-    data : MaybeSequence[Atoms]
-        Dataset to compute RDF of.
+    data : Union[MaybeSequence[Atoms], Iterable[Atoms], HDF5Trajectory]
+        Dataset to compute RDF of. Structures may also be read lazily, such as
+        using `ase.io.iread`. Structures are only built for the frames selected by
+        `index` if reading an HDF5 trajectory.
     ana : Optional[Analysis]
-        ASE Analysis object for data reuse.
+        Unused, as distances are no longer calculated using ASE Analysis.
     filenames : Optional[MaybeSequence[PathLike]]
         Filenames to output data to. Must match number of RDFs computed.
     by_elements : bool
@@ -83,9 +121,15 @@ def compute_rdf(
         `index` if `int`,
         `start`, `stop`, `step` if `tuple`,
         `slice` if `slice` or `range`.
+        Must not be negative if `data` is not a sequence.
     volume : Optional[float]
         Volume of cell for normalisation. Only needs to be provided
         if aperiodic cell. Default is (2*rmax)**3.
+    n_workers : int
+        Number of processes to divide structures between. Default is 1.
+    chunk_size : int
+        Number of structures sent to a worker process at once, if `n_workers` is
+        greater than 1. Default is 16.
 
     Returns
     -------
@@ -93,111 +137,373 @@ def compute_rdf(
         If `by_elements` is true returns a `dict` of RDF by element pairs.
         Otherwise returns RDF of total system filtered by elements.
     """
+    if ana is not None:
+        warn(
+            "`ana` is no longer used to compute RDFs, and will be ignored",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+    if n_workers < 1:
+        raise ValueError("`n_workers` must be at least 1")
+
     index = _process_index(index)
 
-    if not isinstance(data, Sequence):
+    if isinstance(data, Atoms):
         data = [data]
+    if isinstance(data, Sequence):
+        # Only build structures for the selected frames of HDF5 trajectories
+        data = data[slice(*index)]
+    else:
+        data = islice(data, *index)
+    data = iter(data)
 
     if elements is not None and not isinstance(elements, Sequence):
         elements = (elements,)
 
-    if (  # If aperiodic, assume volume of a cube encompassing rmax sphere.
-        not all(data[0].get_pbc()) and volume is None
-    ):
-        volume = (2 * rmax) ** 3
+    first = next(data, None)
+    if first is None:
+        raise ValueError("No structures selected to compute RDF")
+
+    if by_elements and elements is None:
+        # Elements of first structure, which are shared by all workers
+        elements = tuple(sorted(set(first.get_chemical_symbols())))
+
+    rdf_kwargs = {
+        "rmax": rmax,
+        "nbins": nbins,
+        "elements": elements,
+        "by_elements": by_elements,
+        "volume": volume,
+    }
+    accumulator = RDFAccumulator(**rdf_kwargs)
+    accumulator.update(first)
+
+    if n_workers == 1:
+        for struct in data:
+            accumulator.update(struct)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=n_workers, mp_context=get_context("spawn")
+        ) as executor:
+            # Limit chunks in flight, so lazily read structures are not all stored
+            pending = set()
+            while chunk := list(islice(data, chunk_size)):
+                if len(pending) >= 2 * n_workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        accumulator.merge(future.result())
+                pending.add(executor.submit(_accumulate_rdf, chunk, rdf_kwargs))
+            for future in pending:
+                accumulator.merge(future.result())
+
+    if filenames is not None:
+        accumulator.write(filenames)
+
+    return accumulator.get_rdf()
+
+
+class RDFAccumulator:
+    """
+    Accumulate the average RDF of structures, one structure at a time.
 
-    if ana is None:
-        ana = Analysis(data)
+    Pair distances are histogrammed as each structure is added, so structures do
+    not need to be stored. The RDF of each structure is normalised as in
+    `compute_rdf`, and averaged over all structures added.
 
-    if by_elements:
-        elements = (
-            tuple(sorted(set(data[0].get_chemical_symbols())))
-            if elements is None
-            else elements
-        )
+    Parameters
+    ----------
+    rmax : float
+        Maximum distance of RDF. Default is 2.5.
+    nbins : int
+        Number of bins to divide RDF. Default is 50.
+    elements : Optional[MaybeSequence[Union[int, str]]]
+        Make partial RDFs, as in `compute_rdf`. If `by_elements` is true, only
+        pairs of these elements are computed. Default is None.
+    by_elements : bool
+        Split RDF into pairwise by elements group. As in `compute_rdf`, mixed RDFs
+        include all self-RDFs. Default is False.
+    volume : Optional[float]
+        Volume of cell for normalisation. Only needs to be provided if aperiodic
+        cell. Default is (2*rmax)**3.
+    """
 
-        rdf = {
-            element: ana.get_rdf(
-                rmax=rmax,
-                nbins=nbins,
-                elements=element,
-                imageIdx=slice(*index),
-                return_dists=True,
-                volume=volume,
+    def __init__(
+        self,
+        rmax: float = 2.5,
+        nbins: int = 50,
+        elements: Optional[MaybeSequence[Union[int, str]]] = None,
+        by_elements: bool = False,
+        volume: Optional[float] = None,
+    ) -> None:
+        """
+        Initialise accumulator.
+
+        Parameters
+        ----------
+        rmax : float
+            Maximum distance of RDF. Default is 2.5.
+        nbins : int
+            Number of bins to divide RDF. Default is 50.
+        elements : Optional[MaybeSequence[Union[int, str]]]
+            Make partial RDFs, as in `compute_rdf`. If `by_elements` is true, only
+            pairs of these elements are computed. Default is None.
+        by_elements : bool
+            Split RDF into pairwise by elements group. As in `compute_rdf`, mixed
+            RDFs include all self-RDFs. Default is False.
+        volume : Optional[float]
+            Volume of cell for normalisation. Only needs to be provided if aperiodic
+            cell. Default is (2*rmax)**3.
+        """
+        if elements is not None and (
+            isinstance(elements, (int, str)) or not isinstance(elements, Sequence)
+        ):
+            elements = (elements,)
+
+        self.rmax = rmax
+        self.nbins = nbins
+        self.elements = elements
+        self.by_elements = by_elements
+        self.volume = volume
+
+        self.dr = rmax / nbins
+        self.dists = np.arange(self.dr / 2, rmax, self.dr)
+        # Shell volume factor, as used by ase.geometry.rdf.get_rdf
+        self._shells = self.dists**2 + self.dr**2 / 12
+        self._rdfs: dict[tuple, tuple] = {}
+        self._types: Optional[NDArray] = None
+        self._n_types = 0
+        self._sums: Optional[dict[tuple, NDArray[float64]]] = None
+        self.n_structs = 0
+
+    def _setup(self, struct: Atoms) -> None:
+        """
+        Assign atoms to types, and choose the pairs of types contributing to each RDF.
+
+        Parameters
+        ----------
+        struct : Atoms
+            First structure added.
+        """
+        symbols = np.asarray(struct.get_chemical_symbols())
+        types = np.full(len(struct), -1)
+
+        if self.by_elements:
+            elements = (
+                tuple(sorted(set(symbols))) if self.elements is None else self.elements
             )
-            for element in combinations_with_replacement(elements, 2)
-        }
+            counts = []
+            for i, element in enumerate(elements):
+                types[symbols == element] = i
+                counts.append(np.count_nonzero(symbols == element))
+
+            # Mixed RDFs include both self-RDFs, as for a structure of both elements
+            self._rdfs = {}
+            for (i, elem_i), (j, elem_j) in combinations_with_replacement(
+                enumerate(elements), 2
+            ):
+                pairs = ((i, i),) if i == j else ((i, i), (i, j), (j, i), (j, j))
+                n_atoms = counts[i] if i == j else counts[i] + counts[j]
+                self._rdfs[(elem_i, elem_j)] = (pairs, n_atoms**2)
+
+        elif (
+            self.elements is not None
+            and len(self.elements) == 2
+            and not any(isinstance(element, str) for element in self.elements)
+        ):
+            # Pair of atomic numbers, following ase.geometry.analysis.Analysis
+            first, second = self.elements
+            types[struct.numbers == second] = 1
+            types[struct.numbers == first] = 0
+            pairs = ((0, 0),) if first == second else ((0, 1),)
+            n_first = np.count_nonzero(struct.numbers == first)
+            self._rdfs = {(): (pairs, n_first * len(struct))}
+
+        else:
+            if self.elements is None:
+                types[:] = 0
+            elif all(isinstance(element, str) for element in self.elements):
+                types[np.isin(symbols, self.elements)] = 0
+            else:
+                # Atom indices, following ase.geometry.analysis.Analysis
+                types[list(self.elements)] = 0
+            self._rdfs = {(): (((0, 0),), np.count_nonzero(types == 0) ** 2)}
+
+        self._types = types
+        self._n_types = max(types.max() + 1, 1)
+        self._sums = {key: np.zeros(self.nbins) for key in self._rdfs}
+
+    def update(self, struct: Atoms) -> None:
+        """
+        Add the RDF of a structure to the accumulated RDFs.
+
+        Distances between all pairs of atoms are found and binned by the types of
+        both atoms once, so all RDFs are computed in a single pass.
+
+        Parameters
+        ----------
+        struct : Atoms
+            Structure to add.
+        """
+        if self._sums is None:
+            self._setup(struct)
+
+        check_cell_and_r_max(struct, self.rmax)
+        volume = self.volume
+        if volume is None:
+            if all(struct.pbc):
+                volume = struct.cell.volume
+            else:
+                # If aperiodic, assume volume of a cube encompassing rmax sphere
+                volume = (2 * self.rmax) ** 3
+
+        # Each pair is found in both directions
+        i, j, dists = neighbor_list("ijd", struct, self.rmax)
+        bins = np.ceil(dists / self.dr).astype(int) - 1
+        type_i, type_j = self._types[i], self._types[j]
+        keep = (bins >= 0) & (bins < self.nbins) & (type_i >= 0) & (type_j >= 0)
+
+        n_types = self._n_types
+        hist = np.bincount(
+            (type_i[keep] * n_types + type_j[keep]) * self.nbins + bins[keep],
+            minlength=n_types * n_types * self.nbins,
+        ).reshape(n_types, n_types, self.nbins)
+
+        for key, (pairs, n_atoms) in self._rdfs.items():
+            counts = sum(hist[pair] for pair in pairs)
+            norm = 4.0 * pi * self.dr * n_atoms / volume
+            with np.errstate(divide="ignore", invalid="ignore"):
+                self._sums[key] += counts / (norm * self._shells)
+
+        self.n_structs += 1
+
+    def merge(self, other: "RDFAccumulator") -> None:
+        """
+        Add the structures accumulated by another accumulator.
+
+        Parameters
+        ----------
+        other : RDFAccumulator
+            Accumulator with the same settings, for structures of the same atoms.
+        """
+        if other._sums is None:
+            return
+        if self._sums is None:
+            self._rdfs = other._rdfs
+            self._types = other._types
+            self._n_types = other._n_types
+            self._sums = {key: np.zeros(self.nbins) for key in other._sums}
+        if self._sums.keys() != other._sums.keys():
+            raise ValueError("Unable to merge RDFs of different elements")
+
+        for key, values in other._sums.items():
+            self._sums[key] += values
+        self.n_structs += other.n_structs
+
+    def get_rdf(
+        self,
+    ) -> Union[
+        tuple[NDArray[float64], NDArray[float64]],
+        dict[tuple[str, str], tuple[NDArray[float64], NDArray[float64]]],
+    ]:
+        """
+        Get the average RDF of all structures added.
+
+        Returns
+        -------
+        Union[tuple[NDArray[float64], NDArray[float64]], dict[tuple[str, str], tuple[NDArray[float64], NDArray[float64]]]]
+            Distances and RDF, as returned by `compute_rdf`. If `by_elements` is
+            true, returns a `dict` of these by element pairs.
+        """  # noqa: E501
+        if not self.n_structs:
+            raise ValueError("No structures have been added")
 
-        # Compute RDF average
         rdf = {
-            element: (rdf[0][1], np.average([rdf_i[0] for rdf_i in rdf], axis=0))
-            for element, rdf in rdf.items()
+            key: (self.dists, values / self.n_structs)
+            for key, values in self._sums.items()
         }
+        return rdf if self.by_elements else rdf[()]
 
-        if filenames is not None:
-            if isinstance(filenames, str) or not isinstance(filenames, Sequence):
-                filenames = (filenames,)
+    def write(self, filenames: MaybeSequence[PathLike]) -> None:
+        """
+        Write the average RDF of all structures added.
 
-            assert isinstance(filenames, Sequence)
+        Parameters
+        ----------
+        filenames : MaybeSequence[PathLike]
+            Filenames to output data to. Must match number of RDFs computed.
+        """
+        rdf = self.get_rdf()
+        rdf = rdf.values() if self.by_elements else (rdf,)
 
-            if len(filenames) != len(rdf):
-                raise ValueError(
-                    f"Different number of file names ({len(filenames)}) "
-                    f"to number of samples ({len(rdf)})"
-                )
+        if isinstance(filenames, str) or not isinstance(filenames, Sequence):
+            filenames = (filenames,)
 
-            for (dists, rdfs), out_path in zip(rdf.values(), filenames):
-                with open(out_path, "w", encoding="utf-8") as out_file:
-                    for dist, rdf_i in zip(dists, rdfs):
-                        print(dist, rdf_i, file=out_file)
+        if len(filenames) != len(rdf):
+            raise ValueError(
+                f"Different number of file names ({len(filenames)}) "
+                f"to number of samples ({len(rdf)})"
+            )
 
-    else:
-        rdf = ana.get_rdf(
-            rmax=rmax,
-            nbins=nbins,
-            elements=elements,
-            imageIdx=slice(*index),
-            return_dists=True,
-            volume=volume,
-        )
+        for (dists, rdf_i), out_path in zip(rdf, filenames):
+            with open(out_path, "w", encoding="utf-8") as out_file:
+                for dist, value in zip(dists, rdf_i):
+                    print(dist, value, file=out_file)
 
-        assert isinstance(rdf, list)
 
-        # Compute RDF average
-        rdf = rdf[0][1], np.average([rdf_i[0] for rdf_i in rdf], axis=0)
+def _autocorrelation(values: NDArray[float64], chunk_size: int) -> NDArray[float64]:
+    """
+    Compute the autocorrelation of vectors for each atom, summed over components.
 
-        if filenames is not None:
-            if isinstance(filenames, Sequence):
-                if len(filenames) != 1:
-                    raise ValueError(
-                        f"Different number of file names ({len(filenames)}) "
-                        "to number of samples (1)"
-                    )
-                filenames = filenames[0]
+    Correlations are calculated using FFTs, zero-padded to avoid circular
+    correlation, so are equivalent to `np.correlate` in "full" mode for
+    non-negative lags.
 
-            with open(filenames, "w", encoding="utf-8") as out_file:
-                for dist, rdf_i in zip(*rdf):
-                    print(dist, rdf_i, file=out_file)
+    Parameters
+    ----------
+    values : NDArray[float64]
+        Vectors for each step and atom, with shape (steps, atoms, 3).
+    chunk_size : int
+        Maximum number of atoms to correlate at once.
+
+    Returns
+    -------
+    NDArray[float64]
+        Unnormalised autocorrelation of each atom, with shape (atoms, steps).
+    """
+    if chunk_size < 1:
+        raise ValueError("`chunk_size` must be at least 1")
+
+    n_steps, n_atoms = values.shape[:2]
+    # Power of two at least twice the number of steps
+    n_fft = 1 << (2 * n_steps - 1).bit_length()
 
-    return rdf
+    corrs = np.empty((n_atoms, n_steps))
+    for start in range(0, n_atoms, chunk_size):
+        chunk = slice(start, start + chunk_size)
+        transform = np.fft.rfft(values[:, chunk], n=n_fft, axis=0)
+        power = (transform.real**2 + transform.imag**2).sum(axis=-1)
+        corrs[chunk] = np.fft.irfft(power, n=n_fft, axis=0)[:n_steps].T
+    return corrs
 
 
 def compute_vaf(
-    data: Sequence[Atoms],
+    data: Union[Sequence[Atoms], HDF5Trajectory],
     filenames: Optional[MaybeSequence[PathLike]] = None,
     *,
     use_velocities: bool = False,
     fft: bool = False,
     index: SliceLike = (0, None, 1),
     filter_atoms: MaybeSequence[MaybeSequence[Optional[int]]] = ((None),),
+    chunk_size: int = 256,
 ) -> NDArray[float64]:
     """
     Compute the velocity autocorrelation function (VAF) of `data`.
 
     Parameters
     ----------
-    data : Sequence[Atoms]
-        Dataset to compute VAF of.
+    data : Union[Sequence[Atoms], HDF5Trajectory]
+        Dataset to compute VAF of. Momenta are read directly if reading an HDF5
+        trajectory.
     filenames : Optional[MaybeSequence[PathLike]]
         If present, dump resultant VAF to file.
     use_velocities : bool
@@ -212,35 +518,31 @@ def compute_vaf(
     filter_atoms : MaybeSequence[MaybeSequence[Optional[int]]]
         Compute the VAF averaged over subsets of the system.
         Default is all atoms.
+    chunk_size : int
+        Maximum number of atoms to correlate at once, bounding memory use.
+        Default is 256.
 
     Returns
     -------
     MaybeSequence[NDArray[float64]]
         Computed VAF(s).
     """
-    # Ensure if passed scalars they are turned into correct dimensionality
-    if not isinstance(filter_atoms, Sequence):
-        filter_atoms = (filter_atoms,)
-    if not isinstance(filter_atoms[0], Sequence):
-        filter_atoms = (filter_atoms,)
-
-    if filenames and not isinstance(filenames, Sequence):
-        filenames = (filenames,)
-
-        if len(filenames) != len(filter_atoms):
-            raise ValueError(
-                f"Different number of file names ({len(filenames)}) "
-                f"to number of samples ({len(filter_atoms)})"
-            )
+    filter_atoms, filenames = _process_filters(filter_atoms, filenames)
 
     # Extract requested data
     index = _process_index(index)
-    data = data[slice(*index)]
 
-    if use_velocities:
-        momenta = np.asarray([datum.get_velocities() for datum in data])
+    if isinstance(data, HDF5Trajectory):
+        momenta = data.get_array("momenta", slice(*index)).astype(float64)
+        if use_velocities:
+            momenta /= data.get_array("masses")[:, np.newaxis]
     else:
-        momenta = np.asarray([datum.get_momenta() for datum in data])
+        data = data[slice(*index)]
+
+        if use_velocities:
+            momenta = np.asarray([datum.get_velocities() for datum in data])
+        else:
+            momenta = np.asarray([datum.get_momenta() for datum in data])
 
     n_steps = len(momenta)
     n_atoms = len(momenta[0])
@@ -253,34 +555,394 @@ def compute_vaf(
     used_atoms = {atom for atoms in filter_atoms for atom in atoms}
     used_atoms = {j: i for i, j in enumerate(used_atoms)}
 
-    vafs = np.sum(
-        np.asarray(
-            [
-                [
-                    np.correlate(momenta[:, j, i], momenta[:, j, i], "full")[
-                        n_steps - 1 :
-                    ]
-                    for i in range(3)
-                ]
-                for j in used_atoms
-            ]
-        ),
-        axis=1,
-    )
-
+    vafs = _autocorrelation(momenta[:, list(used_atoms)], chunk_size)
     vafs /= n_steps - np.arange(n_steps)
 
-    if fft:
-        vafs = np.fft.fft(vafs, axis=0)
-
     vafs = [
         np.average([vafs[used_atoms[i]] for i in atoms], axis=0)
         for atoms in filter_atoms
     ]
 
+    # Transform each VAF along lags, as in `stream_vaf`
+    if fft:
+        vafs = [np.fft.fft(vaf) for vaf in vafs]
+
     if filenames:
         for filename, vaf in zip(filenames, vafs):
             with open(filename, "w", encoding="utf-8") as out_file:
                 print(*vaf, file=out_file, sep="\n")
 
     return vafs
+
+
+class _BlockCorrelator:
+    """
+    Correlate per-atom vectors over a stream of frames, storing a bounded window.
+
+    Frames are stored until `2 * max_lag` have been added. Correlations for the
+    first `max_lag` origins are then calculated against all stored frames using
+    FFTs, and these frames are discarded, so memory is bounded by `max_lag` rather
+    than the length of the stream.
+
+    Parameters
+    ----------
+    max_lag : int
+        Number of lags to correlate, including zero.
+    msd : bool
+        Whether to calculate squared displacements, rather than dot products.
+        Default is False.
+    chunk_size : int
+        Maximum number of atoms to correlate at once. Default is 256.
+    """
+
+    def __init__(self, max_lag: int, msd: bool = False, chunk_size: int = 256) -> None:
+        """
+        Initialise correlator.
+
+        Parameters
+        ----------
+        max_lag : int
+            Number of lags to correlate, including zero.
+        msd : bool
+            Whether to calculate squared displacements, rather than dot products.
+            Default is False.
+        chunk_size : int
+            Maximum number of atoms to correlate at once. Default is 256.
+        """
+        if max_lag < 1:
+            raise ValueError("`max_lag` must be at least 1")
+        if chunk_size < 1:
+            raise ValueError("`chunk_size` must be at least 1")
+
+        self.max_lag = max_lag
+        self.msd = msd
+        self.chunk_size = chunk_size
+        self._frames: list[NDArray[float64]] = []
+        self._sums: Optional[NDArray[float64]] = None
+        self._counts = np.zeros(max_lag)
+
+    def update(self, values: NDArray[float64]) -> None:
+        """
+        Add vectors of each atom for the next frame.
+
+        Parameters
+        ----------
+        values : NDArray[float64]
+            Vectors for each atom, with shape (atoms, 3).
+        """
+        if self._sums is None:
+            self._sums = np.zeros((len(values), self.max_lag))
+        self._frames.append(np.array(values, dtype=float64))
+
+        if len(self._frames) == 2 * self.max_lag:
+            self._correlate(self.max_lag)
+            del self._frames[: self.max_lag]
+
+    def _correlate(self, n_origins: int) -> None:
+        """
+        Add correlations from the first `n_origins` stored frames to the sums.
+
+        Parameters
+        ----------
+        n_origins : int
+            Number of stored frames to use as time origins.
+        """
+        frames = np.asarray(self._frames)
+        n_frames = len(frames)
+        if self.msd:
+            # Displacements are unchanged, but precision is improved
+            frames -= frames[0]
+
+        n_lags = min(self.max_lag, n_frames)
+        lags = np.arange(n_lags)
+        counts = np.minimum(n_origins, n_frames - lags)
+        n_fft = 1 << (2 * n_frames - 1).bit_length()
+
+        for start in range(0, frames.shape[1], self.chunk_size):
+            chunk = slice(start, start + self.chunk_size)
+            values = frames[:, chunk]
+
+            origins = np.fft.rfft(values[:n_origins], n=n_fft, axis=0)
+            targets = np.fft.rfft(values, n=n_fft, axis=0)
+            cross = np.fft.irfft(
+                (origins.conj() * targets).sum(axis=-1), n=n_fft, axis=0
+            )[:n_lags]
+
+            if self.msd:
+                # |r(t + lag) - r(t)|^2 summed over origins, from cumulative sums
+                squares = np.zeros((n_frames + 1, values.shape[1]))
+                np.cumsum((values**2).sum(axis=-1), axis=0, out=squares[1:])
+                cross = (
+                    squares[counts] + squares[lags + counts] - squares[lags] - 2 * cross
+                )
+
+            self._sums[chunk, :n_lags] += cross.T
+
+        self._counts[:n_lags] += counts
+
+    def get_correlations(self) -> NDArray[float64]:
+        """
+        Get the average correlation of each atom, including all frames added.
+
+        Returns
+        -------
+        NDArray[float64]
+            Correlation of each atom, averaged over time origins, with shape
+            (atoms, lags).
+        """
+        if self._frames:
+            self._correlate(len(self._frames))
+            self._frames.clear()
+
+        if self._sums is None:
+            raise ValueError("No frames have been added")
+
+        n_lags = np.count_nonzero(self._counts)
+        return self._sums[:, :n_lags] / self._counts[:n_lags]
+
+
+def _process_filters(
+    filter_atoms: MaybeSequence[MaybeSequence[Optional[int]]],
+    filenames: Optional[MaybeSequence[PathLike]],
+) -> tuple[Sequence[Sequence[Optional[int]]], Optional[Sequence[PathLike]]]:
+    """
+    Standardise subsets of atoms to average over, and corresponding filenames.
+
+    Parameters
+    ----------
+    filter_atoms : MaybeSequence[MaybeSequence[Optional[int]]]
+        Subset or subsets of atoms.
+    filenames : Optional[MaybeSequence[PathLike]]
+        Filename or filenames for each subset.
+
+    Returns
+    -------
+    tuple[Sequence[Sequence[Optional[int]]], Optional[Sequence[PathLike]]]
+        Sequence of subsets of atoms, and sequence of filenames, if present.
+    """
+    if not isinstance(filter_atoms, Sequence):
+        filter_atoms = (filter_atoms,)
+    if not isinstance(filter_atoms[0], Sequence):
+        filter_atoms = (filter_atoms,)
+
+    if filenames:
+        if isinstance(filenames, str) or not isinstance(filenames, Sequence):
+            filenames = (filenames,)
+
+        if len(filenames) != len(filter_atoms):
+            raise ValueError(
+                f"Different number of file names ({len(filenames)}) "
+                f"to number of samples ({len(filter_atoms)})"
+            )
+
+    return filter_atoms, filenames
+
+
+def _average_filters(
+    correlations: NDArray[float64],
+    filter_atoms: Sequence[Sequence[Optional[int]]],
+) -> list[NDArray[float64]]:
+    """
+    Average correlations of each atom over subsets of atoms.
+
+    Parameters
+    ----------
+    correlations : NDArray[float64]
+        Correlation of each atom, with shape (atoms, lags).
+    filter_atoms : Sequence[Sequence[Optional[int]]]
+        Subsets of atoms. A subset of (None,) selects all atoms.
+
+    Returns
+    -------
+    list[NDArray[float64]]
+        Average correlation for each subset.
+    """
+    return [
+        np.average(
+            correlations if atoms[0] is None else correlations[list(atoms)], axis=0
+        )
+        for atoms in filter_atoms
+    ]
+
+
+def stream_vaf(
+    frames: Iterable[Atoms],
+    filenames: Optional[MaybeSequence[PathLike]] = None,
+    *,
+    max_lag: int = 1000,
+    use_velocities: bool = False,
+    fft: bool = False,
+    index: SliceLike = (0, None, 1),
+    filter_atoms: MaybeSequence[MaybeSequence[Optional[int]]] = ((None),),
+    chunk_size: int = 256,
+) -> list[NDArray[float64]]:
+    """
+    Compute the velocity autocorrelation function (VAF), reading frames one by one.
+
+    Unlike `compute_vaf`, frames may be read lazily, such as using `ase.io.iread`
+    or `HDF5Trajectory`, and only the last `2 * max_lag` frames are stored. For
+    lags up to `max_lag`, results match `compute_vaf`.
+
+    Parameters
+    ----------
+    frames : Iterable[Atoms]
+        Structures to compute VAF of.
+    filenames : Optional[MaybeSequence[PathLike]]
+        If present, dump resultant VAF to file.
+    max_lag : int
+        Maximum number of lags, including zero, to compute VAF for. Default is 1000.
+    use_velocities : bool
+        Compute VAF using velocities rather than momenta. Default is False.
+    fft : bool
+        Compute the fourier transform of each VAF over lags. Default is False.
+    index : SliceLike
+        Images to analyze as `start`, `stop`, `step`, which must not be negative.
+        Default is all images.
+    filter_atoms : MaybeSequence[MaybeSequence[Optional[int]]]
+        Compute the VAF averaged over subsets of the system. Default is all atoms.
+    chunk_size : int
+        Maximum number of atoms to correlate at once, bounding memory use.
+        Default is 256.
+
+    Returns
+    -------
+    list[NDArray[float64]]
+        Computed VAF(s).
+    """
+    filter_atoms, filenames = _process_filters(filter_atoms, filenames)
+
+    correlator = _BlockCorrelator(max_lag, chunk_size=chunk_size)
+    for struct in islice(frames, *_process_index(index)):
+        if use_velocities:
+            correlator.update(struct.get_velocities())
+        else:
+            correlator.update(struct.get_momenta())
+
+    vafs = _average_filters(correlator.get_correlations(), filter_atoms)
+    if fft:
+        vafs = [np.fft.fft(vaf) for vaf in vafs]
+
+    if filenames:
+        for filename, vaf in zip(filenames, vafs):
+            with open(filename, "w", encoding="utf-8") as out_file:
+                print(*vaf, file=out_file, sep="\n")
+
+    return vafs
+
+
+def compute_msd(
+    frames: Iterable[Atoms],
+    filenames: Optional[MaybeSequence[PathLike]] = None,
+    *,
+    max_lag: int = 1000,
+    timestep: float = 1.0,
+    unwrap: bool = True,
+    index: SliceLike = (0, None, 1),
+    filter_atoms: MaybeSequence[MaybeSequence[Optional[int]]] = ((None),),
+    chunk_size: int = 256,
+) -> list[NDArray[float64]]:
+    """
+    Compute the mean-squared displacement (MSD), reading frames one by one.
+
+    Frames may be read lazily, such as using `ase.io.iread` or `HDF5Trajectory`,
+    and only the last `2 * max_lag` frames are stored.
+
+    Parameters
+    ----------
+    frames : Iterable[Atoms]
+        Structures to compute MSD of.
+    filenames : Optional[MaybeSequence[PathLike]]
+        If present, dump lag times, resultant MSD, and diffusion coefficient to file.
+    max_lag : int
+        Maximum number of lags, including zero, to compute MSD for. Default is 1000.
+    timestep : float
+        Time between analysed frames, in fs, used to write lag times and diffusion
+        coefficients. Default is 1.0.
+    unwrap : bool
+        Whether to unwrap positions across periodic boundaries, assuming atoms move
+        less than half a cell between frames. Default is True.
+    index : SliceLike
+        Images to analyze as `start`, `stop`, `step`, which must not be negative.
+        Default is all images.
+    filter_atoms : MaybeSequence[MaybeSequence[Optional[int]]]
+        Compute the MSD averaged over subsets of the system. Default is all atoms.
+    chunk_size : int
+        Maximum number of atoms to correlate at once, bounding memory use.
+        Default is 256.
+
+    Returns
+    -------
+    list[NDArray[float64]]
+        Computed MSD(s), in Å^2.
+    """
+    filter_atoms, filenames = _process_filters(filter_atoms, filenames)
+
+    correlator = _BlockCorrelator(max_lag, msd=True, chunk_size=chunk_size)
+    positions = None
+    wrapped = None
+    for struct in islice(frames, *_process_index(index)):
+        if wrapped is None or not unwrap:
+            positions = struct.get_positions()
+        else:
+            # Apply minimum image convention to displacements between frames
+            displacements = struct.positions - wrapped
+            if any(struct.pbc):
+                scaled = struct.cell.scaled_positions(displacements)
+                scaled[:, struct.pbc] -= np.round(scaled[:, struct.pbc])
+                displacements = struct.cell.cartesian_positions(scaled)
+            positions = positions + displacements
+        wrapped = struct.get_positions()
+        correlator.update(positions)
+
+    msds = _average_filters(correlator.get_correlations(), filter_atoms)
+
+    if filenames:
+        for filename, msd in zip(filenames, msds):
+            times = timestep * np.arange(len(msd))
+            diffusion = compute_diffusion_coefficient(msd, timestep)
+            with open(filename, "w", encoding="utf-8") as out_file:
+                print(
+                    f"# Time [fs] | MSD [Å^2] | D = {diffusion} Å^2/fs",
+                    file=out_file,
+                )
+                for time, value in zip(times, msd):
+                    print(time, value, file=out_file)
+
+    return msds
+
+
+def compute_diffusion_coefficient(
+    msd: NDArray[float64],
+    timestep: float = 1.0,
+    fit_range: tuple[float, float] = (0.1, 0.9),
+) -> float:
+    """
+    Estimate the diffusion coefficient from the gradient of the MSD.
+
+    The Einstein relation, MSD = 6Dt, is fitted by least squares to the MSD for
+    lag times in `fit_range`, avoiding the ballistic regime at short times, and
+    noisy values with few time origins at long times.
+
+    Parameters
+    ----------
+    msd : NDArray[float64]
+        Mean-squared displacement for each lag, as returned by `compute_msd`.
+    timestep : float
+        Time between lags, in fs. Default is 1.0.
+    fit_range : tuple[float, float]
+        Start and end of lags to fit, as fractions of the number of lags. Default
+        is (0.1, 0.9).
+
+    Returns
+    -------
+    float
+        Diffusion coefficient, in Å^2/fs.
+    """
+    start = int(fit_range[0] * len(msd))
+    stop = max(int(fit_range[1] * len(msd)), start + 2)
+    if stop > len(msd):
+        raise ValueError("At least two lags are required to fit diffusion coefficient")
+
+    times = timestep * np.arange(start, stop)
+    gradient = np.polyfit(times, msd[start:stop], 1)[0]
+    return gradient / 6
@@ -0,0 +1,282 @@
+"""On-disk cache of calculated results for structures."""
+
+from collections.abc import Collection
+from hashlib import sha256
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+from ase import Atoms
+from ase.calculators.calculator import BaseCalculator
+import numpy as np
+
+from janus_core.helpers.janus_types import PathLike
+from janus_core.helpers.mlip_calculators import model_checksum
+from janus_core.helpers.utils import SharedCalculator
+
+DEFAULT_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser()
+    / "janus_core"
+    / "results"
+)
+
+# Fraction of the maximum size results are pruned to when it is exceeded
+PRUNE_FRACTION = 0.9
+
+
+class ResultCache:
+    """
+    Content-addressed cache of calculated results, stored on disk.
+
+    Results are stored in a separate ``.npz`` file for each structure and model,
+    named by a hash of the atomic numbers, positions, cell and periodic boundary
+    conditions of the structure, and a checksum of the calculator and model weights,
+    which includes their precision.
+
+    Parameters
+    ----------
+    directory : PathLike
+        Directory to store results in. Default is `DEFAULT_CACHE_DIR`.
+    max_size : Optional[int]
+        Maximum total size of stored results, in bytes. When exceeded, least recently
+        used results are removed, until the size is within `PRUNE_FRACTION` of the
+        maximum. Default is None, which does not limit size.
+    """
+
+    def __init__(
+        self, directory: PathLike = DEFAULT_CACHE_DIR, max_size: Optional[int] = None
+    ) -> None:
+        """
+        Initialise cache, creating `directory` if necessary.
+
+        Parameters
+        ----------
+        directory : PathLike
+            Directory to store results in. Default is `DEFAULT_CACHE_DIR`.
+        max_size : Optional[int]
+            Maximum total size of stored results, in bytes. When exceeded, least
+            recently used results are removed, until the size is within
+            `PRUNE_FRACTION` of the maximum. Default is None, which does not limit
+            size.
+        """
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self._checksums = {}
+        # Running total of stored sizes, found from the directory when first needed
+        self._size: Optional[int] = None
+
+    def _model_checksum(self, calc: BaseCalculator) -> str:
+        """
+        Get the checksum of a calculator, calculating it only once per model.
+
+        Parameters
+        ----------
+        calc : BaseCalculator
+            Calculator to identify.
+
+        Returns
+        -------
+        str
+            Checksum of the calculator and model.
+        """
+        if isinstance(calc, SharedCalculator):
+            calc = calc.calc
+        if id(calc) not in self._checksums:
+            # Store calculator to ensure id is not reused
+            self._checksums[id(calc)] = (calc, model_checksum(calc))
+        return self._checksums[id(calc)][1]
+
+    def key(self, struct: Atoms) -> str:
+        """
+        Build the cache key for a structure and its attached calculator.
+
+        Parameters
+        ----------
+        struct : Atoms
+            Structure with attached calculator.
+
+        Returns
+        -------
+        str
+            Hexadecimal SHA-256 hash identifying the structure and model.
+        """
+        key = sha256()
+        key.update(self._model_checksum(struct.calc).encode())
+        key.update(struct.numbers.astype(np.int64).tobytes())
+        key.update(struct.positions.astype(np.float64).tobytes())
+        key.update(struct.cell.array.astype(np.float64).tobytes())
+        key.update(struct.pbc.astype(np.bool_).tobytes())
+        return key.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        """
+        Get the file storing results for a key.
+
+        Parameters
+        ----------
+        key : str
+            Cache key.
+
+        Returns
+        -------
+        Path
+            Path to results file.
+        """
+        return self.directory / key[:2] / f"{key}.npz"
+
+    def get(self, struct: Atoms) -> Optional[dict[str, Any]]:
+        """
+        Get stored results for a structure.
+
+        Parameters
+        ----------
+        struct : Atoms
+            Structure with attached calculator.
+
+        Returns
+        -------
+        Optional[dict[str, Any]]
+            Stored results, or None if the structure has not been stored.
+        """
+        path = self._path(self.key(struct))
+        try:
+            with np.load(path) as data:
+                results = {
+                    key: value.item() if value.ndim == 0 else value
+                    for key, value in data.items()
+                }
+        except (FileNotFoundError, OSError, ValueError):
+            return None
+
+        # Mark results as recently used
+        path.touch()
+        return results
+
+    def restore(self, struct: Atoms, properties: Collection[str]) -> bool:
+        """
+        Set stored results on a structure's calculator, if all properties are stored.
+
+        Parameters
+        ----------
+        struct : Atoms
+            Structure with attached calculator.
+        properties : Collection[str]
+            Properties that must be stored for results to be used.
+
+        Returns
+        -------
+        bool
+            Whether stored results were set on the calculator.
+        """
+        results = self.get(struct)
+        if results is None or not all(prop in results for prop in properties):
+            return False
+
+        struct.calc.results = results
+        struct.calc.atoms = struct.copy()
+        return True
+
+    def add(self, struct: Atoms, results: dict[str, Any]) -> None:
+        """
+        Store results for a structure.
+
+        Parameters
+        ----------
+        struct : Atoms
+            Structure with attached calculator.
+        results : dict[str, Any]
+            Calculated results to store. Non-numeric results are not stored.
+        """
+        arrays = {}
+        for key, value in results.items():
+            value = np.asarray(value)
+            if value.dtype.kind in "biuf":
+                arrays[key] = value
+
+        key = self.key(struct)
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+
+        # Write to a temporary file first, so results are never partially written
+        tmp_path = path.with_name(f"{key}-{os.getpid()}.tmp.npz")
+        np.savez(tmp_path, **arrays)
+        size = tmp_path.stat().st_size
+        replaced = path.stat().st_size if path.exists() else 0
+        tmp_path.replace(path)
+
+        if self.max_size is None:
+            return
+
+        if self._size is None:
+            self._size = self.info()["size"]
+        else:
+            self._size += size - replaced
+
+        # Prune below the limit, so the directory is only scanned occasionally
+        if self._size > self.max_size:
+            self.prune(int(self.max_size * PRUNE_FRACTION))
+
+    def _files(self) -> list[Path]:
+        """
+        Get all stored results files.
+
+        Returns
+        -------
+        list[Path]
+            Paths to stored results files.
+        """
+        return [
+            path
+            for path in self.directory.glob("*/*.npz")
+            if not path.name.endswith(".tmp.npz")
+        ]
+
+    def info(self) -> dict[str, Any]:
+        """
+        Summarise the contents of the cache.
+
+        Returns
+        -------
+        dict[str, Any]
+            Cache directory, number of stored results, and their total size in bytes.
+        """
+        files = self._files()
+        return {
+            "directory": str(self.directory),
+            "entries": len(files),
+            "size": sum(path.stat().st_size for path in files),
+        }
+
+    def prune(self, max_size: int = 0) -> int:
+        """
+        Remove least recently used results until their total size is within a limit.
+
+        Parameters
+        ----------
+        max_size : int
+            Maximum total size of stored results to keep, in bytes. Default is 0,
+            which removes all results.
+
+        Returns
+        -------
+        int
+            Number of results removed.
+        """
+        files = sorted(
+            ((path.stat(), path) for path in self._files()),
+            key=lambda item: item[0].st_mtime,
+        )
+        size = sum(stat.st_size for stat, _ in files)
+
+        removed = 0
+        for stat, path in files:
+            if size <= max_size:
+                break
+            path.unlink(missing_ok=True)
+            size -= stat.st_size
+            removed += 1
+
+        # Also accounts for results stored by other processes
+        self._size = size
+        return removed
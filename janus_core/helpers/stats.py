@@ -1,11 +1,16 @@
 """Module that reads the md stats output timeseries."""
 
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 from functools import singledispatchmethod
+from os import stat_result
+from pathlib import Path
 import re
-from typing import TypeVar
+from time import monotonic, sleep
+from typing import BinaryIO, Optional, TypeVar, Union
+import warnings
 
-from numpy import float64, genfromtxt, zeros
+import numpy as np
+from numpy import float64
 from numpy.typing import NDArray
 
 from janus_core.helpers.janus_types import PathLike
@@ -22,13 +27,30 @@ class Stats:
     """
     Configure shared molecular dynamics simulation options.
 
+    Data is loaded when first accessed. By default, a binary copy of the data is
+    cached alongside `source`, named using the size and modification time of
+    `source`, so later readers of an unchanged file can load it directly. Rows
+    written since the file was read, such as by a running simulation, can be added
+    with `refresh`, or iterated over as they are written with `follow`.
+
     Parameters
     ----------
     source : PathLike
         File that contains the stats of a molecular dynamics simulation.
+    usecols : Optional[Sequence[Union[int, str]]]
+        Indices or labels of columns to load. Labels are matched as for indexing.
+        Default is all columns.
+    cache : bool
+        Whether to read and write a cached binary copy of the data. Default is True.
     """
 
-    def __init__(self, source: PathLike) -> None:
+    def __init__(
+        self,
+        source: PathLike,
+        *,
+        usecols: Optional[Sequence[Union[int, str]]] = None,
+        cache: bool = True,
+    ) -> None:
         """
         Initialise MD stats reader.
 
@@ -36,11 +58,22 @@ class Stats:
         ----------
         source : PathLike
             File that contains the stats of a molecular dynamics simulation.
+        usecols : Optional[Sequence[Union[int, str]]]
+            Indices or labels of columns to load. Labels are matched as for
+            indexing. Default is all columns.
+        cache : bool
+            Whether to read and write a cached binary copy of the data. Default is
+            True.
         """
-        self._data = zeros((0, 0))
+        self._data: Optional[NDArray[float64]] = None
         self._labels = ()
         self._units = ()
         self._source = source
+        self._usecols = usecols
+        self._columns: Optional[list[int]] = None
+        self._offset = 0
+        self._file_id: Optional[tuple[int, int]] = None
+        self.cache = cache
         self.read()
 
     @singledispatchmethod
@@ -69,18 +102,7 @@ class Stats:
 
     @_getind.register
     def _(self, lab: str) -> int:  # numpydoc ignore=GL08
-        # Case-insensitive fuzzy match, only has to be `in` the labels
-        index = next(
-            (
-                index
-                for index, label in enumerate(self.labels)
-                if lab.lower() in label.lower()
-            ),
-            None,
-        )
-        if index is None:
-            raise IndexError(f"{lab} not found in labels")
-        return index
+        return _find_label(self.labels, lab)
 
     @singledispatchmethod
     def __getitem__(self, ind) -> NDArray[float64]:
@@ -191,6 +213,8 @@ class Stats:
         NDArray[float64]
             Data for timeseries in `data`.
         """
+        if self._data is None:
+            self._data = self._load()
         return self._data
 
     @property
@@ -206,14 +230,336 @@ class Stats:
         return zip(self.labels, self.units)
 
     def read(self) -> None:
-        """Read MD stats and store them in `data`."""
-        self._data = genfromtxt(self.source, skip_header=1)
-        with open(self.source, "r+", encoding="utf-8") as file:
+        """Read MD stats labels and units, loading `data` when first accessed."""
+        with open(self.source, encoding="utf-8") as file:
             head = file.readline().split("|")
-            self._units = tuple(
-                match[1] if (match := re.search(r"\[(.+?)\]", x)) else "" for x in head
+        units = tuple(
+            match[1] if (match := re.search(r"\[(.+?)\]", x)) else "" for x in head
+        )
+        labels = tuple(re.sub(r"\[.*?\]", "", x).strip() for x in head)
+
+        if self._usecols is None:
+            self._columns = None
+        else:
+            self._columns = [
+                _find_label(labels, col) if isinstance(col, str) else col
+                for col in self._usecols
+            ]
+            labels = tuple(labels[col] for col in self._columns)
+            units = tuple(units[col] for col in self._columns)
+
+        self._labels = labels
+        self._units = units
+        self._data = None
+        self._offset = 0
+
+    def _cache_path(self, stat: stat_result) -> Path:
+        """
+        Get the path of the cached binary data for a version of the source file.
+
+        Parameters
+        ----------
+        stat : stat_result
+            Status of `source`.
+
+        Returns
+        -------
+        Path
+            Path to cached data, named using the size and modification time of
+            `source`.
+        """
+        source = Path(self.source)
+        return source.with_name(f".{source.name}.{stat.st_size}-{stat.st_mtime_ns}.npy")
+
+    def _load(self) -> NDArray[float64]:
+        """
+        Load data from the cached binary copy if valid, otherwise from `source`.
+
+        Returns
+        -------
+        NDArray[float64]
+            Data for requested columns.
+        """
+        stat = Path(self.source).stat()
+        self._file_id = (stat.st_dev, stat.st_ino)
+
+        if self.cache:
+            cache_path = self._cache_path(stat)
+            try:
+                # Data remains mapped, and columns are stored contiguously, so only
+                # columns that are analysed are read from disk
+                data = np.load(cache_path, mmap_mode="r")
+            except (OSError, ValueError):
+                pass
+            else:
+                self._offset = stat.st_size
+                if self._columns is not None:
+                    return _columns_view(data, self._columns)
+                return data
+
+        if not self.cache:
+            data, self._offset = _read_rows(self.source, 0, self._columns)
+            return data
+
+        data, self._offset = _read_rows(self.source, 0)
+        # Only cache data if the file was not written to while reading
+        if self._offset == stat.st_size:
+            self._write_cache(cache_path, data)
+
+        if self._columns is not None:
+            return data[:, self._columns]
+        return data
+
+    def refresh(self) -> int:
+        """
+        Read rows written to `source` since it was last read.
+
+        Only new complete rows are parsed, starting from the end of the previous
+        read, including rows appended when restarting a simulation. If the file
+        has been replaced or truncated, such as by starting a new simulation, all
+        data is read again.
+
+        Returns
+        -------
+        int
+            Number of new rows.
+        """
+        # Header may not have been written completely when previously read
+        if self._data is None or self._offset == 0:
+            self.read()
+            return self.rows
+
+        stat = Path(self.source).stat()
+        if (stat.st_dev, stat.st_ino) != self._file_id or stat.st_size < self._offset:
+            self.read()
+            return self.rows
+
+        rows, self._offset = _read_rows(self.source, self._offset, self._columns)
+        if len(rows):
+            self._data = np.concatenate((self._data, rows)) if self.rows else rows
+        return len(rows)
+
+    def follow(
+        self, interval: float = 1.0, timeout: Optional[float] = None
+    ) -> Iterator[NDArray[float64]]:
+        """
+        Iterate over rows as they are written to `source`, such as by a running job.
+
+        Current rows are yielded first, then new rows after each refresh.
+
+        Parameters
+        ----------
+        interval : float
+            Time between checks for new rows, in seconds. Default is 1.0.
+        timeout : Optional[float]
+            Stop iterating if no new rows are written for this time, in seconds.
+            Default is None, which iterates until stopped.
+
+        Yields
+        ------
+        NDArray[float64]
+            New rows of data.
+        """
+        if self.rows:
+            yield self.data
+
+        last_update = monotonic()
+        while True:
+            n_rows = self.refresh()
+            if n_rows:
+                last_update = monotonic()
+                yield self.data[-n_rows:]
+            elif timeout is not None and monotonic() - last_update >= timeout:
+                return
+            else:
+                sleep(interval)
+
+    def _select(
+        self, cols: Optional[Sequence[Union[int, str]]] = None
+    ) -> NDArray[float64]:
+        """
+        Get data for columns to analyse.
+
+        Parameters
+        ----------
+        cols : Optional[Sequence[Union[int, str]]]
+            Indices or labels of columns. Default is all columns.
+
+        Returns
+        -------
+        NDArray[float64]
+            Data for each row and selected column, as a view of `data` if columns
+            are regularly spaced.
+        """
+        if cols is None:
+            return self.data
+        return _columns_view(self.data, [self._getind(col) for col in cols])
+
+    def running_average(
+        self, cols: Optional[Sequence[Union[int, str]]] = None
+    ) -> NDArray[float64]:
+        """
+        Calculate the average of each column up to each row.
+
+        Parameters
+        ----------
+        cols : Optional[Sequence[Union[int, str]]]
+            Indices or labels of columns to average. Default is all columns.
+
+        Returns
+        -------
+        NDArray[float64]
+            Running average of each column, with the same shape as the data.
+        """
+        data = self._select(cols)
+        averages = np.cumsum(data, axis=0, dtype=float64)
+        averages /= np.arange(1, len(data) + 1)[:, np.newaxis]
+        return averages
+
+    def block_average(
+        self,
+        cols: Optional[Sequence[Union[int, str]]] = None,
+        block_size: Optional[int] = None,
+    ) -> tuple[NDArray[float64], NDArray[float64], NDArray[np.int64]]:
+        """
+        Calculate the average of each column and its error using block averaging.
+
+        If `block_size` is not specified, blocks are repeatedly doubled in size,
+        and the smallest block size for which the standard error has converged is
+        selected for each column, using the criterion of Lee et al., Phys. Rev. E
+        83, 066706 (2011).
+
+        Parameters
+        ----------
+        cols : Optional[Sequence[Union[int, str]]]
+            Indices or labels of columns to average. Default is all columns.
+        block_size : Optional[int]
+            Number of rows in each block. Default is None, which selects the block
+            size for each column automatically.
+
+        Returns
+        -------
+        tuple[NDArray[float64], NDArray[float64], NDArray[np.int64]]
+            Average, standard error of the average, and block size used, for each
+            column.
+        """
+        data = self._select(cols)
+        means = data.mean(axis=0)
+
+        if block_size is not None:
+            if not 1 <= block_size <= len(data) // 2:
+                raise ValueError(
+                    "`block_size` must be at least 1 and give at least two blocks"
+                )
+            n_blocks = len(data) // block_size
+            blocks = data[: n_blocks * block_size].reshape(n_blocks, block_size, -1)
+            errors = _standard_error(blocks.mean(axis=1))
+            return means, errors, np.full(data.shape[1], block_size)
+
+        errors, block_sizes = _blocking(data)
+        # Smallest block size satisfying the criterion, or the largest block size
+        ratios = np.divide(
+            errors, errors[0], out=np.zeros_like(errors), where=errors[0] > 0
+        )
+        converged = block_sizes[:, np.newaxis] ** 3 > 2 * len(data) * ratios**4
+        if not converged.any(axis=0).all():
+            warnings.warn(
+                "Standard errors have not converged with block size. More data is "
+                "required for reliable errors",
+                stacklevel=2,
             )
-            self._labels = tuple(re.sub(r"\[.*?\]", "", x).strip() for x in head)
+            converged[-1] = True
+        optimal = converged.argmax(axis=0)
+
+        return (
+            means,
+            errors[optimal, np.arange(data.shape[1])],
+            block_sizes[optimal],
+        )
+
+    def statistical_inefficiency(
+        self, cols: Optional[Sequence[Union[int, str]]] = None, chunk_size: int = 4
+    ) -> NDArray[float64]:
+        """
+        Calculate the statistical inefficiency of each column.
+
+        The statistical inefficiency is the number of rows per uncorrelated sample,
+        calculated by integrating the normalised autocorrelation function of each
+        column, computed using FFTs, until it first reaches zero.
+
+        Parameters
+        ----------
+        cols : Optional[Sequence[Union[int, str]]]
+            Indices or labels of columns to analyse. Default is all columns.
+        chunk_size : int
+            Maximum number of columns to correlate at once. Default is 4.
+
+        Returns
+        -------
+        NDArray[float64]
+            Statistical inefficiency of each column, which is at least 1.
+        """
+        return _statistical_inefficiency(self._select(cols), chunk_size)
+
+    def detect_equilibration(
+        self, cols: Optional[Sequence[Union[int, str]]] = None
+    ) -> NDArray[np.int64]:
+        """
+        Detect the first equilibrated row of each column.
+
+        Rows are discarded from the start of each column to minimise the marginal
+        standard error of the remaining rows (White, Simulation 69, 323 (1997)), with
+        at most half of the rows discarded.
+
+        Parameters
+        ----------
+        cols : Optional[Sequence[Union[int, str]]]
+            Indices or labels of columns to analyse. Default is all columns.
+
+        Returns
+        -------
+        NDArray[np.int64]
+            Index of the first equilibrated row of each column.
+        """
+        data = self._select(cols)
+        n_rows = len(data)
+        if n_rows < 2:
+            return np.zeros(data.shape[1], dtype=np.int64)
+
+        # Sums over rows from each row to the end, centred to reduce rounding errors
+        centred = data - data.mean(axis=0)
+        sums = np.cumsum(centred[::-1], axis=0)[::-1]
+        sums_sq = np.cumsum(centred[::-1] ** 2, axis=0)[::-1]
+
+        n_starts = n_rows // 2 + 1
+        remaining = np.arange(n_rows, n_rows - n_starts, -1)[:, np.newaxis]
+        sq_deviations = sums_sq[:n_starts] - sums[:n_starts] ** 2 / remaining
+        return np.argmin(sq_deviations / remaining**2, axis=0)
+
+    def _write_cache(self, cache_path: Path, data: NDArray[float64]) -> None:
+        """
+        Write cached binary data, removing caches of previous versions of `source`.
+
+        Parameters
+        ----------
+        cache_path : Path
+            Path to write cached data to.
+        data : NDArray[float64]
+            All columns of data.
+        """
+        prefix = f".{Path(self.source).name}."
+        try:
+            for old_path in cache_path.parent.glob(f"{prefix}*.npy"):
+                old_path.unlink(missing_ok=True)
+
+            # Write to a temporary file first, so data is never partially written
+            tmp_path = cache_path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as file:
+                np.save(file, np.asfortranarray(data))
+            tmp_path.replace(cache_path)
+        except OSError:
+            # Caching is optional, e.g. if the directory is read-only
+            pass
 
     def __repr__(self) -> str:
         """
@@ -229,3 +575,224 @@ class Stats:
         for index, (label, unit) in enumerate(self.data_tags):
             header += f"\n{index} {label} {unit}"
         return header
+
+
+def _find_label(labels: Sequence[str], lab: str) -> int:
+    """
+    Find the index of a label, using a case-insensitive fuzzy match.
+
+    Parameters
+    ----------
+    labels : Sequence[str]
+        Labels to search.
+    lab : str
+        Label to find, which only has to be `in` a label.
+
+    Returns
+    -------
+    int
+        Index of first matching label.
+
+    Raises
+    ------
+    IndexError
+        Label not found in labels.
+    """
+    index = next(
+        (index for index, label in enumerate(labels) if lab.lower() in label.lower()),
+        None,
+    )
+    if index is None:
+        raise IndexError(f"{lab} not found in labels")
+    return index
+
+
+def _columns_view(data: NDArray[float64], columns: Sequence[int]) -> NDArray[float64]:
+    """
+    Get columns of data, without copying if they are regularly spaced.
+
+    Parameters
+    ----------
+    data : NDArray[float64]
+        Data to get columns from.
+    columns : Sequence[int]
+        Indices of columns.
+
+    Returns
+    -------
+    NDArray[float64]
+        Data for each row and requested column.
+    """
+    indices = np.arange(data.shape[1])[list(columns)]
+    if not len(indices):
+        return data[:, 0:0]
+
+    # Regularly spaced columns, such as single columns, are a strided view
+    steps = np.diff(indices)
+    if len(indices) == 1 or (steps[0] != 0 and (steps == steps[0]).all()):
+        step = int(steps[0]) if len(steps) else 1
+        if step > 0:
+            return data[:, indices[0] : indices[-1] + 1 : step]
+        return data[:, indices[-1] : indices[0] + 1 : -step][:, ::-1]
+    return data[:, indices]
+
+
+def _read_rows(
+    source: PathLike, offset: int, columns: Optional[Sequence[int]] = None
+) -> tuple[NDArray[float64], int]:
+    """
+    Parse complete rows of a stats file from a byte offset.
+
+    Lines are streamed from the file to the compiled text reader of NumPy. Comment
+    lines, including the header, are skipped, as is an incomplete final line.
+
+    Parameters
+    ----------
+    source : PathLike
+        Stats file to read.
+    offset : int
+        Byte offset to start reading from.
+    columns : Optional[Sequence[int]]
+        Indices of columns to read. Default is all columns.
+
+    Returns
+    -------
+    tuple[NDArray[float64], int]
+        Data for each row and requested column, and the byte offset of the end of
+        the last complete row.
+    """
+    end = offset
+
+    def complete_lines(file: BinaryIO) -> Iterator[bytes]:
+        """
+        Iterate over lines ending with a new line, recording where they end.
+
+        Parameters
+        ----------
+        file : BinaryIO
+            File to read lines from.
+
+        Yields
+        ------
+        bytes
+            Each complete line.
+        """
+        nonlocal end
+        for line in file:
+            if not line.endswith(b"\n"):
+                return
+            end += len(line)
+            yield line
+
+    with open(source, "rb") as file, warnings.catch_warnings():
+        file.seek(offset)
+        # Files with a header but no rows are valid
+        warnings.filterwarnings("ignore", message=".*input contained no data")
+        data = np.loadtxt(
+            complete_lines(file),
+            dtype=float64,
+            comments="#",
+            usecols=columns,
+            ndmin=2,
+            encoding="utf-8",
+        )
+    return data, end
+
+
+def _standard_error(values: NDArray[float64]) -> NDArray[float64]:
+    """
+    Calculate the standard error of the mean of each column, assuming independence.
+
+    Parameters
+    ----------
+    values : NDArray[float64]
+        Values for each row and column.
+
+    Returns
+    -------
+    NDArray[float64]
+        Standard error of the mean of each column.
+    """
+    return values.std(axis=0, ddof=1) / np.sqrt(len(values))
+
+
+def _blocking(data: NDArray[float64]) -> tuple[NDArray[float64], NDArray[np.int64]]:
+    """
+    Calculate standard errors of column averages, repeatedly doubling block sizes.
+
+    Each transformation averages pairs of neighbouring blocks, following Flyvbjerg
+    and Petersen, J. Chem. Phys. 91, 461 (1989), so all block sizes are calculated
+    in linear time. Transformations continue while at least two blocks remain.
+
+    Parameters
+    ----------
+    data : NDArray[float64]
+        Data for each row and column, with at least two rows.
+
+    Returns
+    -------
+    tuple[NDArray[float64], NDArray[np.int64]]
+        Standard error of the average of each column for each block size, and the
+        block sizes.
+    """
+    if len(data) < 2:
+        raise ValueError("At least two rows are required to estimate errors")
+
+    errors = [_standard_error(data)]
+    blocks = data
+    while len(blocks) >= 4:
+        n_pairs = len(blocks) // 2
+        blocks = 0.5 * (blocks[0 : 2 * n_pairs : 2] + blocks[1 : 2 * n_pairs : 2])
+        errors.append(_standard_error(blocks))
+    return np.array(errors), 2 ** np.arange(len(errors))
+
+
+def _statistical_inefficiency(
+    data: NDArray[float64], chunk_size: int
+) -> NDArray[float64]:
+    """
+    Calculate the statistical inefficiency of each column from its autocorrelation.
+
+    Parameters
+    ----------
+    data : NDArray[float64]
+        Data for each row and column.
+    chunk_size : int
+        Maximum number of columns to correlate at once.
+
+    Returns
+    -------
+    NDArray[float64]
+        Statistical inefficiency of each column, which is at least 1.
+    """
+    if chunk_size < 1:
+        raise ValueError("`chunk_size` must be at least 1")
+
+    n_rows, n_cols = data.shape
+    inefficiencies = np.ones(n_cols)
+    if n_rows < 2:
+        return inefficiencies
+
+    # Power of two at least twice the number of rows, to avoid circular correlation
+    n_fft = 1 << (2 * n_rows - 1).bit_length()
+    weights = 1 - np.arange(1, n_rows) / n_rows
+
+    for start in range(0, n_cols, chunk_size):
+        chunk = slice(start, start + chunk_size)
+        centred = data[:, chunk] - data[:, chunk].mean(axis=0)
+        transform = np.fft.rfft(centred, n=n_fft, axis=0)
+        corrs = np.fft.irfft(transform.real**2 + transform.imag**2, n=n_fft, axis=0)
+        corrs = corrs[:n_rows] / np.arange(n_rows, 0, -1)[:, np.newaxis]
+
+        variance = corrs[0]
+        valid = variance > 0
+        corrs = np.divide(
+            corrs[1:], variance, out=np.zeros_like(corrs[1:]), where=valid
+        )
+
+        # Integrate correlations until they are first not positive
+        positive = np.cumprod(corrs > 0, axis=0, dtype=bool)
+        integral = (weights[:, np.newaxis] * corrs * positive).sum(axis=0)
+        inefficiencies[chunk] = np.maximum(1 + 2 * integral, 1)
+
+    return inefficiencies
@@ -0,0 +1,464 @@
+"""Read and write compact binary trajectories in HDF5 format."""
+
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from ase import Atoms
+from ase.calculators.calculator import all_properties
+from ase.calculators.singlepoint import SinglePointCalculator
+import h5py
+import numpy as np
+from numpy.typing import NDArray
+
+from janus_core.helpers.janus_types import PathLike
+
+HDF5_SUFFIXES = (".h5", ".hdf5")
+
+
+class HDF5TrajectoryWriter:
+    """
+    Append structures to an HDF5 trajectory file, kept open between frames.
+
+    Positions, momenta and cells are stored for each frame, alongside numeric
+    calculator results in the "results" group, and numeric values from
+    `Atoms.info` in the "info" group. Atomic numbers, masses and periodic boundary
+    conditions are stored once, and string values from `Atoms.info` of the first
+    frame are stored as attributes of the "info" group. Other values are not stored.
+
+    Parameters
+    ----------
+    filename : PathLike
+        File to write trajectory to.
+    append : bool
+        Whether to append frames to an existing trajectory, rather than overwriting
+        it. Default is False.
+    float32 : bool
+        Whether to store positions, momenta and per-atom results in single
+        precision. Default is False.
+    compression : Optional[str]
+        HDF5 compression filter for per-frame data, such as "gzip" or "lzf". Default
+        is None.
+    compression_opts : Optional[Any]
+        Options for the compression filter, such as the gzip level. Default is None.
+    chunk_frames : int
+        Number of frames stored in each HDF5 chunk. Default is 64.
+    """
+
+    def __init__(
+        self,
+        filename: PathLike,
+        *,
+        append: bool = False,
+        float32: bool = False,
+        compression: Optional[str] = None,
+        compression_opts: Optional[Any] = None,
+        chunk_frames: int = 64,
+    ) -> None:
+        """
+        Initialise writer. The file is opened when the first frame is written.
+
+        Parameters
+        ----------
+        filename : PathLike
+            File to write trajectory to.
+        append : bool
+            Whether to append frames to an existing trajectory, rather than
+            overwriting it. Default is False.
+        float32 : bool
+            Whether to store positions, momenta and per-atom results in single
+            precision. Default is False.
+        compression : Optional[str]
+            HDF5 compression filter for per-frame data, such as "gzip" or "lzf".
+            Default is None.
+        compression_opts : Optional[Any]
+            Options for the compression filter, such as the gzip level. Default is
+            None.
+        chunk_frames : int
+            Number of frames stored in each HDF5 chunk. Default is 64.
+        """
+        if chunk_frames < 1:
+            raise ValueError("`chunk_frames` must be at least 1")
+
+        self.filename = Path(filename)
+        self.append = append
+        self.float32 = float32
+        self.compression = compression
+        self.compression_opts = compression_opts
+        self.chunk_frames = chunk_frames
+        self.file: Optional[h5py.File] = None
+        self._datasets: set[str] = set()
+
+    def __enter__(self) -> "HDF5TrajectoryWriter":
+        """
+        Enter the context of the writer.
+
+        Returns
+        -------
+        HDF5TrajectoryWriter
+            The writer.
+        """
+        return self
+
+    def __exit__(self, *args) -> None:
+        """
+        Close the file when leaving the context.
+
+        Parameters
+        ----------
+        *args
+            Exception information, if raised.
+        """
+        self.close()
+
+    def _open(self, struct: Atoms) -> None:
+        """
+        Open the file, storing data shared by all frames if it is new.
+
+        Parameters
+        ----------
+        struct : Atoms
+            First structure to be written.
+        """
+        mode = "a" if self.append and self.filename.exists() else "w"
+        self.file = h5py.File(self.filename, mode)
+
+        if "numbers" in self.file:
+            if not np.array_equal(self.file["numbers"], struct.numbers):
+                raise ValueError(
+                    f"Unable to append to {self.filename}, which contains different "
+                    "atoms"
+                )
+            self.file.visititems(
+                lambda name, obj: (
+                    self._datasets.add(name)
+                    if isinstance(obj, h5py.Dataset) and obj.maxshape[0] is None
+                    else None
+                )
+            )
+            return
+
+        self.file["numbers"] = struct.numbers
+        self.file["masses"] = struct.get_masses()
+        self.file["pbc"] = struct.pbc
+        info = self.file.create_group("info")
+        for key, value in struct.info.items():
+            if isinstance(value, str):
+                info.attrs[key] = value
+
+    def _append(
+        self, name: str, value: Any, n_frames: int, per_atom: bool = False
+    ) -> None:
+        """
+        Append a value to a per-frame dataset, creating it if necessary.
+
+        Frames written before the dataset was created, or with values of a different
+        shape, are filled with NaN, or zero for integer data.
+
+        Parameters
+        ----------
+        name : str
+            Name of dataset.
+        value : Any
+            Value for the current frame.
+        n_frames : int
+            Number of frames already written.
+        per_atom : bool
+            Whether the value has an entry for each atom. Default is False.
+        """
+        value = np.asarray(value)
+        if name not in self.file:
+            dtype = value.dtype
+            if self.float32 and per_atom and dtype == np.float64:
+                dtype = np.dtype(np.float32)
+            self.file.create_dataset(
+                name,
+                shape=(n_frames, *value.shape),
+                maxshape=(None, *value.shape),
+                dtype=dtype,
+                chunks=(self.chunk_frames, *value.shape),
+                compression=self.compression,
+                compression_opts=self.compression_opts,
+                fillvalue=np.nan if dtype.kind == "f" else 0,
+            )
+            self._datasets.add(name)
+
+        dataset = self.file[name]
+        dataset.resize(n_frames + 1, axis=0)
+        if dataset.shape[1:] == value.shape:
+            dataset[n_frames] = value
+
+    def write(self, struct: Atoms) -> None:
+        """
+        Append a structure to the trajectory.
+
+        Parameters
+        ----------
+        struct : Atoms
+            Structure to write, with the results of its calculator.
+        """
+        if self.file is None:
+            self._open(struct)
+
+        n_frames = len(self.file["positions"]) if "positions" in self.file else 0
+
+        self._append("positions", struct.positions, n_frames, per_atom=True)
+        self._append("momenta", struct.get_momenta(), n_frames, per_atom=True)
+        self._append("cell", struct.cell.array, n_frames)
+
+        if struct.calc is not None:
+            for key, value in struct.calc.results.items():
+                value = np.asarray(value)
+                if value.dtype.kind in "biuf":
+                    per_atom = value.ndim > 0 and len(value) == len(struct)
+                    self._append(f"results/{key}", value, n_frames, per_atom)
+
+        for key, value in struct.info.items():
+            if np.asarray(value).dtype.kind in "biuf":
+                self._append(f"info/{key}", value, n_frames)
+
+        # Fill values missing from this frame
+        for name in self._datasets:
+            if len(self.file[name]) == n_frames:
+                self.file[name].resize(n_frames + 1, axis=0)
+
+    def flush(self) -> None:
+        """Write buffered data to the file."""
+        if self.file is not None:
+            self.file.flush()
+
+    def close(self) -> None:
+        """Close the file."""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+class HDF5Trajectory(Sequence):
+    """
+    Read frames from an HDF5 trajectory file.
+
+    Arrays for a range of frames can be read directly with `get_array`, while
+    indexing builds Atoms objects, only for the requested frames.
+
+    Parameters
+    ----------
+    filename : PathLike
+        Trajectory file to read.
+    block_size : int
+        Number of frames read from the file at once when iterating. Default is 64.
+    """
+
+    def __init__(self, filename: PathLike, block_size: int = 64) -> None:
+        """
+        Initialise reader.
+
+        Parameters
+        ----------
+        filename : PathLike
+            Trajectory file to read.
+        block_size : int
+            Number of frames read from the file at once when iterating. Default is
+            64.
+        """
+        self.filename = Path(filename)
+        self.block_size = block_size
+        with h5py.File(self.filename, "r") as file:
+            self._n_frames = len(file["positions"])
+
+    def __len__(self) -> int:
+        """
+        Get the number of frames.
+
+        Returns
+        -------
+        int
+            Number of frames in the trajectory.
+        """
+        return self._n_frames
+
+    def __iter__(self) -> Iterator[Atoms]:
+        """
+        Iterate over structures, reading frames from the file in blocks.
+
+        Yields
+        ------
+        Atoms
+            Structure for each frame.
+        """
+        for start in range(0, self._n_frames, self.block_size):
+            yield from self[start : start + self.block_size]
+
+    def get_array(
+        self, name: str, index: Optional[Union[int, slice]] = None
+    ) -> NDArray:
+        """
+        Read an array for a range of frames.
+
+        Parameters
+        ----------
+        name : str
+            Name of array, such as "positions", "momenta", "cell",
+            "results/forces" or "info/step". Arrays shared by all frames, such as
+            "numbers" and "masses", are read in full.
+        index : Optional[Union[int, slice]]
+            Frames to read. Default is all frames.
+
+        Returns
+        -------
+        NDArray
+            Requested array, with frames as the first axis if per-frame.
+        """
+        with h5py.File(self.filename, "r") as file:
+            if name in ("numbers", "masses", "pbc") or index is None:
+                return file[name][()]
+            return _read_frames(file[name], self._frames(index))
+
+    def _frames(self, index: Union[int, slice]) -> Union[int, NDArray]:
+        """
+        Convert an index into frame indices, supporting negative steps.
+
+        Parameters
+        ----------
+        index : Union[int, slice]
+            Frame or frames to select.
+
+        Returns
+        -------
+        Union[int, NDArray]
+            Index of frame, or indices of frames.
+        """
+        if isinstance(index, slice):
+            return np.arange(self._n_frames)[index]
+        if index < 0:
+            index += self._n_frames
+        if not 0 <= index < self._n_frames:
+            raise IndexError("Trajectory index out of range")
+        return index
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Atoms, list[Atoms]]:
+        """
+        Build structures for one or more frames.
+
+        Parameters
+        ----------
+        index : Union[int, slice]
+            Frame or frames to build.
+
+        Returns
+        -------
+        Union[Atoms, list[Atoms]]
+            Structure, or list of structures, with stored results attached using a
+            SinglePointCalculator.
+        """
+        frames = self._frames(index)
+        single = not isinstance(frames, np.ndarray)
+        frames = np.atleast_1d(frames)
+
+        with h5py.File(self.filename, "r") as file:
+            positions = _read_frames(file["positions"], frames)
+            momenta = _read_frames(file["momenta"], frames)
+            cells = _read_frames(file["cell"], frames)
+            results = {
+                key: _read_frames(dataset, frames)
+                for key, dataset in file.get("results", {}).items()
+                if key in all_properties
+            }
+            info = {
+                key: _read_frames(dataset, frames)
+                for key, dataset in file["info"].items()
+            }
+            static_info = dict(file["info"].attrs)
+            numbers = file["numbers"][()]
+            masses = file["masses"][()]
+            pbc = file["pbc"][()]
+
+        structs = []
+        for i in range(len(frames)):
+            struct = Atoms(
+                numbers=numbers,
+                positions=positions[i],
+                cell=cells[i],
+                pbc=pbc,
+                masses=masses,
+                momenta=momenta[i],
+            )
+            struct.info.update(static_info)
+            struct.info.update(
+                {key: _frame_value(value[i]) for key, value in info.items()}
+            )
+            struct.calc = SinglePointCalculator(
+                struct,
+                **{key: _frame_value(value[i]) for key, value in results.items()},
+            )
+            structs.append(struct)
+
+        return structs[0] if single else structs
+
+
+def _read_frames(dataset: h5py.Dataset, frames: Union[int, NDArray]) -> NDArray:
+    """
+    Read frames from a per-frame dataset, in any order.
+
+    Parameters
+    ----------
+    dataset : h5py.Dataset
+        Dataset to read.
+    frames : Union[int, NDArray]
+        Index of frame, or indices of frames.
+
+    Returns
+    -------
+    NDArray
+        Values for the requested frames.
+    """
+    if not isinstance(frames, np.ndarray):
+        return dataset[frames]
+    if not len(frames):
+        return dataset[0:0]
+
+    # Regularly spaced frames, such as from slices, are read as a strided slice
+    steps = np.diff(frames)
+    if len(frames) == 1 or (steps[0] != 0 and (steps == steps[0]).all()):
+        step = int(steps[0]) if len(steps) else 1
+        if step > 0:
+            return dataset[frames[0] : frames[-1] + 1 : step]
+        return dataset[frames[-1] : frames[0] + 1 : -step][::-1]
+
+    # h5py only supports increasing indices, so read unique frames in order
+    unique, inverse = np.unique(frames, return_inverse=True)
+    return dataset[unique][inverse]
+
+
+def _frame_value(value: NDArray) -> Any:
+    """
+    Convert a value read for a single frame to a Python scalar, if it is scalar.
+
+    Parameters
+    ----------
+    value : NDArray
+        Value read for a frame.
+
+    Returns
+    -------
+    Any
+        Python scalar, or the unchanged array.
+    """
+    return value.item() if value.ndim == 0 else value
+
+
+def is_hdf5(filename: PathLike) -> bool:
+    """
+    Check whether a trajectory file name has an HDF5 suffix.
+
+    Parameters
+    ----------
+    filename : PathLike
+        File name to check.
+
+    Returns
+    -------
+    bool
+        Whether `filename` ends with ".h5" or ".hdf5".
+    """
+    return Path(filename).suffix.lower() in HDF5_SUFFIXES
@@ -2,18 +2,20 @@
 
 from abc import ABC
 from collections.abc import Collection, Generator, Iterable, Sequence
-from copy import copy
-from io import StringIO
+from io import BytesIO, StringIO
 import logging
 from pathlib import Path
-from typing import Any, Literal, Optional, TextIO, Union, get_args
+from time import monotonic
+from typing import Any, BinaryIO, Literal, Optional, TextIO, Union, get_args
 
 from ase import Atoms
-from ase.calculators.calculator import Calculator
+from ase.calculators.calculator import BaseCalculator, Calculator
 from ase.calculators.mixing import SumCalculator
 from ase.io import read, write
 from ase.io.formats import filetype
 from ase.spacegroup.symmetrize import refine_symmetry
+import numpy as np
+from numpy import ndarray
 from rich.progress import (
     BarColumn,
     MofNCompleteColumn,
@@ -166,6 +168,116 @@ class FileNameMixin(ABC):  # noqa: B024 (abstract-base-class-without-abstract-me
         return built_filename
 
 
+class SharedCalculator(BaseCalculator):
+    """
+    Calculator view that shares an MLIP calculator between structures.
+
+    Calculations are delegated to the shared calculator, while the calculated results
+    and the state of the structure they were calculated for are stored per structure.
+    All other attributes, such as the loaded model and `parameters`, are taken from
+    the shared calculator.
+
+    Parameters
+    ----------
+    calc : Calculator
+        Calculator to share.
+    """
+
+    def __init__(self, calc: Calculator) -> None:
+        """
+        Initialise calculator view.
+
+        Parameters
+        ----------
+        calc : Calculator
+            Calculator to share.
+        """
+        self.calc = calc
+        self.atoms = None
+        self.results = {}
+        self.use_cache = True
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Get attributes not set on the view from the shared calculator.
+
+        Parameters
+        ----------
+        name : str
+            Name of attribute.
+
+        Returns
+        -------
+        Any
+            Attribute of shared calculator.
+        """
+        if name.startswith("__") or "calc" not in self.__dict__:
+            raise AttributeError(name)
+        return getattr(self.calc, name)
+
+    @property
+    def parameters(self) -> dict[str, Any]:
+        """
+        Get parameters of the shared calculator.
+
+        Returns
+        -------
+        dict[str, Any]
+            Get parameters of the shared calculator.
+        """
+        return self.calc.parameters
+
+    @property
+    def implemented_properties(self) -> list[str]:
+        """
+        Get properties the shared calculator can calculate.
+
+        Returns
+        -------
+        list[str]
+            Properties implemented by the shared calculator.
+        """
+        return self.calc.implemented_properties
+
+    def _get_name(self) -> str:
+        """
+        Get name of the shared calculator.
+
+        Returns
+        -------
+        str
+            Name of the shared calculator.
+        """
+        return self.calc.name
+
+    def calculate(
+        self,
+        atoms: Optional[Atoms] = None,
+        properties: Collection[str] = ("energy",),
+        system_changes: Optional[Collection[str]] = None,
+    ) -> None:
+        """
+        Calculate properties using the shared calculator and store the results.
+
+        Parameters
+        ----------
+        atoms : Optional[Atoms]
+            Structure to calculate properties for. Default is `self.atoms`.
+        properties : Collection[str]
+            Properties to calculate. Default is ("energy",).
+        system_changes : Optional[Collection[str]]
+            Unused, as the shared calculator checks its own state. Default is None.
+        """
+        atoms = atoms if atoms is not None else self.atoms
+        for prop in properties:
+            self.calc.get_property(prop, atoms)
+        # Copy arrays, as some calculators update their results in place
+        self.results = {
+            key: value.copy() if isinstance(value, ndarray) else value
+            for key, value in self.calc.results.items()
+        }
+
+
 def spacegroup(
     struct: Atoms, sym_tolerance: float = 0.001, angle_tolerance: float = -1.0
 ) -> str:
@@ -282,6 +394,9 @@ def attach_calculator(
     """
     Configure calculator and attach to structure(s).
 
+    A single calculator is shared by all structures in a sequence, with each
+    structure's results stored separately by a `SharedCalculator`.
+
     Parameters
     ----------
     struct : Optional[MaybeSequence[Atoms]]
@@ -306,7 +421,7 @@ def attach_calculator(
 
     if isinstance(struct, Sequence):
         for image in struct:
-            image.calc = copy(calculator)
+            image.calc = SharedCalculator(calculator)
     else:
         struct.calc = calculator
 
@@ -501,14 +616,14 @@ def output_structs(
 
 
 def write_table(
-    fmt: Literal["ascii", "csv"],
-    file: Optional[TextIO] = None,
+    fmt: Literal["ascii", "csv", "npz"],
+    file: Optional[Union[TextIO, BinaryIO, PathLike]] = None,
     units: Optional[dict[str, str]] = None,
     formats: Optional[dict[str, str]] = None,
     *,
     print_header: bool = True,
     **columns,
-) -> Optional[StringIO]:
+) -> Optional[Union[StringIO, BytesIO]]:
     """
     Dump a table in a standard format.
 
@@ -520,13 +635,18 @@ def write_table(
     These can also be passed explicitly through the respective
     dictionaries where the key is the "header".
 
+    Text tables are formatted using a template for each row, built once from the
+    column formats, and written in a single call.
+
     Parameters
     ----------
-    fmt : {'ascii', 'csv'}
-        Format to write table in.
-    file : TextIO
-        File to dump to. If unspecified function returns
-        io.StringIO object simulating file.
+    fmt : {'ascii', 'csv', 'npz'}
+        Format to write table in. "npz" writes each column as a NumPy array, with
+        units as "<header>_units" string arrays.
+    file : Optional[Union[TextIO, BinaryIO, PathLike]]
+        File to dump to. Must be a binary file or path for "npz". If unspecified
+        function returns io.StringIO, or io.BytesIO for "npz", object simulating
+        file.
     units : dict[str, str]
         Units as ``{key: unit}``:
 
@@ -554,8 +674,8 @@ def write_table(
 
     Returns
     -------
-    Optional[StringIO]
-        If no file given write columns to StringIO.
+    Optional[Union[StringIO, BytesIO]]
+        If no file given write columns to StringIO, or BytesIO for "npz".
 
     Notes
     -----
@@ -612,9 +732,17 @@ def write_table(
     columns = {
         key: val if isinstance(val, Iterable) else (val,)
         for key, val in columns.items()
-        if not key.endswith("_units")
+        if not key.endswith(("_units", "_format"))
     }
 
+    if fmt == "npz":
+        dump_loc = file if file is not None else BytesIO()
+        _dump_npz(dump_loc, units if print_header else {}, columns)
+        if file is None:
+            dump_loc.seek(0)
+            return dump_loc
+        return None
+
     if print_header:
         header = [
             f"{datum}" + (f" [{unit}]" if (unit := units.get(datum, "")) else "")
@@ -638,6 +766,34 @@ def write_table(
     return None
 
 
+def _format_rows(
+    columns: dict[str, Sequence[Any]], formats: Sequence[str], delimiter: str
+) -> str:
+    """
+    Format rows of a table using a template built from the column formats.
+
+    Parameters
+    ----------
+    columns : dict[str, Sequence[Any]]
+        Column data by key.
+    formats : Sequence[str]
+        Python magic string formats to apply (must align with columns).
+    delimiter : str
+        String separating columns.
+
+    Returns
+    -------
+    str
+        Formatted rows, each ending with a new line.
+    """
+    template = delimiter.join(f"{{:{fmt}}}" for fmt in formats) + "\n"
+    # Python scalars are formatted faster than NumPy scalars
+    values = (
+        val.tolist() if isinstance(val, ndarray) else val for val in columns.values()
+    )
+    return "".join(map(template.format, *values))
+
+
 def _dump_ascii(
     file: TextIO,
     header: list[str],
@@ -666,8 +822,8 @@ def _dump_ascii(
     if header:
         print(f"# {' | '.join(header)}", file=file)
 
-    for cols in zip(*columns.values()):
-        print(*map(format, cols, formats), file=file)
+    if columns:
+        file.write(_format_rows(columns, formats, " "))
 
 
 def _dump_csv(
@@ -698,8 +854,179 @@ def _dump_csv(
     if header:
         print(",".join(header), file=file)
 
-    for cols in zip(*columns.values()):
-        print(",".join(map(format, cols, formats)), file=file)
+    if columns:
+        file.write(_format_rows(columns, formats, ","))
+
+
+def _dump_npz(
+    file: Union[BinaryIO, PathLike],
+    units: dict[str, str],
+    columns: dict[str, Sequence[Any]],
+) -> None:
+    """
+    Dump data as NumPy arrays in an uncompressed npz archive.
+
+    Parameters
+    ----------
+    file : Union[BinaryIO, PathLike]
+        File to dump to.
+    units : dict[str, str]
+        Units by key, stored as "<key>_units" for keys in `columns`.
+    columns : dict[str, Sequence[Any]]
+        Column data by key.
+
+    See Also
+    --------
+    write_table : Main entry function.
+    """
+    arrays = {key: np.asarray(val) for key, val in columns.items()}
+    arrays.update(
+        {f"{key}_units": np.array(units[key]) for key in columns if units.get(key)}
+    )
+    np.savez(file, **arrays)
+
+
+class BufferedTableWriter:
+    """
+    Append rows of a table to a file kept open, flushing them in batches.
+
+    Rows are buffered, then formatted together by `write_table` and written to the
+    file once `buffer_rows` rows have been buffered, or `buffer_time` seconds have
+    passed since rows were last written. Only complete rows are written to the file.
+
+    Parameters
+    ----------
+    filename : PathLike
+        File to append table to.
+    fmt : {'ascii', 'csv'}
+        Format to write table in. Default is "ascii".
+    units : Optional[dict[str, str]]
+        Units of columns. Default is {}.
+    formats : Optional[dict[str, str]]
+        Output formats of columns. Default is {}.
+    buffer_rows : int
+        Maximum number of rows to buffer before writing to the file. Default is 100.
+    buffer_time : float
+        Maximum time, in seconds, to buffer rows before writing to the file. Default
+        is 10.0.
+    """
+
+    def __init__(
+        self,
+        filename: PathLike,
+        fmt: Literal["ascii", "csv"] = "ascii",
+        units: Optional[dict[str, str]] = None,
+        formats: Optional[dict[str, str]] = None,
+        *,
+        buffer_rows: int = 100,
+        buffer_time: float = 10.0,
+    ) -> None:
+        """
+        Initialise writer, opening `filename` to append to.
+
+        Parameters
+        ----------
+        filename : PathLike
+            File to append table to.
+        fmt : {'ascii', 'csv'}
+            Format to write table in. Default is "ascii".
+        units : Optional[dict[str, str]]
+            Units of columns. Default is {}.
+        formats : Optional[dict[str, str]]
+            Output formats of columns. Default is {}.
+        buffer_rows : int
+            Maximum number of rows to buffer before writing to the file. Default is
+            100.
+        buffer_time : float
+            Maximum time, in seconds, to buffer rows before writing to the file.
+            Default is 10.0.
+        """
+        if buffer_rows < 1:
+            raise ValueError("`buffer_rows` must be at least 1")
+
+        (units, formats) = none_to_dict((units, formats))
+        self.fmt = fmt
+        self.units = units
+        self.formats = formats
+        self.buffer_rows = buffer_rows
+        self.buffer_time = buffer_time
+
+        self.file = open(filename, "a", encoding="utf8")
+        self._keys: tuple[str, ...] = ()
+        self._rows: list[tuple[Any, ...]] = []
+        self._last_flush = monotonic()
+
+    def __enter__(self) -> "BufferedTableWriter":
+        """
+        Enter the context of the writer.
+
+        Returns
+        -------
+        BufferedTableWriter
+            The writer.
+        """
+        return self
+
+    def __exit__(self, *args) -> None:
+        """
+        Flush buffered rows and close the file when leaving the context.
+
+        Parameters
+        ----------
+        *args
+            Exception information, if raised.
+        """
+        self.close()
+
+    def write_header(self) -> None:
+        """Write the table header, with units, to the file."""
+        self.flush()
+        write_table(
+            self.fmt,
+            file=self.file,
+            units=dict(self.units),
+            **{key: () for key in self.units},
+        )
+        self.file.flush()
+
+    def write_row(self, **columns) -> None:
+        """
+        Buffer a row of the table, writing buffered rows if either limit is reached.
+
+        Parameters
+        ----------
+        **columns : dict[str, Any]
+            Value for each column of the row.
+        """
+        if tuple(columns) != self._keys:
+            self.flush()
+            self._keys = tuple(columns)
+        self._rows.append(tuple(columns.values()))
+
+        if (
+            len(self._rows) >= self.buffer_rows
+            or monotonic() - self._last_flush >= self.buffer_time
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered rows to the file."""
+        if self._rows and not self.file.closed:
+            write_table(
+                self.fmt,
+                file=self.file,
+                formats=dict(self.formats),
+                print_header=False,
+                **dict(zip(self._keys, zip(*self._rows))),
+            )
+            self.file.flush()
+        self._rows = []
+        self._last_flush = monotonic()
+
+    def close(self) -> None:
+        """Write all buffered rows and close the file."""
+        self.flush()
+        self.file.close()
 
 
 def track_progress(sequence: Union[Sequence, Iterable], description: str) -> Iterable:
@@ -758,6 +1085,10 @@ def check_calculator(calc: Calculator, attribute: str) -> None:
     attribute : str
         Attribute to check calculator for.
     """
+    # Check calculator being shared by structures
+    if isinstance(calc, SharedCalculator):
+        calc = calc.calc
+
     # If dispersion added to MLIP calculator, use only MLIP calculator for calculation
     if isinstance(calc, SumCalculator):
         if (
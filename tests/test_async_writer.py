@@ -0,0 +1,49 @@
+"""Test writing output in a background thread."""
+
+from threading import Event
+
+import pytest
+
+from janus_core.helpers.async_writer import BackgroundWriter
+
+
+def test_order():
+    """Test tasks are run in the order they are submitted."""
+    results = []
+    with BackgroundWriter(max_pending=2) as writer:
+        for i in range(10):
+            writer.submit(results.append, i)
+    assert results == list(range(10))
+
+
+def test_flush():
+    """Test flushing waits for submitted tasks to be run."""
+    results = []
+    release = Event()
+    with BackgroundWriter() as writer:
+        writer.submit(release.wait)
+        writer.submit(results.append, 1)
+        assert results == []
+
+        release.set()
+        writer.flush()
+        assert results == [1]
+
+
+def test_error():
+    """Test errors in tasks are raised, and later tasks are not run."""
+    results = []
+    writer = BackgroundWriter()
+    writer.submit(int, "a")
+    writer.submit(results.append, 1)
+    with pytest.raises(ValueError):
+        writer.close()
+    assert results == []
+
+
+def test_closed():
+    """Test tasks cannot be submitted after closing."""
+    writer = BackgroundWriter()
+    writer.close()
+    with pytest.raises(RuntimeError):
+        writer.submit(print)
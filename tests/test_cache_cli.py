@@ -0,0 +1,35 @@
+"""Test cache commandline interface."""
+
+from ase.build import bulk
+from ase.calculators.emt import EMT
+from typer.testing import CliRunner
+
+from janus_core.cli.janus import app
+from janus_core.helpers.result_cache import ResultCache
+from tests.utils import strip_ansi_codes
+
+runner = CliRunner()
+
+
+def test_cache_help():
+    """Test calling `janus cache --help`."""
+    result = runner.invoke(app, ["cache", "--help"])
+    assert result.exit_code == 0
+    assert "Usage: janus cache [OPTIONS] COMMAND" in strip_ansi_codes(result.stdout)
+
+
+def test_cache_info_prune(tmp_path):
+    """Test inspecting and pruning the result cache."""
+    struct = bulk("Cu", cubic=True)
+    struct.calc = EMT()
+    struct.get_potential_energy()
+    ResultCache(tmp_path).add(struct, struct.calc.results)
+
+    result = runner.invoke(app, ["cache", "info", "--directory", tmp_path])
+    assert result.exit_code == 0
+    assert "Entries: 1" in result.stdout
+
+    result = runner.invoke(app, ["cache", "prune", "--directory", tmp_path])
+    assert result.exit_code == 0
+    assert "Removed 1 entries" in result.stdout
+    assert ResultCache(tmp_path).info()["entries"] == 0
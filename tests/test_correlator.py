@@ -3,18 +3,27 @@
 from collections.abc import Iterable
 from pathlib import Path
 
-from ase import Atoms
+from ase import Atoms, units
+from ase.calculators.singlepoint import SinglePointCalculator
 from ase.io import read
 from ase.units import GPa
 import numpy as np
+import pytest
 from pytest import approx
 from typer.testing import CliRunner
 from yaml import Loader, load
 
 from janus_core.calculations.md import NVE
 from janus_core.calculations.single_point import SinglePoint
-from janus_core.helpers.correlator import Correlator
-from janus_core.helpers.observables import Stress
+from janus_core.helpers.correlator import Correlation, Correlator
+from janus_core.helpers.observables import (
+    ObservableCache,
+    SpeciesVelocity,
+    Stress,
+    ThermoSnapshot,
+    Velocity,
+)
+from janus_core.helpers.post_process import compute_vaf
 
 DATA_PATH = Path(__file__).parent / "data"
 MODEL_PATH = Path(__file__).parent / "models" / "mace_mp_small.model"
@@ -64,6 +73,132 @@ def test_correlation():
     assert fft == approx(correlation, rel=1e-10)
 
 
+def test_correlation_blocks():
+    """Test Correlator with multiple blocks against averaged signals."""
+    blocks, points, averaging = 3, 8, 2
+    cor = Correlator(blocks=blocks, points=points, averaging=averaging)
+    rng = np.random.default_rng(seed=1)
+    signal_a, signal_b = rng.random((2, 256))
+    for a, b in zip(signal_a, signal_b):
+        cor.update(a, b)
+    correlation, lags = cor.get()
+
+    expected, expected_lags = [], []
+    for block in range(blocks - 1):
+        window = averaging**block
+        avg_a = signal_a.reshape(-1, window).mean(axis=1)
+        avg_b = signal_b.reshape(-1, window).mean(axis=1)
+        start = 0 if block == 0 else points // averaging
+        for lag in range(start, points):
+            expected.append(np.mean(avg_a[lag:] * avg_b[: len(avg_b) - lag]))
+            expected_lags.append(lag * window)
+
+    assert lags == approx(expected_lags)
+    assert correlation == approx(expected, rel=1e-10)
+
+
+def test_correlation_arrays():
+    """Test Correlator averages correlations of array elements."""
+    rng = np.random.default_rng(seed=1)
+    signal = rng.random((50, 4, 3))
+
+    cor = Correlator(blocks=1, points=50, averaging=1)
+    for val in signal:
+        cor.update(val, val)
+    correlation, lags = cor.get()
+
+    direct = np.mean(
+        [
+            correlate(signal[:, i, j], signal[:, i, j], fft=False)
+            for i in range(4)
+            for j in range(3)
+        ],
+        axis=0,
+    )
+    assert all(lags == range(50))
+    assert direct == approx(correlation, rel=1e-10)
+
+
+def test_velocity_observables():
+    """Test velocity observables select atoms and components."""
+    struct = read(DATA_PATH / "NaCl.cif")
+    velocities = np.arange(len(struct) * 3, dtype=float).reshape(-1, 3)
+    struct.set_velocities(velocities / units.fs)
+
+    assert Velocity()(struct) == approx(velocities)
+    assert Velocity(["z", "x"], atoms_filter=[1, 2])(struct) == approx(
+        velocities[1:3, [2, 0]]
+    )
+    assert SpeciesVelocity("Cl", "y")(struct) == approx(
+        velocities[struct.numbers == 17, 1:2]
+    )
+
+    with pytest.raises(ValueError, match="invalid"):
+        Velocity("xw")
+    with pytest.raises(ValueError, match="chemical symbol"):
+        SpeciesVelocity("Xx")
+
+
+def test_shared_observables(monkeypatch):
+    """Test quantities are calculated once for correlations sharing a cache."""
+    struct = read(DATA_PATH / "NaCl.cif")
+    struct.calc = SinglePointCalculator(struct, stress=np.arange(6.0) * GPa)
+
+    calls = []
+    calculate = Stress._calculate
+
+    def count_calculate(self, atoms):
+        calls.append(self.key)
+        return calculate(self, atoms)
+
+    monkeypatch.setattr(Stress, "_calculate", count_calculate)
+
+    correlations = [
+        Correlation(
+            Stress(component),
+            Stress(component),
+            name=component,
+            blocks=1,
+            points=10,
+            averaging=1,
+            update_frequency=1,
+        )
+        for component in ("xx", "yy", "zz", "yz", "xz", "xy")
+    ]
+    cache = ObservableCache()
+    for cor in correlations:
+        cor.update(struct, cache)
+    assert calls == [("stress", True)]
+
+    for i, cor in enumerate(correlations):
+        assert cor.get()[0] == approx([i**2])
+
+    # Without a cache, stress is calculated for both correlands
+    correlations[0].update(struct)
+    assert len(calls) == 3
+
+
+def test_thermo_snapshot():
+    """Test thermodynamic quantities are calculated once and shared with observables."""
+    struct = read(DATA_PATH / "NaCl.cif")
+    struct.calc = SinglePointCalculator(
+        struct, energy=-1.0, stress=np.arange(6.0) * GPa
+    )
+
+    snapshot = ThermoSnapshot(struct)
+    assert snapshot.potential_energy == approx(-1.0)
+    assert snapshot.kinetic_energy == approx(struct.get_kinetic_energy())
+    assert snapshot.volume == approx(struct.get_volume())
+    assert snapshot.stress == approx(
+        struct.get_stress(include_ideal_gas=True, voigt=True)
+    )
+
+    # Stored quantities are not recalculated, and are used by observables
+    struct.calc.results["stress"] = np.zeros(6)
+    assert snapshot.stress[1] == approx(GPa)
+    assert Stress("yy")(struct, cache=snapshot) == approx(1.0)
+
+
 def test_md_correlations(tmp_path):
     """Test correlations as part of MD cycle."""
     file_prefix = tmp_path / "Cl4Na4-nve-T300.0"
@@ -144,3 +279,58 @@ def test_md_correlations(tmp_path):
     direct = correlate([v * 4.0 for v in pxy], pxy, fft=False)
     # input data differs due to i/o, error is expected 1e-5
     assert direct == approx(value, rel=1e-5)
+
+
+def test_md_velocity_correlation(tmp_path):
+    """Test velocity autocorrelation computed during MD matches post-processing."""
+    file_prefix = tmp_path / "NaCl"
+
+    single_point = SinglePoint(
+        struct_path=DATA_PATH / "NaCl.cif",
+        arch="mace",
+        calc_kwargs={"model": MODEL_PATH},
+    )
+
+    nve = NVE(
+        struct=single_point.struct,
+        temp=300.0,
+        steps=10,
+        traj_every=1,
+        file_prefix=file_prefix,
+        correlation_kwargs=[
+            {
+                "a": Velocity(),
+                "b": Velocity(),
+                "name": "vaf",
+                "blocks": 1,
+                "points": 11,
+                "averaging": 1,
+                "update_frequency": 1,
+            },
+            {
+                "a": SpeciesVelocity("Na"),
+                "b": SpeciesVelocity("Na"),
+                "name": "vaf_na",
+                "blocks": 1,
+                "points": 11,
+                "averaging": 1,
+                "update_frequency": 1,
+            },
+        ],
+    )
+    nve.run()
+
+    with open(tmp_path / "NaCl-cor.dat", encoding="utf8") as in_file:
+        cor = load(in_file, Loader=Loader)
+
+    traj = read(tmp_path / "NaCl-traj.extxyz", index=":")
+    vafs = compute_vaf(
+        traj, use_velocities=True, filter_atoms=(range(8), range(0, 8, 2))
+    )
+    # Correlations are averaged over components
+    assert np.asarray(cor["vaf"]["value"]) * 3 == approx(
+        vafs[0] * units.fs**2, rel=1e-5
+    )
+    assert np.asarray(cor["vaf_na"]["value"]) * 3 == approx(
+        vafs[1] * units.fs**2, rel=1e-5
+    )
@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+from ase.build import bulk
+from ase.calculators.emt import EMT
 from ase.eos import EquationOfState
 from ase.io import read
 import pytest
@@ -59,6 +61,93 @@ def test_no_optimize(tmp_path):
     )
 
 
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"batch_size": 3},
+        {"n_workers": 2},
+        {"minimize_all": True, "n_workers": 2},
+    ],
+)
+def test_parallel(tmp_path, kwargs):
+    """Test evaluating volumes in batches or using worker processes."""
+    results = []
+    for eos_kwargs in ({"minimize_all": kwargs.get("minimize_all", False)}, kwargs):
+        eos = EoS(
+            struct_path=DATA_PATH / "NaCl.cif",
+            arch="mace_mp",
+            calc_kwargs={"model": MODEL_PATH},
+            minimize=False,
+            file_prefix=tmp_path / "NaCl",
+            **eos_kwargs,
+        )
+        eos.run()
+        results.append(eos.energies)
+
+    assert results[1] == pytest.approx(results[0], abs=1e-4)
+
+
+def test_parallel_attached_calc():
+    """Test an attached calculator cannot be used by worker processes."""
+    struct = bulk("Cu", "fcc", a=3.6, cubic=True)
+    struct.calc = EMT()
+    with pytest.raises(ValueError, match="n_workers"):
+        EoS(struct=struct, n_workers=2)
+
+
+def test_parallel_logs(tmp_path):
+    """Test each worker minimizing a volume writes a separate log file."""
+    log_file = tmp_path / "eos.log"
+    eos = EoS(
+        struct_path=DATA_PATH / "NaCl.cif",
+        arch="mace_mp",
+        calc_kwargs={"model": MODEL_PATH},
+        minimize_all=True,
+        n_volumes=4,
+        n_workers=2,
+        file_prefix=tmp_path / "NaCl",
+        log_kwargs={"filename": log_file},
+    )
+    eos.run()
+
+    for i in range(4):
+        assert_log_contains(
+            tmp_path / f"eos-{i}.log", includes=["Starting geometry optimization"]
+        )
+
+
+def test_warm_start(tmp_path):
+    """Test minimizing each volume from the neighbouring minimized structure."""
+    results = []
+    for warm_start in (False, True):
+        eos = EoS(
+            struct_path=DATA_PATH / "NaCl.cif",
+            arch="mace_mp",
+            calc_kwargs={"model": MODEL_PATH},
+            minimize=False,
+            minimize_all=True,
+            warm_start=warm_start,
+            file_prefix=tmp_path / "NaCl",
+        )
+        results.append(eos.run()["bulk_modulus"])
+
+    # Minimized structures are only converged to within fmax
+    assert results[1] == pytest.approx(results[0], rel=1e-2)
+
+
+def test_invalid_warm_start():
+    """Test warm starting minimization cannot use multiple workers."""
+    with pytest.raises(ValueError):
+        EoS(
+            struct_path=DATA_PATH / "NaCl.cif",
+            arch="mace_mp",
+            calc_kwargs={"model": MODEL_PATH},
+            minimize_all=True,
+            warm_start=True,
+            n_workers=2,
+        )
+
+
 test_data_potentials = [("m3gnet", "cpu"), ("chgnet", "cpu")]
 
 
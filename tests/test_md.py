@@ -1,6 +1,7 @@
 """Test molecular dynamics."""
 
 from pathlib import Path
+import shutil
 
 from ase import Atoms
 from ase.io import read
@@ -11,6 +12,7 @@ from janus_core.calculations.md import NPH, NPT, NVE, NVT, NVT_NH
 from janus_core.calculations.single_point import SinglePoint
 from janus_core.helpers.mlip_calculators import choose_calculator
 from janus_core.helpers.stats import Stats
+from janus_core.helpers.trajectory import HDF5Trajectory
 from tests.utils import assert_log_contains
 
 DATA_PATH = Path(__file__).parent / "data"
@@ -1085,3 +1087,69 @@ def test_set_info(tmp_path):
     final_struct = read(traj_path, index="-1")
     assert npt.struct.info["density"] == pytest.approx(2.120952627887493)
     assert final_struct.info["density"] == pytest.approx(2.120952627887493)
+
+
+def test_write_kwargs_background(tmp_path, monkeypatch):
+    """Test structures written in the background receive all write kwargs."""
+    from janus_core.calculations import md
+
+    calls = []
+    output_structs = md.output_structs
+
+    def record_output_structs(*args, write_kwargs=None, **kwargs):
+        calls.append(dict(write_kwargs))
+        return output_structs(*args, write_kwargs=write_kwargs, **kwargs)
+
+    monkeypatch.setattr(md, "output_structs", record_output_structs)
+
+    single_point = SinglePoint(
+        struct_path=DATA_PATH / "NaCl.cif",
+        arch="mace",
+        calc_kwargs={"model": MODEL_PATH},
+    )
+    nve = NVE(
+        struct=single_point.struct,
+        steps=2,
+        traj_every=2,
+        file_prefix=tmp_path / "NaCl",
+        write_kwargs={"invalidate_calc": False, "properties": ["energy"]},
+    )
+    nve.run()
+
+    # Both the synchronous and background calls receive the properties filter
+    assert calls
+    assert all(call["properties"] == ["energy"] for call in calls)
+    assert all(call["invalidate_calc"] is False for call in calls)
+
+
+def test_hdf5_flushed_at_restart(tmp_path, monkeypatch):
+    """Test HDF5 trajectory can be read up to each restart while running."""
+    single_point = SinglePoint(
+        struct_path=DATA_PATH / "NaCl.cif",
+        arch="mace",
+        calc_kwargs={"model": MODEL_PATH},
+    )
+    nve = NVE(
+        struct=single_point.struct,
+        steps=6,
+        traj_every=1,
+        restart_every=3,
+        file_prefix=tmp_path / "NaCl",
+        traj_format="hdf5",
+    )
+
+    lengths = []
+    write_restart = nve._write_restart
+
+    def read_traj_copy():
+        write_restart()
+        if nve.dyn.nsteps > 0:
+            # Copy as if the job were killed once queued writes had completed
+            nve._writer.flush()
+            copy = tmp_path / "copy.h5"
+            shutil.copy(nve.traj_file, copy)
+            lengths.append(len(HDF5Trajectory(copy)))
+
+    monkeypatch.setattr(nve, "_write_restart", read_traj_copy)
+    nve.run()
+    assert lengths == [4, 7]
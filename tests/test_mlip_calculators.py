@@ -3,11 +3,16 @@
 from pathlib import Path
 from zipfile import BadZipFile
 
+from ase.calculators.emt import EMT
 from chgnet.model.model import CHGNet
 from matgl import load_model
 import pytest
 
-from janus_core.helpers.mlip_calculators import choose_calculator
+from janus_core.helpers.mlip_calculators import (
+    MODEL_CACHE,
+    ModelCache,
+    choose_calculator,
+)
 
 MODEL_PATH = Path(__file__).parent / "models"
 
@@ -102,6 +107,47 @@ def test_invalid_device(arch):
         choose_calculator(arch=arch, device="invalid")
 
 
+def test_model_cache():
+    """Test models are reused by choose_calculator."""
+    MODEL_CACHE.clear()
+    calc_1 = choose_calculator(arch="mace_mp", model_path=MACE_MP_PATH)
+    calc_2 = choose_calculator(arch="mace_mp", model=MACE_MP_PATH)
+    assert len(MODEL_CACHE) == 1
+    assert calc_1 is not calc_2
+    assert calc_1.models[0] is calc_2.models[0]
+    assert MODEL_CACHE.memory > 0
+
+    # Different precision requires a separate model
+    calc_3 = choose_calculator(
+        arch="mace_mp", model_path=MACE_MP_PATH, default_dtype="float32"
+    )
+    assert len(MODEL_CACHE) == 2
+    assert calc_3.models[0] is not calc_1.models[0]
+
+    # Cache can be bypassed
+    calc_4 = choose_calculator(arch="mace_mp", model_path=MACE_MP_PATH, cache=False)
+    assert calc_4.models[0] is not calc_1.models[0]
+    assert len(MODEL_CACHE) == 2
+    MODEL_CACHE.clear()
+
+
+def test_model_cache_eviction():
+    """Test least recently used calculators are evicted."""
+    cache = ModelCache(max_models=2)
+    for key in ("a", "b"):
+        cache.add(key, EMT())
+    assert cache.get("a") is not None
+    cache.add("c", EMT())
+
+    assert len(cache) == 2
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+
+    cache.clear()
+    assert len(cache) == 0
+
+
 @pytest.mark.extra_mlips
 @pytest.mark.parametrize(
     "arch, device, kwargs",
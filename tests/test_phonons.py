@@ -2,9 +2,12 @@
 
 from pathlib import Path
 
+from ase.build import bulk
+from ase.calculators.emt import EMT
 from ase.io import read
 import pytest
 
+from janus_core.calculations import phonons as phonons_module
 from janus_core.calculations.phonons import Phonons
 from janus_core.calculations.single_point import SinglePoint
 from janus_core.helpers.mlip_calculators import choose_calculator
@@ -38,6 +41,103 @@ def test_calc_phonons():
     assert "phonon" in phonons.results
 
 
+@pytest.mark.parametrize("kwargs", [{"batch_size": 3}, {"n_workers": 2}])
+def test_calc_phonons_parallel(kwargs):
+    """Test calculating phonons in batches or using worker processes."""
+    force_constants = []
+    for phonon_kwargs in ({}, kwargs):
+        phonons = Phonons(
+            struct_path=DATA_PATH / "NaCl.cif",
+            arch="mace_mp",
+            calc_kwargs={"model": MODEL_PATH},
+            **phonon_kwargs,
+        )
+        phonons.calc_force_constants(write_force_consts=False)
+        force_constants.append(phonons.results["phonon"].force_constants)
+
+    assert force_constants[1] == pytest.approx(force_constants[0])
+
+
+def test_parallel_attached_calc():
+    """Test an attached calculator cannot be used by worker processes."""
+    struct = bulk("Cu", "fcc", a=3.6, cubic=True)
+    struct.calc = EMT()
+    with pytest.raises(ValueError, match="n_workers"):
+        Phonons(struct=struct, n_workers=2)
+
+
+def test_progress_batches(tmp_path, monkeypatch):
+    """Test progress is advanced after each batch of displacements is evaluated."""
+    events = []
+
+    def track_progress(sequence, description):
+        for item in sequence:
+            yield item
+            events.append("advance")
+
+    monkeypatch.setattr(phonons_module, "track_progress", track_progress)
+
+    struct = bulk("Cu", "fcc", a=3.6, cubic=True)
+    struct.rattle(0.01, seed=1)
+    struct.calc = EMT()
+    phonons = Phonons(
+        struct=struct,
+        batch_size=2,
+        enable_progress_bar=True,
+        file_prefix=tmp_path / "Cu",
+    )
+    calc_forces = phonons._calc_forces
+    monkeypatch.setattr(
+        phonons,
+        "_calc_forces",
+        lambda *args, **kwargs: events.append("calc") or calc_forces(*args, **kwargs),
+    )
+    phonons.calc_force_constants(write_force_consts=False)
+    assert len(events) > 2
+    assert events == ["calc", "advance"] * (len(events) // 2)
+
+
+def test_checkpoint(tmp_path, monkeypatch):
+    """Test forces on displaced supercells are reused from a checkpoint."""
+    phonons_kwargs = {
+        "struct_path": DATA_PATH / "NaCl.cif",
+        "arch": "mace_mp",
+        "calc_kwargs": {"model": MODEL_PATH},
+        "file_prefix": tmp_path / "NaCl",
+        "checkpoint": True,
+    }
+    phonons = Phonons(**phonons_kwargs)
+    phonons.calc_force_constants(write_force_consts=False)
+    force_constants = phonons.results["phonon"].force_constants
+
+    assert phonons.checkpoint_file == tmp_path / "NaCl-displacement-forces.hdf5"
+    assert phonons.checkpoint_file.exists()
+
+    # Forces should not be recalculated when restarting
+    def fail(*args, **kwargs):
+        raise RuntimeError("Forces recalculated")
+
+    restarted = Phonons(**phonons_kwargs)
+    monkeypatch.setattr(restarted, "_calc_forces", fail)
+    restarted.calc_force_constants(write_force_consts=False)
+    assert restarted.results["phonon"].force_constants == pytest.approx(force_constants)
+
+    # Forces are recalculated if the model changes
+    changed = Phonons(
+        **phonons_kwargs
+        | {"calc_kwargs": {"model": MODEL_PATH, "default_dtype": "float32"}}
+    )
+    calls = []
+    calc_forces = changed._calc_forces
+    monkeypatch.setattr(
+        changed,
+        "_calc_forces",
+        lambda *args, **kwargs: calls.append(1) or calc_forces(*args, **kwargs),
+    )
+    changed.calc_force_constants(write_force_consts=False)
+    assert calls
+
+
 def test_optimize(tmp_path):
     """Test optimizing structure before calculation."""
     log_file = tmp_path / "phonons.log"
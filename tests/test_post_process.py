@@ -2,8 +2,11 @@
 
 from pathlib import Path
 
-from ase.io import read
+from ase.build import bulk
+from ase.calculators.emt import EMT
+from ase.io import iread, read
 import numpy as np
+import pytest
 from pytest import approx
 from typer.testing import CliRunner
 
@@ -11,6 +14,7 @@ from janus_core.calculations.md import NVE
 from janus_core.calculations.single_point import SinglePoint
 from janus_core.cli.janus import app
 from janus_core.helpers import post_process
+from janus_core.helpers.trajectory import HDF5Trajectory
 
 DATA_PATH = Path(__file__).parent / "data"
 MODEL_PATH = Path(__file__).parent / "models" / "mace_mp_small.model"
@@ -64,6 +68,158 @@ def test_md_pp(tmp_path):
         vaf_path.unlink(missing_ok=True)
 
 
+def test_md_pp_hdf5(tmp_path):
+    """Test post-processing an HDF5 trajectory as part of MD cycle."""
+    file_prefix = tmp_path / "NaCl"
+    traj_path = tmp_path / "NaCl-traj.h5"
+
+    single_point = SinglePoint(
+        struct_path=DATA_PATH / "NaCl.cif",
+        arch="mace",
+        calc_kwargs={"model": MODEL_PATH},
+    )
+
+    nve = NVE(
+        struct=single_point.struct,
+        temp=300.0,
+        steps=10,
+        traj_every=2,
+        traj_file=traj_path,
+        traj_kwargs={"float32": True, "compression": "gzip"},
+        file_prefix=file_prefix,
+        post_process_kwargs={"rdf_compute": True, "vaf_compute": True},
+    )
+    nve.run()
+
+    assert nve.traj_format == "hdf5"
+    traj = HDF5Trajectory(traj_path)
+    assert len(traj) == 6
+    assert traj.get_array("info/step") == approx(np.arange(0, 11, 2))
+    assert traj.get_array("results/forces").shape == (6, 8, 3)
+
+    assert len(np.loadtxt(tmp_path / "NaCl-rdf.dat")) == 50
+    assert len(np.loadtxt(tmp_path / "NaCl-vaf.dat")) == 6
+
+
+def test_md_pp_rdf_every(tmp_path):
+    """Test RDF accumulated during MD matches RDF of the trajectory."""
+    file_prefix = tmp_path / "NaCl"
+
+    single_point = SinglePoint(
+        struct_path=DATA_PATH / "NaCl.cif",
+        arch="mace",
+        calc_kwargs={"model": MODEL_PATH},
+    )
+    single_point.struct *= (2, 2, 2)
+
+    nve = NVE(
+        struct=single_point.struct,
+        temp=300.0,
+        steps=10,
+        traj_every=2,
+        file_prefix=file_prefix,
+        post_process_kwargs={
+            "rdf_compute": True,
+            "rdf_rmax": 5.0,
+            "rdf_every": 2,
+            "rdf_by_elements": True,
+        },
+    )
+    nve.run()
+
+    traj = read(tmp_path / "NaCl-traj.extxyz", index=":")
+    rdfs = post_process.compute_rdf(
+        traj, index=(0, None, 1), rmax=5.0, by_elements=True
+    )
+    for pair, rdf in rdfs.items():
+        rdf_path = tmp_path / f"NaCl-{'_'.join(pair)}-rdf.dat"
+        assert np.loadtxt(rdf_path)[:, 1] == approx(rdf[1], abs=1e-6)
+
+
+def test_md_pp_rdf_every_restart(tmp_path):
+    """Test RDF requested during MD includes structures from before a restart."""
+    single_point = SinglePoint(
+        struct_path=DATA_PATH / "NaCl.cif",
+        arch="mace",
+        calc_kwargs={"model": MODEL_PATH},
+    )
+    single_point.struct *= (2, 2, 2)
+
+    md_kwargs = {
+        "temp": 300.0,
+        "steps": 6,
+        "traj_every": 1,
+        "stats_every": 1,
+        "restart_every": 6,
+        "file_prefix": tmp_path / "NaCl",
+        "post_process_kwargs": {
+            "rdf_compute": True,
+            "rdf_rmax": 5.0,
+            "rdf_every": 2,
+            "rdf_start_step": 2,
+        },
+    }
+    NVE(struct=single_point.struct, **md_kwargs).run()
+    NVE(struct=single_point.struct, restart=True, restart_auto=False, **md_kwargs).run()
+
+    traj = read(tmp_path / "NaCl-traj.extxyz", index=":")
+    assert [struct.info["step"] for struct in traj] == list(range(13))
+    rdf = post_process.compute_rdf(traj, index=(2, None, 2), rmax=5.0)
+    assert np.loadtxt(tmp_path / "NaCl-rdf.dat")[:, 1] == approx(rdf[1], abs=1e-6)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"post_process_kwargs": {"rdf_every": 2, "rdf_start": 2}},
+        {"post_process_kwargs": {"rdf_stop_step": 4}},
+        {"post_process_kwargs": {"rdf_every": 3}, "traj_every": 2, "restart": True},
+    ],
+)
+def test_md_pp_rdf_every_invalid(tmp_path, kwargs):
+    """Test RDF steps accumulated during MD are selected consistently."""
+    struct = bulk("Cu", "fcc", a=3.6, cubic=True)
+    struct.calc = EMT()
+    kwargs["post_process_kwargs"]["rdf_compute"] = True
+    with pytest.raises(ValueError):
+        NVE(struct=struct, file_prefix=tmp_path / "Cu", **kwargs)
+
+
+def test_md_pp_msd(tmp_path):
+    """Test streamed VAF and MSD as part of MD cycle."""
+    file_prefix = tmp_path / "NaCl"
+
+    single_point = SinglePoint(
+        struct_path=DATA_PATH / "NaCl.cif",
+        arch="mace",
+        calc_kwargs={"model": MODEL_PATH},
+    )
+
+    nve = NVE(
+        struct=single_point.struct,
+        temp=300.0,
+        steps=20,
+        traj_every=2,
+        timestep=0.5,
+        file_prefix=file_prefix,
+        post_process_kwargs={
+            "vaf_compute": True,
+            "vaf_max_lag": 4,
+            "msd_compute": True,
+            "msd_max_lag": 5,
+        },
+    )
+    nve.run()
+
+    assert len(np.loadtxt(tmp_path / "NaCl-vaf.dat")) == 4
+
+    msd = np.loadtxt(tmp_path / "NaCl-msd.dat")
+    assert msd.shape == (5, 2)
+    assert msd[:, 0] == approx(np.arange(0, 5, 1.0))
+    assert msd[0, 1] == approx(0.0)
+    assert np.all(msd[1:, 1] > 0)
+
+
 def test_md_pp_cli(tmp_path):
     """Test all MD simulations are able to run."""
     file_prefix = tmp_path / "nve-T300"
@@ -173,6 +329,58 @@ def test_rdf_by_elements():
         assert (np.isclose(expected_peaks[element], rdf[0][peaks])).all()
 
 
+def test_rdf_iterator_workers():
+    """Test RDF of structures read lazily, divided between processes."""
+    data = read(DATA_PATH / "lj-traj.xyz", index=":")
+    expected = post_process.compute_rdf(data, index=(1, None, 2), rmax=5.0)
+
+    for n_workers in (1, 2):
+        rdf = post_process.compute_rdf(
+            iread(DATA_PATH / "lj-traj.xyz"),
+            index=(1, None, 2),
+            rmax=5.0,
+            n_workers=n_workers,
+            chunk_size=2,
+        )
+        assert rdf[0] == approx(expected[0])
+        assert rdf[1] == approx(expected[1])
+
+
+def test_rdf_accumulator(tmp_path):
+    """Test RDF accumulated one structure at a time matches compute_rdf."""
+    data = read(DATA_PATH / "lj-traj.xyz", index=":")
+    rdf = post_process.compute_rdf(data, index=(0, None, 5), rmax=5.0, nbins=100)
+
+    accumulator = post_process.RDFAccumulator(rmax=5.0, nbins=100)
+    for struct in data[::5]:
+        accumulator.update(struct)
+    assert accumulator.n_structs == len(data[::5])
+
+    dists, rdf_acc = accumulator.get_rdf()
+    assert dists == approx(rdf[0])
+    assert rdf_acc == approx(rdf[1])
+
+    rdf_path = tmp_path / "rdf.dat"
+    accumulator.write(rdf_path)
+    assert np.loadtxt(rdf_path)[:, 1] == approx(rdf[1])
+
+
+def test_rdf_accumulator_by_elements():
+    """Test RDF accumulated by elements matches compute_rdf."""
+    data = read(DATA_PATH / "benzene.xyz")
+    rdfs = post_process.compute_rdf(
+        data, index=0, rmax=5.0, nbins=100, by_elements=True
+    )
+
+    accumulator = post_process.RDFAccumulator(rmax=5.0, nbins=100, by_elements=True)
+    accumulator.update(data)
+    rdfs_acc = accumulator.get_rdf()
+
+    assert rdfs_acc.keys() == rdfs.keys()
+    for pair, rdf in rdfs.items():
+        assert rdfs_acc[pair][1] == approx(rdf[1])
+
+
 def test_vaf(tmp_path):
     """Test vaf will run."""
     vaf_names = ("vaf-lj-3-4.dat", "vaf-lj-1-2-3.dat")
@@ -192,6 +400,9 @@ def test_vaf(tmp_path):
     assert isinstance(vaf, list)
     assert len(vaf) == 1
     assert isinstance(vaf[0], np.ndarray)
+    assert vaf[0] == approx(np.fft.fft(expected), rel=1e-9)
+    stream_vaf = post_process.stream_vaf(data, max_lag=len(data), fft=True)
+    assert stream_vaf[0] == approx(vaf[0], rel=1e-9)
 
     vaf = post_process.compute_vaf(
         data, filter_atoms=vaf_filter, filenames=[tmp_path / name for name in vaf_names]
@@ -207,3 +418,74 @@ def test_vaf(tmp_path):
         written = np.loadtxt(tmp_path / name)
         assert vaf[i] == approx(expected, rel=1e-9)
         assert vaf[i] == approx(written, rel=1e-9)
+
+
+def test_vaf_chunk_size():
+    """Test VAF is independent of number of atoms correlated at once."""
+    data = read(DATA_PATH / "lj-traj.xyz", index=":")
+    expected = np.loadtxt(DATA_PATH / "vaf-lj.dat")
+
+    for chunk_size in (1, 3):
+        vaf = post_process.compute_vaf(data, chunk_size=chunk_size)
+        assert vaf[0] == approx(expected, rel=1e-9)
+
+
+def test_stream_vaf(tmp_path):
+    """Test streamed VAF matches VAF computed from all frames."""
+    vaf_filter = ((3, 4), (1, 2, 3))
+    data = read(DATA_PATH / "lj-traj.xyz", index=":")
+    expected = post_process.compute_vaf(data, filter_atoms=vaf_filter)
+
+    for max_lag in (3, 1000):
+        vaf = post_process.stream_vaf(
+            iread(DATA_PATH / "lj-traj.xyz"),
+            max_lag=max_lag,
+            filter_atoms=vaf_filter,
+            filenames=[tmp_path / "vaf-1.dat", tmp_path / "vaf-2.dat"],
+        )
+        assert len(vaf) == 2
+        for i in range(2):
+            assert len(vaf[i]) == min(max_lag, len(data))
+            assert vaf[i] == approx(expected[i][:max_lag], rel=1e-9)
+        assert np.loadtxt(tmp_path / "vaf-2.dat") == approx(vaf[1])
+
+
+def test_msd(tmp_path):
+    """Test streamed MSD matches direct calculation."""
+    data = read(DATA_PATH / "lj-traj.xyz", index=":")
+    positions = np.asarray([struct.positions for struct in data])
+    n_frames = len(positions)
+    expected = [
+        np.mean(np.sum((positions[lag:] - positions[: n_frames - lag]) ** 2, axis=-1))
+        for lag in range(n_frames)
+    ]
+
+    msd_path = tmp_path / "msd.dat"
+    for max_lag in (4, 1000):
+        msd = post_process.compute_msd(
+            data, msd_path, max_lag=max_lag, timestep=2.0, unwrap=False
+        )
+        assert msd[0] == approx(expected[:max_lag], abs=1e-12)
+
+    written = np.loadtxt(msd_path)
+    assert written[:, 0] == approx(2.0 * np.arange(n_frames))
+    assert written[:, 1] == approx(msd[0])
+
+
+def test_msd_unwrap():
+    """Test MSD unwraps positions across periodic boundaries."""
+    struct = read(DATA_PATH / "NaCl.cif")
+    frames = []
+    for i in range(20):
+        frame = struct.copy()
+        frame.positions += 0.5 * i
+        frame.wrap()
+        frames.append(frame)
+
+    msd = post_process.compute_msd(frames, max_lag=5)[0]
+    assert msd == approx(3 * (0.5 * np.arange(5)) ** 2)
+
+    diffusion = post_process.compute_diffusion_coefficient(
+        6 * 0.1 * np.arange(100), timestep=1.0
+    )
+    assert diffusion == approx(0.1)
@@ -0,0 +1,118 @@
+"""Test result cache."""
+
+import os
+
+from ase.build import bulk
+from ase.calculators.emt import EMT
+import pytest
+
+from janus_core.helpers.result_cache import ResultCache
+from janus_core.helpers.utils import SharedCalculator
+
+
+def test_result_cache(tmp_path):
+    """Test storing and restoring results."""
+    cache = ResultCache(tmp_path)
+    struct = bulk("Cu", cubic=True)
+    struct.rattle(0.05, seed=1)
+    struct.calc = EMT()
+
+    assert cache.get(struct) is None
+    assert not cache.restore(struct, ("energy",))
+
+    energy = struct.get_potential_energy()
+    forces = struct.get_forces()
+    cache.add(struct, struct.calc.results)
+    assert cache.info()["entries"] == 1
+
+    new_struct = struct.copy()
+    new_struct.calc = SharedCalculator(EMT())
+    assert cache.restore(new_struct, ("energy", "forces"))
+    assert isinstance(new_struct.calc.results["energy"], float)
+    assert new_struct.get_potential_energy() == pytest.approx(energy)
+    assert new_struct.get_forces() == pytest.approx(forces)
+    assert not cache.restore(new_struct, ("hessian",))
+
+
+def test_result_cache_key(tmp_path):
+    """Test keys depend on the structure and model."""
+    cache = ResultCache(tmp_path)
+    struct = bulk("Cu", cubic=True)
+    struct.calc = EMT()
+    key = cache.key(struct)
+
+    moved = struct.copy()
+    moved.calc = EMT()
+    moved.positions[0, 0] += 0.01
+    assert cache.key(moved) != key
+
+    strained = struct.copy()
+    strained.calc = EMT()
+    strained.set_cell(struct.cell * 1.01)
+    assert cache.key(strained) != key
+
+    other_model = struct.copy()
+    other_model.calc = EMT(asap_cutoff=True)
+    assert cache.key(other_model) != key
+
+
+def test_result_cache_prune(tmp_path):
+    """Test least recently used results are removed first."""
+    cache = ResultCache(tmp_path)
+    structs = []
+    for i in range(3):
+        struct = bulk("Cu", cubic=True)
+        struct.rattle(0.05, seed=i)
+        struct.calc = EMT()
+        struct.get_potential_energy()
+        cache.add(struct, struct.calc.results)
+        structs.append(struct)
+
+    # Mark all results as old, before using the first
+    for struct in structs:
+        os.utime(cache._path(cache.key(struct)), (0, 0))
+    cache.get(structs[0])
+
+    info = cache.info()
+    assert info["entries"] == 3
+    assert cache.prune(info["size"] // 3) == 2
+    assert cache.get(structs[0]) is not None
+    assert cache.get(structs[1]) is None
+
+    assert cache.prune() == 1
+    assert cache.info() == {"directory": str(tmp_path), "entries": 0, "size": 0}
+
+
+def test_result_cache_max_size(tmp_path):
+    """Test results are removed when the maximum size is exceeded."""
+    cache = ResultCache(tmp_path, max_size=0)
+    struct = bulk("Cu", cubic=True)
+    struct.calc = EMT()
+    struct.get_potential_energy()
+    cache.add(struct, struct.calc.results)
+    assert cache.info()["entries"] == 0
+
+
+def test_result_cache_max_size_scans(tmp_path, monkeypatch):
+    """Test the cache directory is only scanned occasionally when adding results."""
+    structs = []
+    for i in range(40):
+        struct = bulk("Cu", cubic=True)
+        struct.rattle(0.05, seed=i)
+        struct.calc = EMT()
+        struct.get_potential_energy()
+        structs.append(struct)
+
+    cache = ResultCache(tmp_path / "size")
+    cache.add(structs[0], structs[0].calc.results)
+    entry_size = cache.info()["size"]
+
+    cache = ResultCache(tmp_path, max_size=20 * entry_size)
+    scans = []
+    files = cache._files
+    monkeypatch.setattr(cache, "_files", lambda: scans.append(1) or files())
+
+    for struct in structs:
+        cache.add(struct, struct.calc.results)
+    assert cache.info()["size"] <= 20 * entry_size
+    assert len(scans) < 10
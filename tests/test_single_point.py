@@ -2,11 +2,15 @@
 
 from pathlib import Path
 
+from ase import Atoms
+from ase.calculators.emt import EMT
 from ase.io import read
 from numpy import isfinite
 import pytest
+import yaml
 
 from janus_core.calculations.single_point import SinglePoint
+from janus_core.helpers.result_cache import ResultCache
 from tests.utils import read_atoms
 
 DATA_PATH = Path(__file__).parent / "data"
@@ -72,6 +76,8 @@ def test_single_point_none():
     results = single_point.run()
     for prop in ["energy", "forces", "stress"]:
         assert prop in results
+    assert single_point.timings["calculate"] > 0
+    assert "hessian" not in single_point.timings
 
 
 def test_single_point_clean():
@@ -109,6 +115,174 @@ def test_single_point_traj():
     )
 
 
+@pytest.mark.parametrize("batch_size", [1, 2, 3])
+def test_single_point_batch(batch_size):
+    """Test batched single point calculations match individual calculations."""
+    struct = read(DATA_PATH / "benzene-traj.xyz", index=":")
+    struct += read(DATA_PATH / "benzene.xyz", index=":")
+    results = {}
+    for size in (None, batch_size):
+        single_point = SinglePoint(
+            struct=[image.copy() for image in struct],
+            arch="mace",
+            calc_kwargs={"model": MACE_PATH},
+            properties=["energy", "forces"],
+            batch_size=size,
+        )
+        results[size] = single_point.run()
+
+    assert results[batch_size]["energy"] == pytest.approx(results[None]["energy"])
+    for forces, expected in zip(results[batch_size]["forces"], results[None]["forces"]):
+        assert forces == pytest.approx(expected)
+    assert single_point.struct[1].info["mace_energy"] == pytest.approx(
+        -74.80419118083256
+    )
+
+
+def test_single_point_batch_invalid():
+    """Test invalid batch size raises error."""
+    with pytest.raises(ValueError):
+        SinglePoint(
+            struct_path=DATA_PATH / "benzene.xyz",
+            arch="mace",
+            calc_kwargs={"model": MACE_PATH},
+            batch_size=0,
+        )
+
+
+def test_single_point_stream(tmp_path):
+    """Test streaming and resuming single point calculations."""
+    results_path = tmp_path / "NaCl-results.extxyz"
+    checkpoint_path = tmp_path / "NaCl-results-checkpoint.yml"
+    n_frames = len(read(DATA_PATH / "NaCl-traj.xyz", index=":"))
+
+    single_point = SinglePoint(
+        struct_path=DATA_PATH / "NaCl-traj.xyz",
+        arch="mace",
+        calc_kwargs={"model": MACE_PATH},
+        properties="energy",
+        write_results=True,
+        write_kwargs={"filename": results_path},
+        stream=True,
+        chunk_size=2,
+    )
+    assert isinstance(single_point.struct, Atoms)
+    single_point.run()
+
+    expected = [image.info["mace_energy"] for image in read(results_path, index=":")]
+    assert len(expected) == n_frames
+    with open(checkpoint_path, encoding="utf8") as file:
+        assert yaml.safe_load(file)["completed"]
+
+    # Simulate a partially written chunk after the first chunk completed
+    with open(results_path, encoding="utf8") as file:
+        lines = file.readlines()
+    first_chunk = "".join(lines[: 2 * (len(lines) // n_frames)])
+    with open(results_path, "w", encoding="utf8") as file:
+        file.write(first_chunk + "partial chunk\n")
+    with open(checkpoint_path, "w", encoding="utf8") as file:
+        yaml.safe_dump({"frames": 2, "offset": len(first_chunk.encode())}, file)
+
+    single_point.resume = True
+    single_point.run()
+
+    results = read(results_path, index=":")
+    assert [image.info["mace_energy"] for image in results] == pytest.approx(expected)
+
+    # Resuming a complete calculation leaves the results unchanged
+    output = results_path.read_bytes()
+    for _ in range(2):
+        single_point.run()
+        assert results_path.read_bytes() == output
+
+    # Results without a checkpoint are not overwritten when resuming
+    checkpoint_path.unlink()
+    with pytest.raises(FileNotFoundError):
+        single_point.run()
+    assert results_path.read_bytes() == output
+
+
+def test_single_point_stream_invalid():
+    """Test streaming requires a structure file and writing results."""
+    with pytest.raises(ValueError):
+        SinglePoint(
+            struct=read(DATA_PATH / "NaCl.cif"),
+            arch="mace",
+            calc_kwargs={"model": MACE_PATH},
+            write_results=True,
+            stream=True,
+        )
+    with pytest.raises(ValueError):
+        SinglePoint(
+            struct_path=DATA_PATH / "NaCl-traj.xyz",
+            arch="mace",
+            calc_kwargs={"model": MACE_PATH},
+            stream=True,
+        )
+
+
+def test_single_point_parallel():
+    """Test single point calculations using multiple worker processes."""
+    results = {}
+    for n_workers in (1, 2):
+        single_point = SinglePoint(
+            struct_path=DATA_PATH / "benzene-traj.xyz",
+            arch="mace",
+            calc_kwargs={"model": MACE_PATH},
+            properties=["energy", "forces"],
+            n_workers=n_workers,
+            threads_per_worker=1,
+        )
+        results[n_workers] = single_point.run()
+
+    assert results[2]["energy"] == pytest.approx(results[1]["energy"])
+    for forces, expected in zip(results[2]["forces"], results[1]["forces"]):
+        assert forces == pytest.approx(expected)
+    assert single_point.struct[1].info["mace_energy"] == pytest.approx(
+        -74.80419118083256
+    )
+
+
+def test_single_point_parallel_attached_calc():
+    """Test attached calculators cannot be used by worker processes."""
+    structs = read(DATA_PATH / "benzene-traj.xyz", index=":")
+    for struct in structs:
+        struct.calc = EMT()
+
+    with pytest.raises(ValueError, match="n_workers"):
+        SinglePoint(struct=structs, n_workers=2)
+
+    # Calculators set from the arguments can be set up by workers
+    single_point = SinglePoint(
+        struct=structs,
+        arch="mace",
+        calc_kwargs={"model": MACE_PATH},
+        set_calc=True,
+        n_workers=2,
+    )
+    assert single_point.calc_from_args
+
+
+def test_single_point_result_cache(tmp_path):
+    """Test single point results are reused from the result cache."""
+    result_cache = ResultCache(tmp_path / "cache")
+    results = []
+    for _ in range(2):
+        single_point = SinglePoint(
+            struct_path=DATA_PATH / "NaCl-traj.xyz",
+            arch="mace",
+            calc_kwargs={"model": MACE_PATH},
+            result_cache=result_cache,
+        )
+        results.append(single_point.run())
+
+    n_frames = len(single_point.struct)
+    assert result_cache.info()["entries"] == n_frames
+    assert results[1]["energy"] == pytest.approx(results[0]["energy"])
+    for stress, expected in zip(results[1]["stress"], results[0]["stress"]):
+        assert stress == pytest.approx(expected)
+
+
 def test_single_point_write():
     """Test writing singlepoint results."""
     data_path = DATA_PATH / "NaCl.cif"
@@ -331,6 +505,7 @@ def test_hessian():
     assert "hessian" in results
     assert results["hessian"].shape == (24, 8, 3)
     assert "mace_mp_hessian" in sp.struct.info
+    assert sp.timings["hessian"] > 0
 
 
 def test_hessian_traj():
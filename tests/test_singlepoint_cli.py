@@ -150,6 +150,40 @@ def test_read_kwargs(tmp_path):
     assert isinstance(atoms, list)
 
 
+def test_stream(tmp_path):
+    """Test streaming structures for singlepoint calculation."""
+    results_path = tmp_path / "NaCl-traj-results.extxyz"
+    log_path = tmp_path / "test.log"
+    summary_path = tmp_path / "summary.yml"
+
+    result = runner.invoke(
+        app,
+        [
+            "singlepoint",
+            "--struct",
+            DATA_PATH / "NaCl-traj.xyz",
+            "--stream",
+            "--chunk-size",
+            2,
+            "--out",
+            results_path,
+            "--properties",
+            "energy",
+            "--log",
+            log_path,
+            "--summary",
+            summary_path,
+        ],
+    )
+    assert result.exit_code == 0
+
+    atoms = read(results_path, index=":")
+    assert len(atoms) == len(read(DATA_PATH / "NaCl-traj.xyz", index=":"))
+    assert all("mace_mp_energy" in image.info for image in atoms)
+    with open(tmp_path / "NaCl-traj-results-checkpoint.yml", encoding="utf8") as file:
+        assert yaml.safe_load(file)["completed"]
+
+
 def test_calc_kwargs(tmp_path):
     """Test setting calc_kwargs for singlepoint calculation."""
     results_path = tmp_path / "NaCl-results.extxyz"
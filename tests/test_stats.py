@@ -1,7 +1,9 @@
 """Test stats reader."""
 
 from pathlib import Path
+import shutil
 
+import numpy as np
 import pytest
 from pytest import approx
 
@@ -13,7 +15,7 @@ DATA_PATH = Path(__file__).parent / "data"
 class TestStats:
     """Tests for the stats type."""
 
-    data = Stats(DATA_PATH / "md-stats.dat")
+    data = Stats(DATA_PATH / "md-stats.dat", cache=False)
 
     @pytest.mark.parametrize(
         "attr,expected",
@@ -84,3 +86,158 @@ class TestStats:
             f"contains {self.data.columns} timeseries, "
             f"each with {self.data.rows} elements" in std_out_err.out
         )
+
+
+def test_usecols():
+    """Test loading only requested columns."""
+    full = Stats(DATA_PATH / "md-stats.dat", cache=False)
+    stats = Stats(DATA_PATH / "md-stats.dat", usecols=("target t", 0), cache=False)
+
+    assert stats.columns == 2
+    assert stats.labels == ("Target T", "# Step")
+    assert stats.units == ("K", "")
+    assert stats["step"] == approx(full["step"])
+    assert stats[0] == approx(full[17])
+
+
+def test_cache(tmp_path):
+    """Test binary data is cached, and invalidated when the file changes."""
+    source = tmp_path / "md-stats.dat"
+    shutil.copy(DATA_PATH / "md-stats.dat", source)
+    expected = Stats(source, cache=False).data
+
+    stats = Stats(source)
+    assert stats.data == approx(expected)
+    cache_files = list(tmp_path.glob(".md-stats.dat.*.npy"))
+    assert len(cache_files) == 1
+
+    # Cached data is read if present
+    np.save(cache_files[0], np.asfortranarray(expected * 2))
+    assert Stats(source).data == approx(expected * 2)
+    assert Stats(source, usecols=(1,)).data[:, 0] == approx(expected[:, 1] * 2)
+
+    # Cached data is mapped, and regularly spaced columns are analysed as views
+    stats = Stats(source, usecols=(1, 3, 5))
+    assert isinstance(stats.data.base, np.memmap)
+    assert np.shares_memory(stats._select((2, 0)), stats.data)
+    assert stats.running_average((2, 0)) == approx(
+        np.cumsum(expected[:, [5, 1]] * 2, axis=0) / np.arange(1, 101)[:, None]
+    )
+
+    # Appending rows invalidates the cache
+    with open(source, "a", encoding="utf-8") as file:
+        print(*expected[-1], file=file)
+    stats = Stats(source)
+    assert stats.rows == 101
+    assert stats.data[:100] == approx(expected)
+    assert len(list(tmp_path.glob(".md-stats.dat.*.npy"))) == 1
+
+
+def test_refresh(tmp_path):
+    """Test only new complete rows are read when refreshing."""
+    source = tmp_path / "md-stats.dat"
+    lines = (DATA_PATH / "md-stats.dat").read_text(encoding="utf-8").splitlines(True)
+    expected = Stats(DATA_PATH / "md-stats.dat", cache=False).data
+
+    # Header only, as when a simulation has just started
+    source.write_text(lines[0], encoding="utf-8")
+    stats = Stats(source, usecols=(0, 5), cache=False)
+    assert stats.rows == 0
+
+    with open(source, "a", encoding="utf-8") as file:
+        file.writelines(lines[1:11])
+        # Incomplete row is not read until it is finished
+        file.write(lines[11][:20])
+    assert stats.refresh() == 10
+    assert stats.data == approx(expected[:10, [0, 5]])
+    assert stats.refresh() == 0
+
+    # Rows appended by a restarted simulation
+    with open(source, "a", encoding="utf-8") as file:
+        file.write(lines[11][20:])
+        file.writelines(lines[12:50])
+    assert stats.refresh() == 39
+    assert stats.data == approx(expected[:49, [0, 5]])
+
+    # Rewriting the file reads all data again
+    source.write_text("".join(lines[:6]), encoding="utf-8")
+    assert stats.refresh() == 5
+    assert stats.data == approx(expected[:5, [0, 5]])
+
+
+def test_follow(tmp_path):
+    """Test iterating over rows as they are written."""
+    source = tmp_path / "md-stats.dat"
+    lines = (DATA_PATH / "md-stats.dat").read_text(encoding="utf-8").splitlines(True)
+    source.write_text("".join(lines[:4]), encoding="utf-8")
+
+    stats = Stats(source, cache=False)
+    rows = []
+    for i, new_rows in enumerate(stats.follow(interval=0.01, timeout=0.1)):
+        rows.append(len(new_rows))
+        if i < 2:
+            with open(source, "a", encoding="utf-8") as file:
+                file.writelines(lines[4 + 2 * i : 6 + 2 * i])
+    assert rows == [3, 2, 2]
+    assert stats.rows == 7
+
+
+@pytest.fixture(name="correlated_stats")
+def correlated_stats_fixture(tmp_path):
+    """Write stats for correlated timeseries, with an initial transient."""
+    rng = np.random.default_rng(0)
+    data = np.empty((20000, 2))
+    data[0] = 0
+    noise = rng.normal(size=data.shape)
+    for i in range(1, len(data)):
+        data[i] = 0.9 * data[i - 1] + noise[i]
+    data[:500, 1] += np.linspace(50, 0, 500)
+
+    source = tmp_path / "stats.dat"
+    np.savetxt(source, data, header="A [eV] | B [K]")
+    return Stats(source, cache=False), data
+
+
+def test_running_average(correlated_stats):
+    """Test running averages of columns."""
+    stats, data = correlated_stats
+    averages = stats.running_average()
+    assert averages.shape == data.shape
+    assert averages[9] == approx(data[:10].mean(axis=0))
+    assert averages[-1] == approx(data.mean(axis=0))
+    assert stats.running_average(cols=("B",))[:, 0] == approx(averages[:, 1])
+
+
+def test_block_average(correlated_stats):
+    """Test block averages and automatic block size selection."""
+    stats, data = correlated_stats
+    means, errors, block_sizes = stats.block_average(cols=(0,))
+    assert means == approx(data[:, :1].mean(axis=0))
+    assert block_sizes[0] > 1
+
+    # Statistical inefficiency of 19 for this process
+    expected = np.sqrt(19 * data[:, 0].var() / len(data))
+    assert errors[0] == approx(expected, rel=0.3)
+
+    _, errors, block_sizes = stats.block_average(cols=(0,), block_size=1)
+    assert block_sizes[0] == 1
+    assert errors[0] == approx(data[:, 0].std(ddof=1) / np.sqrt(len(data)))
+
+    with pytest.raises(ValueError):
+        stats.block_average(block_size=len(data))
+
+
+def test_statistical_inefficiency(correlated_stats):
+    """Test statistical inefficiency of columns."""
+    stats, _ = correlated_stats
+    inefficiency = stats.statistical_inefficiency(cols=("A",))
+    assert inefficiency[0] == approx(19, rel=0.2)
+    assert stats.statistical_inefficiency(chunk_size=1)[0] == approx(inefficiency[0])
+
+
+def test_detect_equilibration(correlated_stats):
+    """Test detecting the end of an initial transient."""
+    stats, _ = correlated_stats
+    start = stats.detect_equilibration()
+    assert start[0] < 100
+    assert 300 < start[1] < 1000
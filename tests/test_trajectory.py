@@ -0,0 +1,141 @@
+"""Test reading and writing HDF5 trajectories."""
+
+from pathlib import Path
+
+from ase.io import read
+import h5py
+import numpy as np
+import pytest
+
+from janus_core.helpers import post_process
+from janus_core.helpers.trajectory import (
+    HDF5Trajectory,
+    HDF5TrajectoryWriter,
+    _read_frames,
+    is_hdf5,
+)
+
+DATA_PATH = Path(__file__).parent / "data"
+
+
+@pytest.fixture(name="lj_traj")
+def lj_traj_fixture(tmp_path):
+    """Write Lennard-Jones trajectory in HDF5 format."""
+    data = read(DATA_PATH / "lj-traj.xyz", index=":")
+    with HDF5TrajectoryWriter(tmp_path / "lj-traj.h5") as writer:
+        for i, struct in enumerate(data):
+            struct.info["step"] = i
+            writer.write(struct)
+    return data, HDF5Trajectory(tmp_path / "lj-traj.h5")
+
+
+def test_read_write(lj_traj):
+    """Test structures and results are written and read back."""
+    data, traj = lj_traj
+    assert len(traj) == len(data)
+
+    for index in (0, -1, 5):
+        struct = traj[index]
+        assert struct.positions == pytest.approx(data[index].positions)
+        assert struct.get_momenta() == pytest.approx(data[index].get_momenta())
+        assert struct.get_forces() == pytest.approx(data[index].get_forces())
+        assert struct.get_potential_energy() == pytest.approx(
+            data[index].get_potential_energy()
+        )
+        assert struct.info["step"] == index % len(data)
+
+    structs = traj[10:2:-3]
+    assert [struct.info["step"] for struct in structs] == [10, 7, 4]
+
+    positions = traj.get_array("positions", slice(2, 10, 4))
+    assert positions.shape == (2, len(data[0]), 3)
+    assert positions[1] == pytest.approx(data[6].positions)
+    assert traj.get_array("info/step") == pytest.approx(np.arange(len(data)))
+
+
+def test_iterate(lj_traj):
+    """Test iterating over frames read in blocks."""
+    data, traj = lj_traj
+    traj.block_size = 4
+
+    structs = list(traj)
+    assert len(structs) == len(data)
+    assert [struct.info["step"] for struct in structs] == list(range(len(data)))
+    assert structs[-1].positions == pytest.approx(data[-1].positions)
+
+
+def test_read_frames(lj_traj):
+    """Test strided, reversed and scattered frames are read without the full span."""
+    _, traj = lj_traj
+    with h5py.File(traj.filename, "r") as file:
+        dataset = file["positions"]
+        positions = dataset[()]
+        for frames in (
+            np.arange(len(traj))[::3],
+            np.arange(len(traj))[10:2:-3],
+            np.array([7, 2, 7, 0]),
+            np.array([4]),
+        ):
+            assert _read_frames(dataset, frames) == pytest.approx(positions[frames])
+
+
+def test_append(tmp_path):
+    """Test appending to an existing trajectory."""
+    data = read(DATA_PATH / "lj-traj.xyz", index=":4")
+    path = tmp_path / "traj.hdf5"
+    for append in (False, True):
+        with HDF5TrajectoryWriter(path, append=append) as writer:
+            for struct in data:
+                writer.write(struct)
+
+    traj = HDF5Trajectory(path)
+    assert len(traj) == 8
+    assert traj[4].positions == pytest.approx(data[0].positions)
+
+    with HDF5TrajectoryWriter(path) as writer:
+        writer.write(data[0])
+    assert len(HDF5Trajectory(path)) == 1
+
+    benzene = read(DATA_PATH / "benzene.xyz")
+    with HDF5TrajectoryWriter(path, append=True) as writer:
+        with pytest.raises(ValueError, match="different atoms"):
+            writer.write(benzene)
+
+
+def test_float32_compression(tmp_path):
+    """Test storing trajectory in single precision with compression."""
+    data = read(DATA_PATH / "lj-traj.xyz", index=":")
+    path = tmp_path / "traj.h5"
+    with HDF5TrajectoryWriter(path, float32=True, compression="gzip") as writer:
+        for struct in data:
+            writer.write(struct)
+
+    traj = HDF5Trajectory(path)
+    assert traj.get_array("positions").dtype == np.float32
+    assert traj.get_array("cell").dtype == np.float64
+    assert traj[3].positions == pytest.approx(data[3].positions, rel=1e-6)
+
+
+def test_post_process(lj_traj):
+    """Test post-processing reads HDF5 trajectories directly."""
+    data, traj = lj_traj
+
+    vaf = post_process.compute_vaf(data, use_velocities=True)
+    assert post_process.compute_vaf(traj, use_velocities=True)[0] == pytest.approx(
+        vaf[0], rel=1e-9
+    )
+
+    vaf = post_process.stream_vaf(traj, max_lag=4)
+    assert vaf[0] == pytest.approx(post_process.compute_vaf(data)[0][:4], rel=1e-9)
+
+    rdf = post_process.compute_rdf(data, index=(10, 20, 2), rmax=5.0)
+    rdf_traj = post_process.compute_rdf(traj, index=(10, 20, 2), rmax=5.0)
+    assert rdf_traj[0] == pytest.approx(rdf[0])
+    assert rdf_traj[1] == pytest.approx(rdf[1])
+
+
+def test_is_hdf5():
+    """Test HDF5 trajectory file names are identified."""
+    assert is_hdf5("traj.h5")
+    assert is_hdf5(Path("traj.HDF5"))
+    assert not is_hdf5("traj.extxyz")
@@ -3,14 +3,25 @@
 from pathlib import Path
 
 from ase import Atoms
+from ase.build import bulk
+from ase.calculators.emt import EMT
 from ase.io import read
+import numpy as np
 import pytest
 
 from janus_core.cli.utils import dict_paths_to_strs, dict_remove_hyphens
 from janus_core.helpers.mlip_calculators import choose_calculator
-from janus_core.helpers.utils import none_to_dict, output_structs
+from janus_core.helpers.utils import (
+    BufferedTableWriter,
+    SharedCalculator,
+    attach_calculator,
+    none_to_dict,
+    output_structs,
+    write_table,
+)
 
 DATA_PATH = Path(__file__).parent / "data/NaCl.cif"
+TRAJ_PATH = Path(__file__).parent / "data/NaCl-traj.xyz"
 MODEL_PATH = Path(__file__).parent / "models/mace_mp_small.model"
 
 
@@ -154,3 +165,99 @@ def test_none_to_dict(dicts_in):
     assert dicts[2] == dicts_in[2]
     assert dicts[3] == dicts_in[3]
     assert dicts[4] == {}
+
+
+def test_attach_calculator_shared():
+    """Test a single calculator is shared between images of a sequence."""
+    images = read(TRAJ_PATH, index=":")
+    attach_calculator(images, arch="mace", model_path=MODEL_PATH)
+
+    assert all(isinstance(image.calc, SharedCalculator) for image in images)
+    assert len({id(image.calc.calc) for image in images}) == 1
+    assert images[0].calc.parameters["arch"] == "mace"
+
+    energies = [image.get_potential_energy() for image in images]
+
+    # Results are stored per image
+    for image, energy in zip(images, energies):
+        assert image.calc.results["energy"] == pytest.approx(energy)
+
+        struct = image.copy()
+        struct.calc = choose_calculator(arch="mace", model_path=MODEL_PATH)
+        assert struct.get_potential_energy() == pytest.approx(energy)
+
+
+def test_shared_calculator_results():
+    """Test shared calculator results are not overwritten by later images."""
+    images = [bulk("Cu", cubic=True) for _ in range(3)]
+    calc = EMT()
+    for i, image in enumerate(images):
+        image.rattle(0.05, seed=i)
+        image.calc = SharedCalculator(calc)
+
+    forces = [image.get_forces() for image in images]
+    for image, image_forces in zip(images, forces):
+        struct = image.copy()
+        struct.calc = EMT()
+        assert image.get_forces() == pytest.approx(image_forces)
+        assert struct.get_forces() == pytest.approx(image_forces)
+
+
+def test_buffered_table_writer(tmp_path):
+    """Test rows are only written to file when the buffer is full or flushed."""
+    path = tmp_path / "table.dat"
+    with BufferedTableWriter(
+        path, units={"a": "eV", "b": ""}, formats={"a": ".2f"}, buffer_rows=3
+    ) as writer:
+        writer.write_header()
+        assert path.read_text() == "# a [eV] | b\n"
+
+        writer.write_row(a=1.0, b=2)
+        writer.write_row(a=3.0, b=4)
+        assert len(path.read_text().splitlines()) == 1
+
+        writer.write_row(a=5.0, b=6)
+        assert len(path.read_text().splitlines()) == 4
+
+        writer.write_row(a=7.0, b=8)
+        writer.flush()
+        assert len(path.read_text().splitlines()) == 5
+
+        writer.write_row(a=9.0, b=10)
+
+    assert path.read_text().splitlines()[1:] == [
+        "1.00 2",
+        "3.00 4",
+        "5.00 6",
+        "7.00 8",
+        "9.00 10",
+    ]
+
+
+def test_write_table_formats():
+    """Test columns are formatted using templates, matching per-value formatting."""
+    a = np.linspace(0, 1, 5)
+    b = np.arange(5)
+    data = write_table("ascii", a=a, b=b, a_units="eV", a_format=".3e")
+    assert data.read().splitlines() == [
+        "# a [eV] | b",
+        *(f"{x:.3e} {y}" for x, y in zip(a, b)),
+    ]
+
+    data = write_table("csv", formats={"b": "4d"}, print_header=False, a=a, b=b)
+    assert data.read().splitlines() == [f"{x},{y:4d}" for x, y in zip(a, b)]
+
+
+def test_write_table_npz(tmp_path):
+    """Test writing table columns as NumPy arrays."""
+    path = tmp_path / "table.npz"
+    write_table("npz", path, units={"a": "eV"}, a=(1.0, 2.0), b=(3, 4))
+    with np.load(path) as data:
+        assert sorted(data) == ["a", "a_units", "b"]
+        assert data["a"] == pytest.approx([1.0, 2.0])
+        assert data["b"].dtype.kind == "i"
+        assert str(data["a_units"]) == "eV"
+
+    buffer = write_table("npz", a=(1.0,), a_units="eV", print_header=False)
+    with np.load(buffer) as data:
+        assert list(data) == ["a"]